@@ -39,3 +39,11 @@ def set_export_arguments(parser: argparse.ArgumentParser) -> None:
             "all available conversation IDs will be exported."
         ),
     )
+
+    parser.add_argument(
+        "--checkpoint-file",
+        help=(
+            "File which stores the timestamp of the last exported batch of events. "
+            "If the file exists, the export continues from this timestamp."
+        ),
+    )
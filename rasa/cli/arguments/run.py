@@ -74,6 +74,14 @@ def add_server_arguments(parser: argparse.ArgumentParser):
         type=int,
         help="Maximum time a response can take to process (sec).",
     )
+    server_arguments.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes which handle requests. More than one worker "
+        "requires a Redis lock store. Defaults to the value of the `SANIC_WORKERS` "
+        "environment variable or 1.",
+    )
     server_arguments.add_argument(
         "--remote-storage",
         help="Set the remote location where your Rasa model is stored, e.g. on AWS.",
@@ -186,6 +186,7 @@ def export_trackers(args: argparse.Namespace) -> None:
         requested_conversation_ids,
         args.minimum_timestamp,
         args.maximum_timestamp,
+        args.checkpoint_file,
     )
 
     try:
@@ -232,4 +233,7 @@ def _get_continuation_command(exporter: "Exporter", timestamp: float) -> Text:
             f" --conversation-ids {','.join(exporter.requested_conversation_ids)}"
         )
 
+    if exporter.checkpoint_path is not None:
+        command += f" --checkpoint-file {exporter.checkpoint_path}"
+
     return command
@@ -13,6 +13,9 @@ DEFAULT_NLU_RESULTS_PATH = "nlu_comparison_results"
 DEFAULT_CORE_SUBDIRECTORY_NAME = "core"
 DEFAULT_NLU_SUBDIRECTORY_NAME = "nlu"
 DEFAULT_REQUEST_TIMEOUT = 60 * 5  # 5 minutes
+DEFAULT_ENDPOINT_POOL_SIZE = 100
+DEFAULT_ENDPOINT_POOL_SIZE_PER_HOST = 0  # no limit besides the pool size
+DEFAULT_ENDPOINT_KEEPALIVE_TIMEOUT = 15  # seconds
 DEFAULT_RESPONSE_TIMEOUT = 60 * 60  # 1 hour
 
 TEST_DATA_FILE = "test.md"
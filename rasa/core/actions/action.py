@@ -1,16 +1,24 @@
 import copy
+import itertools
 import json
 import logging
 import typing
-from typing import List, Text, Optional, Dict, Any
+from collections import OrderedDict
+from typing import List, Text, Optional, Dict, Any, Set, Tuple
 
 import aiohttp
 
 import rasa.core
-from rasa.constants import DOCS_BASE_URL, DEFAULT_NLU_FALLBACK_INTENT_NAME
+from rasa.constants import (
+    DOCS_BASE_URL,
+    DOCS_URL_ACTIONS,
+    DEFAULT_NLU_FALLBACK_INTENT_NAME,
+)
 from rasa.core import events
 from rasa.core.constants import (
     DEFAULT_REQUEST_TIMEOUT,
+    MAX_ACTION_SERVER_CONVERSATIONS,
+    MAX_ACTION_SERVERS,
     REQUESTED_SLOT,
     USER_INTENT_OUT_OF_SCOPE,
     UTTER_PREFIX,
@@ -35,6 +43,7 @@ from rasa.core.events import (
     Restarted,
     SessionStarted,
 )
+from rasa.utils.common import raise_warning
 from rasa.utils.endpoints import EndpointConfig, ClientResponseError
 
 if typing.TYPE_CHECKING:
@@ -442,7 +451,149 @@ class ActionDeactivateForm(Action):
         return [Form(None), SlotSet(REQUESTED_SLOT, None)]
 
 
+EVENTS_SINCE_LAST_CALL = "since_last_call"
+ACTION_SERVER_EVENT_VERBOSITIES = ["all", "after_restart", "applied"] + [
+    EVENTS_SINCE_LAST_CALL
+]
+# status code of action servers which miss the cached domain or previous events
+ACTION_SERVER_STATE_MISSING = 412
+
+
+# identifies an event by its type and its timestamp
+EventMarker = Tuple[Text, float]
+
+
+def _event_marker(event: Event) -> EventMarker:
+    return event.type_name, event.timestamp
+
+
+class ActionServerState:
+    """Remembers which data an action server already received from Rasa.
+
+    Action servers which cache the domain and the events of conversations can opt
+    in to smaller requests in the `action_endpoint` configuration:
+
+    - `event_verbosity`: Which events of the conversation are sent. One of `all`
+      (default), `after_restart`, `applied` or `since_last_call`. With
+      `since_last_call` only the events which were added to the conversation since
+      the last call for it are sent. `events_offset` is the number of events
+      which were sent before. If the previously sent events changed in the
+      meantime (e.g. because the conversation was deleted), all events are sent.
+    - `cache_domain`: If `true`, the domain is only sent once. Calls always
+      contain the domain's hash as `domain_hash`.
+
+    If the action server misses the domain or the previous events of a
+    conversation (e.g. after it was restarted), it has to respond with status code
+    412. The call is then repeated with the domain and all events.
+    """
+
+    def __init__(
+        self,
+        event_verbosity: Text = "all",
+        cache_domain: bool = False,
+        max_conversations: int = MAX_ACTION_SERVER_CONVERSATIONS,
+    ) -> None:
+        if event_verbosity not in ACTION_SERVER_EVENT_VERBOSITIES:
+            raise_warning(
+                f"Unknown event verbosity '{event_verbosity}' for the action "
+                f"endpoint. Please use one of {ACTION_SERVER_EVENT_VERBOSITIES}. "
+                f"Sending all events to the action server instead.",
+                docs=DOCS_URL_ACTIONS,
+            )
+            event_verbosity = "all"
+
+        self.event_verbosity = event_verbosity
+        self.cache_domain = cache_domain
+        self.max_conversations = max_conversations
+        self.domain_hashes: Set[Text] = set()
+        # number of sent events and marker of the last sent event per conversation
+        self._sent_events: "OrderedDict[Text, Tuple[int, EventMarker]]" = (
+            OrderedDict()
+        )
+
+    @classmethod
+    def for_endpoint(cls, action_endpoint: EndpointConfig) -> "ActionServerState":
+        """Returns the state of the action server which `action_endpoint` calls."""
+
+        event_verbosity = action_endpoint.kwargs.get("event_verbosity", "all")
+        cache_domain = bool(action_endpoint.kwargs.get("cache_domain", False))
+        key = (action_endpoint.url, event_verbosity, cache_domain)
+
+        action_server = _action_server_states.pop(key, None)
+        if action_server is None:
+            action_server = cls(event_verbosity, cache_domain)
+
+        _action_server_states[key] = action_server
+        if len(_action_server_states) > MAX_ACTION_SERVERS:
+            _action_server_states.popitem(last=False)
+
+        return action_server
+
+    @property
+    def sends_all_data(self) -> bool:
+        """Whether the action server receives the domain and all events every time."""
+
+        return self.event_verbosity == "all" and not self.cache_domain
+
+    def number_of_sent_events(self, tracker: "DialogueStateTracker") -> int:
+        """Returns how many events of the conversation the action server has.
+
+        The last sent event has to be unchanged, otherwise the conversation was e.g.
+        deleted or replaced in the meantime and no events count as sent.
+        """
+
+        number_of_events, last_sent_event = self._sent_events.get(
+            tracker.sender_id, (0, None)
+        )
+        if not 0 < number_of_events <= len(tracker.events):
+            return 0
+
+        if _event_marker(tracker.events[number_of_events - 1]) != last_sent_event:
+            return 0
+
+        return number_of_events
+
+    def remember_call(
+        self,
+        json_body: Dict[Text, Any],
+        number_of_events: int,
+        last_event: Optional[Event],
+    ) -> None:
+        """Stores what the action server received with a successful call.
+
+        Args:
+            json_body: The body of the call.
+            number_of_events: Number of events of the conversation at the time of
+                the call.
+            last_event: Last event of the conversation at the time of the call.
+        """
+
+        if "domain_hash" in json_body:
+            self.domain_hashes.add(json_body["domain_hash"])
+
+        if self.event_verbosity == EVENTS_SINCE_LAST_CALL and last_event:
+            sender_id = json_body["sender_id"]
+            self._sent_events[sender_id] = (number_of_events, _event_marker(last_event))
+            self._sent_events.move_to_end(sender_id)
+            if len(self._sent_events) > self.max_conversations:
+                self._sent_events.popitem(last=False)
+
+    def forget(self, sender_id: Text, domain_hash: Text) -> None:
+        """Forgets what the action server received, e.g. after it was restarted."""
+
+        self.domain_hashes.discard(domain_hash)
+        self._sent_events.pop(sender_id, None)
+
+
+_action_server_states: "OrderedDict[Tuple[Text, Text, bool], ActionServerState]" = (
+    OrderedDict()
+)
+
+
 class RemoteAction(Action):
+    # validator of the action server responses which is only created once
+    _response_validator: Optional[Any] = None
+
     def __init__(self, name: Text, action_endpoint: Optional[EndpointConfig]) -> None:
 
         self._name = name
@@ -464,6 +615,43 @@ class RemoteAction(Action):
             "version": rasa.__version__,
         }
 
+    def _reduced_action_call_format(
+        self,
+        tracker: "DialogueStateTracker",
+        domain: "Domain",
+        action_server: ActionServerState,
+    ) -> Dict[Text, Any]:
+        """Create the request json without the data the action server already has."""
+        from rasa.core.trackers import EventVerbosity
+
+        json_body = {
+            "next_action": self._name,
+            "sender_id": tracker.sender_id,
+            "version": rasa.__version__,
+            "event_verbosity": action_server.event_verbosity,
+        }
+
+        if action_server.event_verbosity == EVENTS_SINCE_LAST_CALL:
+            events_offset = action_server.number_of_sent_events(tracker)
+            tracker_state = tracker.current_state(EventVerbosity.NONE)
+            new_events = itertools.islice(tracker.events, events_offset, None)
+            tracker_state["events"] = [e.as_dict() for e in new_events]
+            json_body["events_offset"] = events_offset
+        else:
+            tracker_state = tracker.current_state(
+                EventVerbosity[action_server.event_verbosity.upper()]
+            )
+        json_body["tracker"] = tracker_state
+
+        if action_server.cache_domain:
+            json_body["domain_hash"] = domain.fingerprint
+            if domain.fingerprint not in action_server.domain_hashes:
+                json_body["domain"] = domain.as_dict()
+        else:
+            json_body["domain"] = domain.as_dict()
+
+        return json_body
+
     @staticmethod
     def action_response_format_spec() -> Dict[Text, Any]:
         """Expected response schema for an Action endpoint.
@@ -484,12 +672,24 @@ class RemoteAction(Action):
             },
         }
 
+    @classmethod
+    def _action_response_validator(cls) -> Any:
+        # subclasses might use a different response format
+        if cls.__dict__.get("_response_validator") is None:
+            from jsonschema.validators import validator_for
+
+            schema = cls.action_response_format_spec()
+            validator_class = validator_for(schema)
+            validator_class.check_schema(schema)
+            cls._response_validator = validator_class(schema)
+
+        return cls._response_validator
+
     def _validate_action_result(self, result: Dict[Text, Any]) -> bool:
-        from jsonschema import validate
         from jsonschema import ValidationError
 
         try:
-            validate(result, self.action_response_format_spec())
+            self._action_response_validator().validate(result)
             return True
         except ValidationError as e:
             e.message += (
@@ -541,7 +741,6 @@ class RemoteAction(Action):
         tracker: "DialogueStateTracker",
         domain: "Domain",
     ) -> List[Event]:
-        json_body = self._action_call_format(tracker, domain)
         if not self.action_endpoint:
             logger.error(
                 "The model predicted the custom action '{}', "
@@ -558,9 +757,7 @@ class RemoteAction(Action):
             logger.debug(
                 "Calling action endpoint to run action '{}'.".format(self.name())
             )
-            response = await self.action_endpoint.request(
-                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
-            )
+            response = await self._call_action_server(tracker, domain)
 
             self._validate_action_result(response)
 
@@ -607,6 +804,41 @@ class RemoteAction(Action):
             )
             raise Exception("Failed to execute custom action.")
 
+    async def _call_action_server(
+        self, tracker: "DialogueStateTracker", domain: "Domain"
+    ) -> Dict[Text, Any]:
+        action_server = ActionServerState.for_endpoint(self.action_endpoint)
+        if action_server.sends_all_data:
+            json_body = self._action_call_format(tracker, domain)
+            return await self.action_endpoint.request(
+                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+            )
+
+        number_of_events = len(tracker.events)
+        last_event = tracker.events[-1] if tracker.events else None
+        json_body = self._reduced_action_call_format(tracker, domain, action_server)
+        try:
+            response = await self.action_endpoint.request(
+                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+            )
+        except ClientResponseError as e:
+            if e.status != ACTION_SERVER_STATE_MISSING:
+                raise
+
+            logger.debug(
+                f"The action server doesn't have the domain or the previous events "
+                f"of the conversation '{tracker.sender_id}'. Sending them again."
+            )
+            action_server.forget(tracker.sender_id, domain.fingerprint)
+            json_body = self._reduced_action_call_format(tracker, domain, action_server)
+            response = await self.action_endpoint.request(
+                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+            )
+
+        action_server.remember_call(json_body, number_of_events, last_event)
+
+        return response
+
     def name(self) -> Text:
         return self._name
 
@@ -1,7 +1,9 @@
 import logging
+import multiprocessing
 import os
 import shutil
 import tempfile
+import time
 import uuid
 from asyncio import CancelledError
 from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
@@ -20,10 +22,18 @@ from rasa.constants import (
 )
 from rasa.core import constants, jobs, training
 from rasa.core.channels.channel import InputChannel, OutputChannel, UserMessage
-from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.core.constants import (
+    DEFAULT_REQUEST_TIMEOUT,
+    SHARED_MODEL_CHECK_INTERVAL,
+    SHARED_MODEL_PULLING_LEASE,
+)
 from rasa.core.domain import Domain
 from rasa.core.exceptions import AgentNotReady
-from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
+from rasa.core.interpreter import (
+    BatchingInterpreter,
+    NaturalLanguageInterpreter,
+    RegexInterpreter,
+)
 from rasa.core.lock_store import LockStore, InMemoryLockStore
 from rasa.core.nlg import NaturalLanguageGenerator
 from rasa.core.policies.ensemble import PolicyEnsemble, SimplePolicyEnsemble
@@ -51,7 +61,156 @@ from rasa.utils.endpoints import EndpointConfig
 logger = logging.getLogger(__name__)
 
 
-async def load_from_server(agent: "Agent", model_server: EndpointConfig) -> "Agent":
+class SharedModelDirectory:
+    """Shares the model of a Rasa server between its Sanic workers.
+
+    The main process unpacks (or pulls) the model once and all workers load it from
+    this directory. If models are pulled from a model server, only a single worker
+    polls the model server. It publishes every new model in this directory and the
+    other workers load the published model from here.
+
+    The pulling worker holds a lease which it renews whenever it checks for new
+    models. If it stops doing so (e.g. because it crashed), another worker takes
+    over once the lease expired.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Text] = None,
+        pulling_lease: float = SHARED_MODEL_PULLING_LEASE,
+    ) -> None:
+        self.path = path or tempfile.mkdtemp()
+        self.pulling_lease = pulling_lease
+        # state which is shared between the forked workers
+        self._lease_lock = multiprocessing.Lock()
+        self._number_of_workers = multiprocessing.Value("i", 0, lock=False)
+        self._lease_holder = multiprocessing.Value("i", 0, lock=False)
+        self._lease_expires_at = multiprocessing.Value("d", 0.0, lock=False)
+        # state of the individual worker
+        self._worker_id: Optional[int] = None
+        self._next_pull = 0.0
+
+    @property
+    def _latest_model_file(self) -> Text:
+        return os.path.join(self.path, "latest_model.json")
+
+    def is_pulling_worker(self) -> bool:
+        """Returns whether this process pulls models from the model server.
+
+        Takes over the pulling if no other worker holds the lease and renews the
+        lease if this worker holds it.
+        """
+
+        with self._lease_lock:
+            if self._worker_id is None:
+                self._number_of_workers.value += 1
+                self._worker_id = self._number_of_workers.value
+
+            now = time.time()
+            is_held_by_other_worker = (
+                self._lease_holder.value != self._worker_id
+                and now < self._lease_expires_at.value
+            )
+            if is_held_by_other_worker:
+                return False
+
+            self._lease_holder.value = self._worker_id
+            self._lease_expires_at.value = now + self.pulling_lease
+            return True
+
+    def should_pull(self, wait_time_between_pulls: Optional[float]) -> bool:
+        """Returns whether this process should query the model server now.
+
+        Only the pulling worker queries the model server and it does so at most
+        once every `wait_time_between_pulls` seconds.
+        """
+
+        if not self.is_pulling_worker():
+            return False
+
+        now = time.time()
+        if now < self._next_pull:
+            return False
+
+        self._next_pull = now + float(wait_time_between_pulls or 0)
+        return True
+
+    def latest(self) -> Optional[Tuple[Text, Optional[Text]]]:
+        """Returns the directory and the fingerprint of the latest published model."""
+
+        if not os.path.exists(self._latest_model_file):
+            return None
+
+        latest_model = rasa.utils.io.read_json_file(self._latest_model_file)
+
+        return latest_model["model_directory"], latest_model["fingerprint"]
+
+    def publish(self, model_directory: Text, fingerprint: Optional[Text]) -> None:
+        """Makes the model in `model_directory` the model which workers load."""
+
+        previous_model = self.latest()
+
+        # replacing the file makes sure that workers never read a partial file
+        temporary_file = f"{self._latest_model_file}.{os.getpid()}"
+        rasa.utils.io.dump_obj_as_json_to_file(
+            temporary_file,
+            {"model_directory": model_directory, "fingerprint": fingerprint},
+        )
+        os.replace(temporary_file, self._latest_model_file)
+
+        # other workers might still be loading the previous model
+        models_in_use = {model_directory}
+        if previous_model:
+            models_in_use.add(previous_model[0])
+
+        for file_name in os.listdir(self.path):
+            path = os.path.join(self.path, file_name)
+            if os.path.isdir(path) and path not in models_in_use:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def unpack(self, model_path: Text) -> None:
+        """Unpacks the local model at `model_path` for all workers.
+
+        Args:
+            model_path: Path to a model archive or to a directory of model archives.
+                The latest model of the directory is used.
+        """
+
+        if os.path.isfile(model_path):
+            model_archive = model_path
+        else:
+            model_archive = get_latest_model(model_path)
+
+        if model_archive is None:
+            return
+
+        model_directory = unpack_model(model_archive, tempfile.mkdtemp(dir=self.path))
+        self.publish(model_directory, None)
+
+    async def pull(self, model_server: EndpointConfig) -> None:
+        """Pulls the model from `model_server` for all workers."""
+
+        if not is_url(model_server.url):
+            raise aiohttp.InvalidURL(model_server.url)
+
+        latest_model = self.latest()
+        model_directory_and_fingerprint = await _pull_model_and_fingerprint(
+            model_server, latest_model[1] if latest_model else None, self.path
+        )
+        if model_directory_and_fingerprint:
+            self.publish(*model_directory_and_fingerprint)
+
+    def remove(self) -> None:
+        """Deletes the shared models."""
+
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+async def load_from_server(
+    agent: "Agent",
+    model_server: EndpointConfig,
+    shared_models: Optional[SharedModelDirectory] = None,
+) -> "Agent":
     """Load a persisted model from a server."""
 
     # We are going to pull the model once first, and then schedule a recurring
@@ -60,13 +219,22 @@ async def load_from_server(agent: "Agent", model_server: EndpointConfig) -> "Age
     # "is alive" check on a startup server's `/status` endpoint. If the server
     # is started, we can be sure that it also already loaded (or tried to)
     # a model.
-    await _update_model_from_server(model_server, agent)
+    await _update_model_from_server(model_server, agent, shared_models)
 
     wait_time_between_pulls = model_server.kwargs.get("wait_time_between_pulls", 100)
 
     if wait_time_between_pulls:
+        if shared_models:
+            # workers check frequently for published models and whether they have to
+            # take over the pulling, the pulling worker limits its pulls itself
+            wait_time_between_pulls = min(
+                int(wait_time_between_pulls), SHARED_MODEL_CHECK_INTERVAL
+            )
+
         # continuously pull the model every `wait_time_between_pulls` seconds
-        await schedule_model_pulling(model_server, int(wait_time_between_pulls), agent)
+        await schedule_model_pulling(
+            model_server, int(wait_time_between_pulls), agent, shared_models
+        )
 
     return agent
 
@@ -116,13 +284,16 @@ def _load_domain_and_policy_ensemble(
 
 def _load_and_set_updated_model(
     agent: "Agent", model_directory: Text, fingerprint: Text
-) -> None:
+) -> bool:
     """Load the persisted model into memory and set the model on the agent.
 
     Args:
         agent: Instance of `Agent` to update with the new model.
         model_directory: Rasa model directory.
         fingerprint: Fingerprint of the supplied model at `model_directory`.
+
+    Returns:
+        `True` if the model was loaded.
     """
     logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
 
@@ -137,105 +308,138 @@ def _load_and_set_updated_model(
         )
 
         logger.debug("Finished updating agent to new model.")
+        return True
     except Exception as e:
         logger.exception(
             f"Failed to update model. The previous model will stay loaded instead. "
             f"Error: {e}"
         )
+        return False
+
+
+def _load_shared_model(agent: "Agent", shared_models: SharedModelDirectory) -> None:
+    """Load the latest model which was published for all workers."""
+
+    latest_model = shared_models.latest()
+    if latest_model and latest_model[1] != agent.fingerprint:
+        _load_and_set_updated_model(agent, *latest_model)
 
 
 async def _update_model_from_server(
-    model_server: EndpointConfig, agent: "Agent"
+    model_server: EndpointConfig,
+    agent: "Agent",
+    shared_models: Optional[SharedModelDirectory] = None,
 ) -> None:
-    """Load a zipped Rasa Core model from a URL and update the passed agent."""
+    """Load a zipped Rasa Core model from a URL and update the passed agent.
+
+    If the model is shared between Sanic workers, only the pulling worker queries
+    the model server. The other workers load the models which it published.
+    """
 
     if not is_url(model_server.url):
         raise aiohttp.InvalidURL(model_server.url)
 
+    if shared_models is not None:
+        _load_shared_model(agent, shared_models)
+        wait_time_between_pulls = model_server.kwargs.get(
+            "wait_time_between_pulls", 100
+        )
+        if not shared_models.should_pull(wait_time_between_pulls):
+            return
+
     model_directory_and_fingerprint = await _pull_model_and_fingerprint(
-        model_server, agent.fingerprint
+        model_server, agent.fingerprint, shared_models.path if shared_models else None
     )
     if model_directory_and_fingerprint:
         model_directory, new_model_fingerprint = model_directory_and_fingerprint
-        _load_and_set_updated_model(agent, model_directory, new_model_fingerprint)
+        loaded = _load_and_set_updated_model(
+            agent, model_directory, new_model_fingerprint
+        )
+        if loaded and shared_models is not None:
+            shared_models.publish(model_directory, new_model_fingerprint)
     else:
         logger.debug(f"No new model found at URL {model_server.url}")
 
 
 async def _pull_model_and_fingerprint(
-    model_server: EndpointConfig, fingerprint: Optional[Text]
+    model_server: EndpointConfig,
+    fingerprint: Optional[Text],
+    models_directory: Optional[Text] = None,
 ) -> Optional[Tuple[Text, Text]]:
     """Queries the model server.
 
     Returns the temporary model directory and value of the response's <ETag> header
-    which contains the model hash. Returns `None` if no new model is found.
+    which contains the model hash. Returns `None` if no new model is found. The
+    model directory is created within `models_directory` if it is given.
     """
 
     headers = {"If-None-Match": fingerprint}
 
     logger.debug(f"Requesting model from server {model_server.url}...")
 
-    async with model_server.session() as session:
-        try:
-            params = model_server.combine_parameters()
-            async with session.request(
-                "GET",
-                model_server.url,
-                timeout=DEFAULT_REQUEST_TIMEOUT,
-                headers=headers,
-                params=params,
-            ) as resp:
-
-                if resp.status in [204, 304]:
-                    logger.debug(
-                        "Model server returned {} status code, "
-                        "indicating that no new model is available. "
-                        "Current fingerprint: {}"
-                        "".format(resp.status, fingerprint)
-                    )
-                    return None
-                elif resp.status == 404:
-                    logger.debug(
-                        "Model server could not find a model at the requested "
-                        "endpoint '{}'. It's possible that no model has been "
-                        "trained, or that the requested tag hasn't been "
-                        "assigned.".format(model_server.url)
-                    )
-                    return None
-                elif resp.status != 200:
-                    logger.debug(
-                        "Tried to fetch model from server, but server response "
-                        "status code is {}. We'll retry later..."
-                        "".format(resp.status)
-                    )
-                    return None
-
-                model_directory = tempfile.mkdtemp()
-                rasa.utils.io.unarchive(await resp.read(), model_directory)
+    session = model_server.pooled_session()
+    try:
+        params = model_server.combine_parameters()
+        async with session.request(
+            "GET",
+            model_server.url,
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+            headers=headers,
+            params=params,
+        ) as resp:
+
+            if resp.status in [204, 304]:
                 logger.debug(
-                    "Unzipped model to '{}'".format(os.path.abspath(model_directory))
+                    "Model server returned {} status code, "
+                    "indicating that no new model is available. "
+                    "Current fingerprint: {}"
+                    "".format(resp.status, fingerprint)
                 )
+                return None
+            elif resp.status == 404:
+                logger.debug(
+                    "Model server could not find a model at the requested "
+                    "endpoint '{}'. It's possible that no model has been "
+                    "trained, or that the requested tag hasn't been "
+                    "assigned.".format(model_server.url)
+                )
+                return None
+            elif resp.status != 200:
+                logger.debug(
+                    "Tried to fetch model from server, but server response "
+                    "status code is {}. We'll retry later..."
+                    "".format(resp.status)
+                )
+                return None
 
-                # get the new fingerprint
-                new_fingerprint = resp.headers.get("ETag")
-                # return new tmp model directory and new fingerprint
-                return model_directory, new_fingerprint
-
-        except aiohttp.ClientError as e:
+            model_directory = tempfile.mkdtemp(dir=models_directory)
+            rasa.utils.io.unarchive(await resp.read(), model_directory)
             logger.debug(
-                "Tried to fetch model from server, but "
-                "couldn't reach server. We'll retry later... "
-                "Error: {}.".format(e)
+                "Unzipped model to '{}'".format(os.path.abspath(model_directory))
             )
-            return None
+
+            # get the new fingerprint
+            new_fingerprint = resp.headers.get("ETag")
+            # return new tmp model directory and new fingerprint
+            return model_directory, new_fingerprint
+
+    except aiohttp.ClientError as e:
+        logger.debug(
+            "Tried to fetch model from server, but "
+            "couldn't reach server. We'll retry later... "
+            "Error: {}.".format(e)
+        )
+        return None
 
 
 async def _run_model_pulling_worker(
-    model_server: EndpointConfig, agent: "Agent"
+    model_server: EndpointConfig,
+    agent: "Agent",
+    shared_models: Optional[SharedModelDirectory] = None,
 ) -> None:
     # noinspection PyBroadException
     try:
-        await _update_model_from_server(model_server, agent)
+        await _update_model_from_server(model_server, agent, shared_models)
     except CancelledError:
         logger.warning("Stopping model pulling (cancelled).")
     except Exception:
@@ -245,13 +449,16 @@ async def _run_model_pulling_worker(
 
 
 async def schedule_model_pulling(
-    model_server: EndpointConfig, wait_time_between_pulls: int, agent: "Agent"
+    model_server: EndpointConfig,
+    wait_time_between_pulls: int,
+    agent: "Agent",
+    shared_models: Optional[SharedModelDirectory] = None,
 ):
     (await jobs.scheduler()).add_job(
         _run_model_pulling_worker,
         "interval",
         seconds=wait_time_between_pulls,
-        args=[model_server, agent],
+        args=[model_server, agent, shared_models],
         id="pull-model-from-server",
         replace_existing=True,
     )
@@ -266,7 +473,10 @@ async def load_agent(
     tracker_store: Optional[TrackerStore] = None,
     lock_store: Optional[LockStore] = None,
     action_endpoint: Optional[EndpointConfig] = None,
+    shared_models: Optional[SharedModelDirectory] = None,
 ):
+    shared_model = shared_models.latest() if shared_models else None
+
     try:
         if model_server is not None:
             return await load_from_server(
@@ -280,6 +490,7 @@ async def load_agent(
                     remote_storage=remote_storage,
                 ),
                 model_server,
+                shared_models,
             )
 
         elif remote_storage is not None:
@@ -294,6 +505,17 @@ async def load_agent(
                 model_server=model_server,
             )
 
+        elif shared_model is not None:
+            # the model was already unpacked for all workers
+            return Agent.load(
+                shared_model[0],
+                interpreter=interpreter,
+                generator=generator,
+                tracker_store=tracker_store,
+                lock_store=lock_store,
+                action_endpoint=action_endpoint,
+            )
+
         elif model_path is not None and os.path.exists(model_path):
             return Agent.load_local_model(
                 model_path,
@@ -336,6 +558,7 @@ class Agent:
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
         path_to_model_archive: Optional[Text] = None,
+        nlu_batching: Optional[EndpointConfig] = None,
     ):
         # Initializing variables with the passed parameters.
         self.domain = self._create_domain(domain)
@@ -350,7 +573,8 @@ class Agent:
             self.policy_ensemble, self.domain
         )
 
-        self.interpreter = NaturalLanguageInterpreter.create(interpreter)
+        self.nlu_batching = nlu_batching
+        self.interpreter = self._create_interpreter(interpreter)
 
         self.nlg = NaturalLanguageGenerator.create(generator, self.domain)
         self.tracker_store = self.create_tracker_store(tracker_store, self.domain)
@@ -375,7 +599,7 @@ class Agent:
         self.policy_ensemble = policy_ensemble
 
         if interpreter:
-            self.interpreter = NaturalLanguageInterpreter.create(interpreter)
+            self.interpreter = self._create_interpreter(interpreter)
 
         self._set_fingerprint(fingerprint)
 
@@ -386,6 +610,23 @@ class Agent:
 
         self.model_directory = model_directory
 
+    def configure_nlu_batching(self, nlu_batching: Optional[EndpointConfig]) -> None:
+        """Enables (or disables) coalescing of parsed messages into batches.
+
+        Args:
+            nlu_batching: The `nlu_batching` configuration from the endpoints file.
+        """
+
+        self.nlu_batching = nlu_batching
+        self.interpreter = self._create_interpreter(self.interpreter)
+
+    def _create_interpreter(
+        self, interpreter: Union[NaturalLanguageInterpreter, EndpointConfig, Text, None]
+    ) -> NaturalLanguageInterpreter:
+        return BatchingInterpreter.create(
+            NaturalLanguageInterpreter.create(interpreter), self.nlu_batching
+        )
+
     @classmethod
     def load(
         cls,
@@ -489,6 +730,27 @@ class Agent:
         message = UserMessage(message_data)
         return await processor._parse_message(message, tracker)
 
+    async def parse_messages_using_nlu_interpreter(
+        self, messages_data: List[Text], tracker: DialogueStateTracker = None
+    ) -> List[Dict[Text, Any]]:
+        """Handles a batch of message texts and intent payload input messages.
+
+        All messages are passed through the NLU pipeline at once.
+
+        Args:
+            messages_data (List[Text]): Contain the received messages in text or\
+            intent payload format.
+            tracker (DialogueStateTracker): Contains the tracker to be\
+            used by the interpreter.
+
+        Returns:
+            The parsed messages in the order they were passed.
+        """
+
+        processor = self.create_processor()
+        messages = [UserMessage(message_data) for message_data in messages_data]
+        return await processor._parse_messages(messages, tracker)
+
     async def handle_message(
         self,
         message: UserMessage,
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, Text, Optional, Union
+from typing import Any, Dict, List, Text, Optional, Union
 
 from rasa.utils import common
 from rasa.utils.endpoints import EndpointConfig
@@ -30,6 +30,15 @@ class EventBroker:
         """Publishes a json-formatted Rasa Core event into an event queue."""
         raise NotImplementedError("Event broker must implement the `publish` method.")
 
+    def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes multiple json-formatted Rasa Core events into an event queue.
+
+        Publishes the events one by one by default. Event brokers which can publish
+        multiple events at once should override this.
+        """
+        for event in events:
+            self.publish(event)
+
     def is_ready(self) -> bool:
         """Determine whether or not the event broker is ready.
 
@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional, Text
 
 from rasa.constants import DOCS_URL_EVENT_BROKERS
 from rasa.core.brokers.broker import EventBroker
@@ -9,6 +9,15 @@ from rasa.utils.io import DEFAULT_ENCODING
 
 logger = logging.getLogger(__name__)
 
+# time (in ms) the producer waits for further events to send them in one batch
+DEFAULT_LINGER_MS = 5
+# maximum size (in bytes) of a batch of events sent to the same partition
+DEFAULT_BATCH_SIZE = 16384
+# maximum size (in bytes) of events which are buffered before they are sent
+DEFAULT_BUFFER_MEMORY = 33554432
+# time (in ms) `publish` blocks if the buffer is full before it raises an error
+DEFAULT_MAX_BLOCK_MS = 60000
+
 
 class KafkaEventBroker(EventBroker):
     def __init__(
@@ -23,7 +32,39 @@ class KafkaEventBroker(EventBroker):
         topic="rasa_core_events",
         security_protocol="SASL_PLAINTEXT",
         loglevel=logging.ERROR,
+        linger_ms: int = DEFAULT_LINGER_MS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        compression_type: Optional[Text] = None,
+        buffer_memory: int = DEFAULT_BUFFER_MEMORY,
+        max_block_ms: int = DEFAULT_MAX_BLOCK_MS,
     ) -> None:
+        """Kafka event broker.
+
+        The Kafka producer is created once and kept open. Events are sent
+        asynchronously and are batched by the producer according to `linger_ms` and
+        `batch_size`.
+
+        Args:
+            host: Kafka broker address or a list of broker addresses.
+            sasl_username: Username for `SASL_PLAINTEXT` authentication.
+            sasl_password: Password for `SASL_PLAINTEXT` authentication.
+            ssl_cafile: CA file for `SSL` authentication.
+            ssl_certfile: Client certificate for `SSL` authentication.
+            ssl_keyfile: Client private key for `SSL` authentication.
+            ssl_check_hostname: Whether to verify the broker's hostname.
+            topic: Kafka topic the events are published to.
+            security_protocol: Either `SASL_PLAINTEXT` or `SSL`.
+            loglevel: Log level of the `kafka` logger.
+            linger_ms: Time (in ms) to wait for further events before a batch is
+                sent.
+            batch_size: Maximum size (in bytes) of a batch of events.
+            compression_type: Compression of the batches (e.g. `gzip`, `snappy`,
+                `lz4`). Batches are not compressed by default.
+            buffer_memory: Maximum size (in bytes) of events which are buffered
+                before they are sent.
+            max_block_ms: Time (in ms) `publish` blocks if the buffer is full
+                before it raises an error.
+        """
 
         self.producer = None
         self.host = host
@@ -35,6 +76,11 @@ class KafkaEventBroker(EventBroker):
         self.ssl_certfile = ssl_certfile
         self.ssl_keyfile = ssl_keyfile
         self.ssl_check_hostname = ssl_check_hostname
+        self.linger_ms = linger_ms
+        self.batch_size = batch_size
+        self.compression_type = compression_type
+        self.buffer_memory = buffer_memory
+        self.max_block_ms = max_block_ms
 
         logging.getLogger("kafka").setLevel(loglevel)
 
@@ -46,35 +92,62 @@ class KafkaEventBroker(EventBroker):
         return cls(broker_config.url, **broker_config.kwargs)
 
     def publish(self, event) -> None:
-        self._create_producer()
+        if self.producer is None:
+            self._create_producer()
         self._publish(event)
-        self._close()
+
+    def _producer_kwargs(self) -> Dict[Text, Any]:
+        return {
+            "bootstrap_servers": self.host
+            if isinstance(self.host, list)
+            else [self.host],
+            "value_serializer": lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+            "linger_ms": self.linger_ms,
+            "batch_size": self.batch_size,
+            "compression_type": self.compression_type,
+            "buffer_memory": self.buffer_memory,
+            "max_block_ms": self.max_block_ms,
+        }
 
     def _create_producer(self) -> None:
         import kafka
 
         if self.security_protocol == "SASL_PLAINTEXT":
             self.producer = kafka.KafkaProducer(
-                bootstrap_servers=[self.host],
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
                 sasl_plain_username=self.sasl_username,
                 sasl_plain_password=self.sasl_password,
                 sasl_mechanism="PLAIN",
                 security_protocol=self.security_protocol,
+                **self._producer_kwargs(),
             )
         elif self.security_protocol == "SSL":
             self.producer = kafka.KafkaProducer(
-                bootstrap_servers=[self.host],
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
                 ssl_cafile=self.ssl_cafile,
                 ssl_certfile=self.ssl_certfile,
                 ssl_keyfile=self.ssl_keyfile,
                 ssl_check_hostname=False,
                 security_protocol=self.security_protocol,
+                **self._producer_kwargs(),
             )
 
     def _publish(self, event) -> None:
-        self.producer.send(self.topic, event)
+        # `send` only appends the event to the producer's buffer, which blocks for
+        # at most `max_block_ms` if the buffer is full
+        future = self.producer.send(self.topic, event)
+        future.add_errback(self._log_failed_publish, event)
+
+    @staticmethod
+    def _log_failed_publish(event: Dict[Text, Any], error: Exception) -> None:
+        logger.error(f"Could not publish event to Kafka: {error}. Event: {event}")
+
+    def close(self) -> None:
+        """Sends all buffered events and closes the Kafka producer."""
+        if self.producer is None:
+            return
+
+        self.producer.flush()
+        self._close()
+        self.producer = None
 
     def _close(self) -> None:
         self.producer.close()
@@ -1,7 +1,10 @@
 import contextlib
 import json
 import logging
-from typing import Any, Dict, Optional, Text
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Text
 
 from rasa.constants import DOCS_URL_EVENT_BROKERS
 from rasa.core.brokers.broker import EventBroker
@@ -10,6 +13,22 @@ from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
 
+# maximum number of events which are inserted with one statement
+DEFAULT_BATCH_SIZE = 100
+# time (in seconds) an event is buffered at most before it is inserted
+DEFAULT_FLUSH_INTERVAL = 1.0
+# maximum number of buffered events before `publish` blocks
+DEFAULT_MAX_BUFFER_SIZE = 10000
+# time (in seconds) `publish` waits for space in a full buffer before it drops the event
+DEFAULT_PUBLISH_TIMEOUT = 1.0
+# time (in seconds) `close` waits for the buffered events to be inserted
+DEFAULT_CLOSE_TIMEOUT = 10.0
+# number of times a failed insert is retried before the events are dropped
+DEFAULT_MAX_INSERT_RETRIES = 3
+
+# put into the buffer to stop the background worker
+_CLOSE_BUFFER = object()
+
 
 class SQLEventBroker(EventBroker):
     """Save events into an SQL database.
@@ -38,7 +57,46 @@ class SQLEventBroker(EventBroker):
         db: Text = "events.db",
         username: Optional[Text] = None,
         password: Optional[Text] = None,
+        write_behind: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        retry_failed_inserts: bool = True,
+        max_insert_retries: int = DEFAULT_MAX_INSERT_RETRIES,
+        publish_timeout: float = DEFAULT_PUBLISH_TIMEOUT,
+        close_timeout: float = DEFAULT_CLOSE_TIMEOUT,
     ):
+        """Creates an SQL event broker.
+
+        Args:
+            dialect: SQL database type.
+            host: Database network host.
+            port: Database network port.
+            db: Database name.
+            username: User name to use when authenticating with the database.
+            password: Password for the database user.
+            write_behind: If `True`, `publish` only buffers the events and a
+                background worker inserts them in batches. Events which are still
+                buffered are lost if the process is terminated before the broker
+                is closed.
+            batch_size: Maximum number of events which are inserted at once in the
+                `write_behind` mode.
+            flush_interval: Time (in seconds) an event is buffered at most before
+                it is inserted in the `write_behind` mode.
+            max_buffer_size: Maximum number of buffered events in the
+                `write_behind` mode. `publish` blocks once the buffer is full.
+            retry_failed_inserts: If `True`, events which could not be inserted in
+                the `write_behind` mode are kept and inserted with the next batch.
+                Otherwise they are dropped.
+            max_insert_retries: Number of times a failed insert is retried if
+                `retry_failed_inserts` is `True`. Afterwards the events are
+                inserted one by one and the ones which still fail are dropped.
+            publish_timeout: Time (in seconds) `publish` waits for space in a full
+                buffer in the `write_behind` mode. The event is dropped (and an
+                error is logged) if the buffer is still full afterwards.
+            close_timeout: Time (in seconds) `close` waits for the background worker
+                to insert the buffered events in the `write_behind` mode.
+        """
         from rasa.core.tracker_store import SQLTrackerStore
         import sqlalchemy.orm
 
@@ -52,6 +110,26 @@ class SQLEventBroker(EventBroker):
         self.Base.metadata.create_all(self.engine)
         self.sessionmaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
 
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_failed_inserts = retry_failed_inserts
+        self.max_insert_retries = max_insert_retries
+        self.publish_timeout = publish_timeout
+        self.close_timeout = close_timeout
+        self._buffer: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        self._closing = threading.Event()
+        # held while events are buffered, so that `close` can't stop the worker
+        # between the check whether the broker is closed and the buffering
+        self._buffer_lock = threading.Lock()
+
+        if write_behind:
+            self._buffer = queue.Queue(maxsize=max_buffer_size)
+            self._worker = threading.Thread(
+                target=self._insert_buffered_events, name="SQLEventBroker", daemon=True
+            )
+            self._worker.start()
+
     @classmethod
     def from_endpoint_config(cls, broker_config: EndpointConfig) -> "SQLEventBroker":
         return cls(host=broker_config.url, **broker_config.kwargs)
@@ -67,6 +145,11 @@ class SQLEventBroker(EventBroker):
 
     def publish(self, event: Dict[Text, Any]) -> None:
         """Publishes a json-formatted Rasa Core event into an event queue."""
+        with self._buffer_lock:
+            if self._buffer is not None and not self._closing.is_set():
+                self._buffer_event(event)
+                return
+
         with self.session_scope() as session:
             session.add(
                 self.SQLBrokerEvent(
@@ -74,3 +157,161 @@ class SQLEventBroker(EventBroker):
                 )
             )
             session.commit()
+
+    def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes multiple events with a single insert statement."""
+        with self._buffer_lock:
+            if self._buffer is not None and not self._closing.is_set():
+                for event in events:
+                    self._buffer_event(event)
+                return
+
+        with self.engine.begin() as connection:
+            connection.execute(
+                self.SQLBrokerEvent.__table__.insert(),
+                [self._event_row(event) for event in events],
+            )
+
+    def _buffer_event(self, event: Dict[Text, Any]) -> None:
+        try:
+            # blocks if `max_buffer_size` events are waiting to be inserted
+            self._buffer.put(self._event_row(event), timeout=self.publish_timeout)
+        except queue.Full:
+            logger.error(
+                f"Dropping event of type '{event.get('event')}' for conversation "
+                f"'{event.get('sender_id')}' since {self._buffer.maxsize} events are "
+                f"still waiting to be inserted into the database."
+            )
+
+    @staticmethod
+    def _event_row(event: Dict[Text, Any]) -> Dict[Text, Any]:
+        return {"sender_id": event.get("sender_id"), "data": json.dumps(event)}
+
+    def _insert_buffered_events(self) -> None:
+        """Inserts the buffered events in batches until the broker is closed."""
+        rows = []
+        failed_attempts = 0
+
+        while not self._closing.is_set():
+            rows = self._next_batch(rows)
+
+            if rows:
+                rows = self._insert_rows(rows)
+                if not rows:
+                    failed_attempts = 0
+                elif failed_attempts < self.max_insert_retries:
+                    failed_attempts += 1
+                    # give the database some time to recover before retrying, but
+                    # stop retrying as soon as the broker is closed
+                    self._closing.wait(self.flush_interval)
+                else:
+                    # don't retry events forever which can never be inserted
+                    self._insert_rows_one_by_one(rows)
+                    rows = []
+                    failed_attempts = 0
+
+        # events which were published before the broker was closed
+        rows += self._drain_buffer()
+        lost = []
+        for start in range(0, len(rows), self.batch_size):
+            lost += self._insert_rows(rows[start : start + self.batch_size])
+
+        if lost:
+            logger.error(
+                f"Failed to insert {len(lost)} buffered events before the "
+                f"SQLEventBroker was closed. These events are lost."
+            )
+
+    def _next_batch(self, rows: List[Dict[Text, Any]]) -> List[Dict[Text, Any]]:
+        """Adds buffered events to `rows` until the batch is full or due."""
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(rows) < self.batch_size:
+            # wait for the first event of a batch without a time limit
+            timeout = max(deadline - time.monotonic(), 0) if rows else None
+            try:
+                row = self._buffer.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if row is _CLOSE_BUFFER:
+                break
+
+            if not rows:
+                deadline = time.monotonic() + self.flush_interval
+            rows.append(row)
+
+        return rows
+
+    def _drain_buffer(self) -> List[Dict[Text, Any]]:
+        rows = []
+        while True:
+            try:
+                row = self._buffer.get_nowait()
+            except queue.Empty:
+                return rows
+
+            if row is not _CLOSE_BUFFER:
+                rows.append(row)
+
+    def _insert_rows(self, rows: List[Dict[Text, Any]]) -> List[Dict[Text, Any]]:
+        """Inserts multiple events with a single statement.
+
+        Returns:
+            The rows which could not be inserted and should be retried.
+        """
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(self.SQLBrokerEvent.__table__.insert(), rows)
+            return []
+        except Exception as e:
+            if self.retry_failed_inserts:
+                logger.warning(f"Failed to insert {len(rows)} events. {e}")
+                return rows
+
+            logger.error(f"Failed to insert {len(rows)} events, dropping them. {e}")
+            return []
+
+    def _insert_rows_one_by_one(self, rows: List[Dict[Text, Any]]) -> None:
+        """Inserts the rows separately and drops the ones which can't be inserted."""
+        dropped = 0
+        for row in rows:
+            try:
+                with self.engine.begin() as connection:
+                    connection.execute(self.SQLBrokerEvent.__table__.insert(), row)
+            except Exception as e:
+                logger.debug(f"Failed to insert event {row}. {e}")
+                dropped += 1
+
+        if dropped:
+            logger.error(
+                f"Dropping {dropped} events which could not be inserted after "
+                f"{self.max_insert_retries} retries."
+            )
+
+    def close(self) -> None:
+        """Inserts all buffered events and stops the background worker.
+
+        Events which are published after the broker was closed are inserted
+        directly.
+        """
+        if self._worker is None:
+            return
+
+        with self._buffer_lock:
+            self._closing.set()
+        try:
+            # wakes up the worker if it is waiting for new events
+            self._buffer.put_nowait(_CLOSE_BUFFER)
+        except queue.Full:
+            # the worker doesn't wait for new events if the buffer is full
+            pass
+
+        self._worker.join(timeout=self.close_timeout)
+        if self._worker.is_alive():
+            logger.error(
+                f"The buffered events were not inserted within {self.close_timeout} "
+                f"seconds after the SQLEventBroker was closed. Events which are "
+                f"still buffered are lost."
+            )
+        self._worker = None
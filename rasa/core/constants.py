@@ -16,6 +16,23 @@ DEFAULT_RESPONSE_TIMEOUT = 60 * 60  # 1 hour
 
 DEFAULT_LOCK_LIFETIME = 60  # in seconds
 
+DEFAULT_NLU_BATCH_SIZE = 32
+
+DEFAULT_NLU_BATCH_WAIT_TIME_IN_MS = 10
+
+# seconds between checks of a Sanic worker for a model pulled by another worker
+SHARED_MODEL_CHECK_INTERVAL = 5
+
+# seconds after which another Sanic worker takes over pulling models if the pulling
+# worker stopped checking for new models (e.g. because it crashed)
+SHARED_MODEL_PULLING_LEASE = 60
+
+# conversations for which Rasa remembers how many events an action server received
+MAX_ACTION_SERVER_CONVERSATIONS = 10000
+
+# action server configurations for which Rasa remembers what they received
+MAX_ACTION_SERVERS = 100
+
 REQUESTED_SLOT = "requested_slot"
 
 # slots for knowledge base
@@ -81,3 +98,7 @@ POSTGRESQL_SCHEMA = "POSTGRESQL_SCHEMA"
 # Names of the environment variables defining PostgreSQL pool size and max overflow
 POSTGRESQL_POOL_SIZE = "SQL_POOL_SIZE"
 POSTGRESQL_MAX_OVERFLOW = "SQL_MAX_OVERFLOW"
+
+# Name of the environment variable defining the number of threads which tracker
+# stores use to run blocking calls without blocking the event loop
+TRACKER_STORE_THREADS = "TRACKER_STORE_THREADS"
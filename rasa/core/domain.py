@@ -496,15 +496,25 @@ class Domain:
         self._check_domain_sanity()
 
     def __hash__(self) -> int:
+        return int(self._content_hash(), 16)
 
+    def _content_hash(self) -> Text:
         self_as_dict = self.as_dict()
         self_as_dict[KEY_INTENTS] = sort_list_of_dicts_by_first_key(
             self_as_dict[KEY_INTENTS]
         )
         self_as_string = json.dumps(self_as_dict, sort_keys=True)
-        text_hash = utils.get_text_hash(self_as_string)
 
-        return int(text_hash, 16)
+        return utils.get_text_hash(self_as_string)
+
+    @lazy_property
+    def fingerprint(self) -> Text:
+        """Hash of the domain's content, e.g. to let action servers cache the domain.
+
+        The hash is only computed once, as the domain is not changed after loading.
+        """
+
+        return self._content_hash()
 
     @lazy_property
     def user_actions_and_forms(self):
@@ -783,9 +793,7 @@ class Domain:
         self, tracker: "DialogueStateTracker"
     ) -> List[Dict[Text, float]]:
         """Array of states for each state of the trackers history."""
-        return [
-            self.get_active_states(tr) for tr in tracker.generate_all_prior_trackers()
-        ]
+        return [dict(state) for state in tracker.past_states(self)]
 
     def slots_for_entities(self, entities: List[Dict[Text, Any]]) -> List[SlotSet]:
         if self.store_entities_as_slots:
@@ -34,10 +34,16 @@ def deserialise_events(serialized_events: List[Dict[Text, Any]]) -> List["Event"
     """
 
     deserialised = []
+    # look up the event classes once instead of resolving them for every event
+    event_classes = Event._event_classes()
 
     for e in serialized_events:
         if "event" in e:
-            event = Event.from_parameters(e)
+            event_class = event_classes.get(e["event"])
+            if event_class is not None:
+                event = event_class._from_parameters(e)
+            else:
+                event = Event.from_parameters(e)
             if event:
                 deserialised.append(event)
             else:
@@ -83,6 +89,10 @@ def first_key(d: Dict[Text, Any], default_key: Any) -> Any:
         return None
 
 
+# known event classes by their type name, see `Event.resolve_by_type`
+_event_classes_by_type_name: Optional[Dict[Text, Type["Event"]]] = None
+
+
 # noinspection PyProtectedMember
 class Event:
     """Events describe everything that occurs in
@@ -91,6 +101,13 @@ class Event:
 
     type_name = "event"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # the new event class has to be added to the registry of event classes
+        global _event_classes_by_type_name
+        _event_classes_by_type_name = None
+
     def __init__(
         self,
         timestamp: Optional[float] = None,
@@ -184,11 +201,10 @@ class Event:
         type_name: Text, default: Optional[Type["Event"]] = None
     ) -> Optional[Type["Event"]]:
         """Returns a slots class by its type name."""
-        from rasa.core import utils
 
-        for cls in utils.all_subclasses(Event):
-            if cls.type_name == type_name:
-                return cls
+        event_class = Event._event_classes().get(type_name)
+        if event_class is not None:
+            return event_class
         if type_name == "topic":
             return None  # backwards compatibility to support old TopicSet evts
         elif default is not None:
@@ -196,6 +212,24 @@ class Event:
         else:
             raise ValueError(f"Unknown event name '{type_name}'.")
 
+    @staticmethod
+    def _event_classes() -> Dict[Text, Type["Event"]]:
+        """Returns all known event classes by their type name.
+
+        The registry is built on first use and rebuilt once new subclasses of
+        `Event` were defined."""
+        global _event_classes_by_type_name
+
+        event_classes = _event_classes_by_type_name
+        if event_classes is None:
+            event_classes = {}
+            for cls in utils.all_subclasses(Event):
+                # the first subclass with a type name wins, as in a linear search
+                event_classes.setdefault(cls.type_name, cls)
+            _event_classes_by_type_name = event_classes
+
+        return event_classes
+
     def apply_to(self, tracker: "DialogueStateTracker") -> None:
         pass
 
@@ -305,17 +339,19 @@ class UserUttered(Event):
 
     @classmethod
     def _from_story_string(cls, parameters: Dict[Text, Any]) -> Optional[List[Event]]:
+        return [cls._from_parameters(parameters)]
+
+    @classmethod
+    def _from_parameters(cls, parameters: Dict[Text, Any]) -> "UserUttered":
         try:
-            return [
-                cls._from_parse_data(
-                    parameters.get("text"),
-                    parameters.get("parse_data"),
-                    parameters.get("timestamp"),
-                    parameters.get("input_channel"),
-                    parameters.get("message_id"),
-                    parameters.get("metadata"),
-                )
-            ]
+            return cls._from_parse_data(
+                parameters.get("text"),
+                parameters.get("parse_data"),
+                parameters.get("timestamp"),
+                parameters.get("input_channel"),
+                parameters.get("message_id"),
+                parameters.get("metadata"),
+            )
         except KeyError as e:
             raise ValueError(f"Failed to parse bot uttered event. {e}")
 
@@ -1022,15 +1058,17 @@ class ActionExecuted(Event):
     @classmethod
     def _from_story_string(cls, parameters: Dict[Text, Any]) -> Optional[List[Event]]:
 
-        return [
-            ActionExecuted(
-                parameters.get("name"),
-                parameters.get("policy"),
-                parameters.get("confidence"),
-                parameters.get("timestamp"),
-                parameters.get("metadata"),
-            )
-        ]
+        return [cls._from_parameters(parameters)]
+
+    @classmethod
+    def _from_parameters(cls, parameters: Dict[Text, Any]) -> "ActionExecuted":
+        return ActionExecuted(
+            parameters.get("name"),
+            parameters.get("policy"),
+            parameters.get("confidence"),
+            parameters.get("timestamp"),
+            parameters.get("metadata"),
+        )
 
     def as_dict(self) -> Dict[Text, Any]:
         d = super().as_dict()
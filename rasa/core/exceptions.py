@@ -38,3 +38,8 @@ class AgentNotReady(RasaCoreException):
 
     def __init__(self, message: Text) -> None:
         self.message = message
+
+
+class InconsistentTrackerSnapshot(RasaCoreException):
+    """Raised if a tracker which was restored from a snapshot differs from the
+    tracker which is recreated by replaying all of its events."""
@@ -1,16 +1,17 @@
 import itertools
 import logging
+import os
 import uuid
-from typing import Text, Optional, List, Set, Dict, Any
+from typing import Text, Optional, List, Set, Dict, Any, Iterator
 
 from tqdm import tqdm
 
 import rasa.cli.utils as cli_utils
+import rasa.utils.io as io_utils
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.brokers.pika import PikaEventBroker
 from rasa.core.constants import RASA_EXPORT_PROCESS_ID_HEADER_NAME
 from rasa.core.tracker_store import TrackerStore
-from rasa.core.trackers import EventVerbosity
 from rasa.exceptions import (
     NoEventsToMigrateError,
     NoConversationsInTrackerStoreError,
@@ -20,6 +21,9 @@ from rasa.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# number of events which are published at once
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
 
 class Exporter:
     """Manages the publishing of events in a tracker store to an event broker.
@@ -36,6 +40,10 @@ class Exporter:
             If `None`, apply no such constraint.
         maximum_timestamp: Maximum timestamp of events that are published.
             If `None`, apply no such constraint.
+        checkpoint_path: Path to a file which stores the timestamp of the last
+            published batch of events. If the file exists, the export continues
+            from this timestamp.
+        batch_size: Number of events which are published at once.
     """
 
     def __init__(
@@ -46,6 +54,8 @@ class Exporter:
         requested_conversation_ids: Optional[Text] = None,
         minimum_timestamp: Optional[float] = None,
         maximum_timestamp: Optional[float] = None,
+        checkpoint_path: Optional[Text] = None,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
     ) -> None:
         self.endpoints_path = endpoints_path
         self.tracker_store = tracker_store
@@ -57,6 +67,8 @@ class Exporter:
         self.requested_conversation_ids = requested_conversation_ids
         self.minimum_timestamp = minimum_timestamp
         self.maximum_timestamp = maximum_timestamp
+        self.checkpoint_path = checkpoint_path
+        self.batch_size = batch_size
 
     def publish_events(self) -> int:
         """Publish events in a tracker store using an event broker.
@@ -68,10 +80,12 @@ class Exporter:
             The number of successfully published events.
 
         """
+        self._continue_from_checkpoint()
+
         events = self._fetch_events_within_time_range()
 
         cli_utils.print_info(
-            f"Selected {len(events)} events for publishing. Ready to go 🚀"
+            f"Publishing events in batches of {self.batch_size}. Ready to go 🚀"
         )
 
         published_events = 0
@@ -79,20 +93,83 @@ class Exporter:
 
         headers = self._get_message_headers()
 
+        batch = []
         for event in tqdm(events, "events"):
-            # noinspection PyBroadException
-            try:
-                self._publish_with_message_headers(event, headers)
-                published_events += 1
-                current_timestamp = event["timestamp"]
-            except Exception as e:
-                logger.exception(e)
-                raise PublishingError(current_timestamp)
+            batch.append(event)
+            if len(batch) < self.batch_size:
+                continue
+
+            self._publish_batch(batch, headers, current_timestamp)
+            published_events += len(batch)
+            current_timestamp = batch[-1]["timestamp"]
+            self._write_checkpoint(current_timestamp)
+            batch = []
+
+        if batch:
+            self._publish_batch(batch, headers, current_timestamp)
+            published_events += len(batch)
+            self._write_checkpoint(batch[-1]["timestamp"])
 
         self.event_broker.close()
 
         return published_events
 
+    def _publish_batch(
+        self,
+        events: List[Dict[Text, Any]],
+        headers: Optional[Dict[Text, Text]],
+        current_timestamp: Optional[float],
+    ) -> None:
+        """Publish a batch of events.
+
+        Args:
+            events: Serialized events to be published.
+            headers: Message headers to be published if `self.event_broker` is a
+                `PikaEventBroker`.
+            current_timestamp: Timestamp of the last event of the previously
+                published batch.
+
+        Raises:
+            `PublishingError` with `current_timestamp` if the events could not be
+            published.
+
+        """
+        # noinspection PyBroadException
+        try:
+            if isinstance(self.event_broker, PikaEventBroker):
+                for event in events:
+                    self._publish_with_message_headers(event, headers)
+            else:
+                self.event_broker.publish_batch(events)
+        except Exception as e:
+            logger.exception(e)
+            raise PublishingError(current_timestamp)
+
+    def _continue_from_checkpoint(self) -> None:
+        """Continue the export at the timestamp stored in the checkpoint file."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return
+
+        timestamp = io_utils.read_json_file(self.checkpoint_path)["timestamp"]
+        if self.minimum_timestamp is None or timestamp > self.minimum_timestamp:
+            cli_utils.print_info(
+                f"Continuing the export from the checkpoint at timestamp {timestamp}."
+            )
+            self.minimum_timestamp = timestamp
+
+    def _write_checkpoint(self, timestamp: float) -> None:
+        """Store the timestamp of the last published event in the checkpoint file.
+
+        Events with this timestamp are published again when the export continues
+        from the checkpoint, as they might not all have been published.
+        """
+        if not self.checkpoint_path:
+            return
+
+        io_utils.dump_obj_as_json_to_file(
+            self.checkpoint_path, {"timestamp": timestamp}
+        )
+
     def _get_message_headers(self) -> Optional[Dict[Text, Text]]:
         """Generate a message header for publishing events to a `PikaEventBroker`.
 
@@ -197,12 +274,19 @@ class Exporter:
 
         return conversation_ids_to_process
 
-    def _fetch_events_within_time_range(self) -> List[Dict[Text, Any]]:
+    def _fetch_events_within_time_range(self) -> Iterator[Dict[Text, Any]]:
         """Fetch all events for `conversation_ids` within the supplied time range.
 
+        The events are streamed from the tracker store in ascending order of their
+        timestamps, so they don't have to be loaded into memory at once.
+
         Returns:
             Serialized events with added `sender_id` field.
 
+        Raises:
+             `NoEventsInTimeRangeError` error if no events are found within the
+             requested time range.
+
         """
         conversation_ids_to_process = self._get_conversation_ids_to_process()
 
@@ -211,92 +295,21 @@ class Exporter:
             f"conversation IDs:"
         )
 
-        events = []
-
-        for conversation_id in tqdm(conversation_ids_to_process, "conversation IDs"):
-            tracker = self.tracker_store.retrieve(conversation_id)
-            if not tracker:
-                logger.info(
-                    f"Could not retrieve tracker for conversation ID "
-                    f"'{conversation_id}'. Skipping."
-                )
-                continue
-
-            _events = tracker.current_state(EventVerbosity.ALL)["events"]
-
-            if not _events:
-                logger.info(
-                    f"No events to migrate for conversation ID '{conversation_id}'."
-                )
-                continue
-
-            # the conversation IDs are needed in the event publishing
-            events.extend(
-                self._get_events_for_conversation_id(_events, conversation_id)
-            )
-
-        return self._sort_and_select_events_by_timestamp(events)
-
-    @staticmethod
-    def _get_events_for_conversation_id(
-        events: List[Dict[Text, Any]], conversation_id: Text
-    ) -> List[Dict[Text, Any]]:
-        """Get serialised events with added `sender_id` key.
-
-        Args:
-            events: Events to modify.
-            conversation_id: Conversation ID to add to events.
-
-        Returns:
-            Events with added `sender_id` key.
-
-        """
-        events_with_conversation_id = []
-
-        for event in events:
-            event["sender_id"] = conversation_id
-            events_with_conversation_id.append(event)
-
-        return events_with_conversation_id
-
-    def _sort_and_select_events_by_timestamp(
-        self, events: List[Dict[Text, Any]]
-    ) -> List[Dict[Text, Any]]:
-        """Sort list of events by ascending timestamp, and select events within time
-        range.
-
-        Args:
-            events: List of serialized events to be sorted and selected from.
-
-        Returns:
-            List of serialized and sorted (by timestamp) events within the requested
-            time range.
-
-        Raises:
-             `NoEventsInTimeRangeError` error if no events are found within the
-             requested time range.
-
-        """
-        logger.debug(f"Sorting and selecting from {len(events)} total events found.")
-        # sort the events by timestamp just in case they're not sorted already
-        events = sorted(events, key=lambda x: x["timestamp"])
-
-        # drop events failing minimum timestamp requirement
-        if self.minimum_timestamp is not None:
-            events = itertools.dropwhile(
-                lambda x: x["timestamp"] < self.minimum_timestamp, events
-            )
-
-        # select events passing maximum timestamp requirement
-        if self.maximum_timestamp is not None:
-            events = itertools.takewhile(
-                lambda x: x["timestamp"] < self.maximum_timestamp, events
+        events = iter(
+            self.tracker_store.retrieve_serialised_events(
+                # don't filter by conversation IDs if all of them are exported
+                conversation_ids_to_process
+                if self.requested_conversation_ids
+                else None,
+                self.minimum_timestamp,
+                self.maximum_timestamp,
             )
+        )
 
-        events = list(events)
-        if not events:
+        first_event = next(events, None)
+        if first_event is None:
             raise NoEventsInTimeRangeError(
                 "Could not find any events within requested time range. Exiting."
             )
 
-        return events
+        return itertools.chain([first_event], events)
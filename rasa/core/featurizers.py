@@ -4,7 +4,7 @@ import logging
 import numpy as np
 import os
 from tqdm import tqdm
-from typing import Tuple, List, Optional, Dict, Text, Any
+from typing import Tuple, List, Optional, Dict, Text, Any, Iterable
 
 import rasa.utils.io
 from rasa.core import utils
@@ -259,6 +259,38 @@ class LabelTokenizerSingleStateFeaturizer(SingleStateFeaturizer):
         return encoded_all_actions
 
 
+def binarize_intent_probabilities(
+    state: Iterable[Tuple[Text, float]]
+) -> Dict[Text, float]:
+    """Keeps only the most probable intent of a state and sets its probability to 1.0.
+
+    All other intents are removed from the state.
+    """
+
+    # copy state dict to preserve internal order of keys
+    bin_state = dict(state)
+    best_intent = None
+    best_intent_prob = -1.0
+    for state_name, prob in state:
+        if state_name.startswith("intent_"):
+            if prob > best_intent_prob:
+                # finding the maximum confidence intent
+                if best_intent is not None:
+                    # delete previous best intent
+                    del bin_state[best_intent]
+                best_intent = state_name
+                best_intent_prob = prob
+            else:
+                # delete other intents
+                del bin_state[state_name]
+
+    if best_intent is not None:
+        # set the confidence of best intent to 1.0
+        bin_state[best_intent] = 1.0
+
+    return bin_state
+
+
 class TrackerFeaturizer:
     """Base class for actual tracker featurizers."""
 
@@ -288,31 +320,7 @@ class TrackerFeaturizer:
 
         # during training we encounter only 1 or 0
         if not self.use_intent_probabilities and not is_binary_training:
-            bin_states = []
-            for state in states:
-                # copy state dict to preserve internal order of keys
-                bin_state = dict(state)
-                best_intent = None
-                best_intent_prob = -1.0
-                for state_name, prob in state:
-                    if state_name.startswith("intent_"):
-                        if prob > best_intent_prob:
-                            # finding the maximum confidence intent
-                            if best_intent is not None:
-                                # delete previous best intent
-                                del bin_state[best_intent]
-                            best_intent = state_name
-                            best_intent_prob = prob
-                        else:
-                            # delete other intents
-                            del bin_state[state_name]
-
-                if best_intent is not None:
-                    # set the confidence of best intent to 1.0
-                    bin_state[best_intent] = 1.0
-
-                bin_states.append(bin_state)
-            return bin_states
+            return [binarize_intent_probabilities(state) for state in states]
         else:
             return [dict(state) for state in states]
 
@@ -419,11 +427,19 @@ class TrackerFeaturizer:
 
     # noinspection PyPep8Naming
     def create_X(
-        self, trackers: List[DialogueStateTracker], domain: Domain
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        trackers_as_states: Optional[List[List[Dict[Text, float]]]] = None,
     ) -> np.ndarray:
-        """Create X for prediction."""
+        """Create X for prediction.
+
+        If `trackers_as_states` are passed, they are used instead of creating the
+        prediction states for the trackers again.
+        """
 
-        trackers_as_states = self.prediction_states(trackers, domain)
+        if trackers_as_states is None:
+            trackers_as_states = self.prediction_states(trackers, domain)
         X, _ = self._featurize_states(trackers_as_states)
         return X
 
@@ -665,3 +681,86 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
         ]
 
         return trackers_as_states
+
+
+class SharedPredictionStates:
+    """Prediction states of a tracker which are shared between featurizers.
+
+    The states are created once for the longest history any of the featurizers
+    needs. Featurizers which create their prediction states the default way then
+    slice their history from the shared states instead of creating it again.
+    """
+
+    def __init__(
+        self, tracker: DialogueStateTracker, domain: Domain, max_history: Optional[int]
+    ) -> None:
+
+        self.tracker = tracker
+        self.domain = domain
+        self.max_history = max_history
+
+        # used to detect events which were added to the tracker in the meantime
+        self._number_of_events = len(tracker.events)
+        self._latest_event = tracker.events[-1] if tracker.events else None
+
+        states = list(tracker.past_states(domain))
+        if max_history is not None:
+            states = states[-max_history:]
+        self.states = [binarize_intent_probabilities(state) for state in states]
+
+    @staticmethod
+    def supports(featurizer: Optional[TrackerFeaturizer]) -> bool:
+        """Checks if a featurizer creates its prediction states the default way."""
+
+        if featurizer is None or featurizer.use_intent_probabilities:
+            return False
+
+        featurizer_class = type(featurizer)
+        return featurizer_class._create_states is TrackerFeaturizer._create_states and (
+            featurizer_class.prediction_states
+            in [
+                MaxHistoryTrackerFeaturizer.prediction_states,
+                FullDialogueTrackerFeaturizer.prediction_states,
+            ]
+        )
+
+    @staticmethod
+    def max_history_of(featurizer: TrackerFeaturizer) -> Optional[int]:
+        """Returns the history length a featurizer needs (`None` for all states)."""
+
+        if isinstance(featurizer, MaxHistoryTrackerFeaturizer):
+            return featurizer.max_history
+        return None
+
+    def can_be_used_by(
+        self,
+        featurizer: Optional[TrackerFeaturizer],
+        tracker: DialogueStateTracker,
+        domain: Domain,
+    ) -> bool:
+        """Checks if the shared states can replace the featurizer's own states."""
+
+        if not self.supports(featurizer):
+            return False
+
+        if tracker is not self.tracker or domain is not self.domain:
+            return False
+
+        latest_event = tracker.events[-1] if tracker.events else None
+        if (
+            len(tracker.events) != self._number_of_events
+            or latest_event is not self._latest_event
+        ):
+            return False
+
+        max_history = self.max_history_of(featurizer)
+        return self.max_history is None or (
+            max_history is not None and max_history <= self.max_history
+        )
+
+    def states_for(self, featurizer: TrackerFeaturizer) -> List[Dict[Text, float]]:
+        """Slices the prediction states of the given featurizer."""
+
+        if isinstance(featurizer, MaxHistoryTrackerFeaturizer):
+            return featurizer.slice_state_history(self.states, featurizer.max_history)
+        return list(self.states)
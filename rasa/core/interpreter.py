@@ -1,11 +1,12 @@
-import aiohttp
-
+import asyncio
+import bisect
 import json
 import logging
 import re
+import time
 
 import os
-from typing import Text, List, Dict, Any, Union, Optional, Tuple
+from typing import Text, List, Dict, Any, Union, Optional, Tuple, NamedTuple
 
 from rasa.constants import DOCS_URL_STORIES
 from rasa.core import constants
@@ -29,6 +30,29 @@ class NaturalLanguageInterpreter:
             "Interpreter needs to be able to parse messages into structured output."
         )
 
+    async def parse_batch(
+        self,
+        texts: List[Text],
+        message_ids: Optional[List[Optional[Text]]] = None,
+        tracker: DialogueStateTracker = None,
+    ) -> List[Dict[Text, Any]]:
+        """Parse a batch of text messages.
+
+        Interpreters which can parse several messages at once should overwrite
+        this method. By default every text is parsed on its own, concurrently."""
+
+        if message_ids is None:
+            message_ids = [None] * len(texts)
+
+        return list(
+            await asyncio.gather(
+                *[
+                    self.parse(text, message_id, tracker)
+                    for text, message_id in zip(texts, message_ids)
+                ]
+            )
+        )
+
     @staticmethod
     def create(
         obj: Union["NaturalLanguageInterpreter", EndpointConfig, Text, None]
@@ -230,17 +254,17 @@ class RasaNLUHttpInterpreter(NaturalLanguageInterpreter):
 
         # noinspection PyBroadException
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=params) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    else:
-                        response_text = await resp.text()
-                        logger.error(
-                            f"Failed to parse text '{text}' using rasa NLU over "
-                            f"http. Error: {response_text}"
-                        )
-                        return None
+            session = self.endpoint_config.pooled_session()
+            async with session.post(url, json=params) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+                else:
+                    response_text = await resp.text()
+                    logger.error(
+                        f"Failed to parse text '{text}' using rasa NLU over "
+                        f"http. Error: {response_text}"
+                    )
+                    return None
         except Exception:
             logger.exception(f"Failed to parse text '{text}' using rasa NLU over http.")
             return None
@@ -278,12 +302,222 @@ class RasaNLUInterpreter(NaturalLanguageInterpreter):
 
         return result
 
+    async def parse_batch(
+        self,
+        texts: List[Text],
+        message_ids: Optional[List[Optional[Text]]] = None,
+        tracker: DialogueStateTracker = None,
+    ) -> List[Dict[Text, Any]]:
+        """Parse a batch of text messages using a single pass through the pipeline.
+
+        Return a default value if the parsing of the text failed."""
+
+        if self.lazy_init and self.interpreter is None:
+            self._load_interpreter()
+
+        return self.interpreter.parse_batch(texts)
+
     def _load_interpreter(self) -> None:
         from rasa.nlu.model import Interpreter
 
         self.interpreter = Interpreter.load(self.model_directory)
 
 
+class Histogram:
+    """Counts observed values in buckets with fixed upper bounds."""
+
+    def __init__(self, bucket_bounds: List[float]) -> None:
+        self.bucket_bounds = sorted(bucket_bounds)
+        # the last bucket collects all values above the largest bound
+        self.bucket_counts = [0] * (len(self.bucket_bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bucket_bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self) -> Dict[Text, Any]:
+        bucket_labels = [str(bound) for bound in self.bucket_bounds] + ["+Inf"]
+
+        return {
+            "buckets": dict(zip(bucket_labels, self.bucket_counts)),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class BatchingStatistics:
+    """Collects size and latency histograms of the batches of a
+    `BatchingInterpreter`."""
+
+    def __init__(self) -> None:
+        self.batch_size = Histogram([1, 2, 4, 8, 16, 32, 64, 128])
+        self.latency_in_ms = Histogram([1, 5, 10, 25, 50, 100, 250, 500, 1000])
+
+    def record(self, batch_size: int, latency_in_ms: float) -> None:
+        self.batch_size.observe(batch_size)
+        self.latency_in_ms.observe(latency_in_ms)
+
+    def as_dict(self) -> Dict[Text, Any]:
+        return {
+            "batch_size": self.batch_size.as_dict(),
+            "latency_in_ms": self.latency_in_ms.as_dict(),
+        }
+
+
+class _PendingMessage(NamedTuple):
+    text: Text
+    message_id: Optional[Text]
+    future: asyncio.Future
+
+
+class BatchingInterpreter(NaturalLanguageInterpreter):
+    """Coalesces concurrently parsed messages into batches.
+
+    Incoming messages are held back for at most `max_wait_time_in_ms` or until
+    `max_batch_size` messages are waiting. All waiting messages are then parsed
+    with a single call to `parse_batch` of the wrapped interpreter and every
+    caller receives the parse result of its own message. If parsing the batch
+    fails, the messages are parsed one by one, so that only the callers of the
+    messages which can't be parsed receive an error.
+
+    The tracker is not passed on to the wrapped interpreter as the messages of a
+    batch belong to different conversations.
+    """
+
+    def __init__(
+        self,
+        interpreter: NaturalLanguageInterpreter,
+        max_batch_size: int = constants.DEFAULT_NLU_BATCH_SIZE,
+        max_wait_time_in_ms: float = constants.DEFAULT_NLU_BATCH_WAIT_TIME_IN_MS,
+        statistics: Optional[BatchingStatistics] = None,
+    ) -> None:
+        self.interpreter = interpreter
+        self.max_batch_size = max(int(max_batch_size), 1)
+        self.max_wait_time_in_ms = float(max_wait_time_in_ms)
+        self.statistics = statistics or BatchingStatistics()
+
+        self._pending_messages: List[_PendingMessage] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    @classmethod
+    def create(
+        cls,
+        interpreter: NaturalLanguageInterpreter,
+        endpoint_config: Optional[EndpointConfig],
+        statistics: Optional[BatchingStatistics] = None,
+    ) -> NaturalLanguageInterpreter:
+        """Wraps `interpreter` if batching is configured in `endpoint_config`.
+
+        Returns the unwrapped interpreter if batching is not configured."""
+
+        if isinstance(interpreter, BatchingInterpreter):
+            statistics = statistics or interpreter.statistics
+            interpreter = interpreter.interpreter
+
+        if endpoint_config is None:
+            return interpreter
+
+        return cls(
+            interpreter,
+            max_batch_size=endpoint_config.kwargs.get(
+                "max_batch_size", constants.DEFAULT_NLU_BATCH_SIZE
+            ),
+            max_wait_time_in_ms=endpoint_config.kwargs.get(
+                "max_wait_time_in_ms", constants.DEFAULT_NLU_BATCH_WAIT_TIME_IN_MS
+            ),
+            statistics=statistics,
+        )
+
+    async def parse(
+        self,
+        text: Text,
+        message_id: Optional[Text] = None,
+        tracker: DialogueStateTracker = None,
+    ) -> Dict[Text, Any]:
+        """Parse a text message together with other concurrently parsed messages."""
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self._pending_messages.append(_PendingMessage(text, message_id, future))
+
+        if len(self._pending_messages) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.max_wait_time_in_ms / 1000, self._flush
+            )
+
+        return await future
+
+    async def parse_batch(
+        self,
+        texts: List[Text],
+        message_ids: Optional[List[Optional[Text]]] = None,
+        tracker: DialogueStateTracker = None,
+    ) -> List[Dict[Text, Any]]:
+        """Parse an already batched list of messages with the wrapped interpreter."""
+
+        return await self.interpreter.parse_batch(texts, message_ids, tracker)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending_messages = self._pending_messages, []
+        if batch:
+            asyncio.ensure_future(self._parse_pending_messages(batch))
+
+    async def _parse_pending_messages(self, batch: List[_PendingMessage]) -> None:
+        start = time.perf_counter()
+
+        try:
+            results = await self.interpreter.parse_batch(
+                [message.text for message in batch],
+                [message.message_id for message in batch],
+            )
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Interpreter returned {len(results)} result(s) for a batch of "
+                    f"{len(batch)} message(s)."
+                )
+        except Exception as e:
+            if len(batch) == 1:
+                results = [e]
+            else:
+                logger.debug(
+                    f"Failed to parse batch of {len(batch)} message(s) ({e}). "
+                    f"Parsing the messages one by one instead."
+                )
+                results = await asyncio.gather(
+                    *[
+                        self.interpreter.parse(message.text, message.message_id)
+                        for message in batch
+                    ],
+                    return_exceptions=True,
+                )
+
+        # every caller has to be resolved, otherwise its request hangs
+        for message, result in zip(batch, results):
+            # the caller might have been cancelled in the meantime
+            if message.future.done():
+                continue
+
+            if isinstance(result, BaseException):
+                message.future.set_exception(result)
+            else:
+                message.future.set_result(result)
+
+        latency_in_ms = (time.perf_counter() - start) * 1000
+        self.statistics.record(len(batch), latency_in_ms)
+        logger.debug(
+            f"Parsed batch of {len(batch)} message(s) in {latency_in_ms:.1f} ms."
+        )
+
+
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig],
 ) -> "NaturalLanguageInterpreter":
@@ -2,19 +2,26 @@ import asyncio
 import json
 import logging
 import os
+from collections import defaultdict
 
 from async_generator import asynccontextmanager
-from typing import Text, Union, Optional, AsyncGenerator
+from typing import Any, Dict, Text, Union, Optional, AsyncGenerator, Set
 
 from rasa.core.constants import DEFAULT_LOCK_LIFETIME
 from rasa.utils import common
 from rasa.core.lock import TicketLock
 from rasa.utils.endpoints import EndpointConfig
+from rasa.utils.io import DEFAULT_ENCODING
 
 logger = logging.getLogger(__name__)
 
 LOCK_LIFETIME = int(os.environ.get("TICKET_LOCK_LIFETIME", 0)) or DEFAULT_LOCK_LIFETIME
 
+# prefix of the Redis pub/sub channels which announce that a ticket was removed
+LOCK_RELEASED_CHANNEL_PREFIX = "lock_released:"
+# seconds the Redis pub/sub listener thread blocks while waiting for messages
+RELEASE_LISTENER_TIMEOUT = 1
+
 
 # noinspection PyUnresolvedReferences
 class LockError(Exception):
@@ -28,6 +35,16 @@ class LockError(Exception):
 
 
 class LockStore:
+    @property
+    def _waiters(self) -> Dict[Text, Set[asyncio.Event]]:
+        """Events of the tasks which wait for a lock, by conversation ID."""
+
+        # created lazily since custom lock stores might not call `super().__init__()`
+        if getattr(self, "_lock_waiters", None) is None:
+            self._lock_waiters = defaultdict(set)
+
+        return self._lock_waiters
+
     @staticmethod
     def create(obj: Union["LockStore", EndpointConfig, None]) -> "LockStore":
         """Factory to create a lock store."""
@@ -82,8 +99,9 @@ class LockStore:
     ) -> AsyncGenerator[TicketLock, None]:
         """Acquire lock with lifetime `lock_lifetime`for `conversation_id`.
 
-        Try acquiring lock with a wait time of `wait_time_in_seconds` seconds
-        between attempts. Raise a `LockError` if lock has expired.
+        Waiting tasks retry acquiring the lock as soon as a ticket of the lock is
+        removed, but at the latest after `wait_time_in_seconds` seconds. Raise a
+        `LockError` if lock has expired.
         """
 
         ticket = self.issue_ticket(conversation_id, lock_lifetime)
@@ -100,31 +118,66 @@ class LockStore:
         self, conversation_id: Text, ticket: int, wait_time_in_seconds: float
     ) -> TicketLock:
 
-        while True:
-            # fetch lock in every iteration because lock might no longer exist
-            lock = self.get_lock(conversation_id)
+        released = asyncio.Event()
+        self._waiters[conversation_id].add(released)
+        self._listen_for_releases()
 
-            # exit loop if lock does not exist anymore (expired)
-            if not lock:
-                break
+        try:
+            while True:
+                # clear before fetching the lock so that no release is missed
+                released.clear()
 
-            # acquire lock if it isn't locked
-            if not lock.is_locked(ticket):
-                return lock
+                # fetch lock in every iteration because lock might no longer exist
+                lock = self.get_lock(conversation_id)
 
-            logger.debug(
-                f"Failed to acquire lock for conversation ID '{conversation_id}'. "
-                f"Retrying..."
-            )
+                # exit loop if lock does not exist anymore (expired)
+                if not lock:
+                    break
+
+                # acquire lock if it isn't locked
+                if not lock.is_locked(ticket):
+                    return lock
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
-            self.update_lock(conversation_id)
+                logger.debug(
+                    f"Failed to acquire lock for conversation ID "
+                    f"'{conversation_id}'. Retrying..."
+                )
+
+                # wait for a release and update lock, tickets might have expired
+                await self._wait_for_release(released, wait_time_in_seconds)
+                self.update_lock(conversation_id)
+        finally:
+            self._waiters[conversation_id].discard(released)
+            if not self._waiters[conversation_id]:
+                del self._waiters[conversation_id]
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    @staticmethod
+    async def _wait_for_release(
+        released: asyncio.Event, wait_time_in_seconds: float
+    ) -> None:
+        try:
+            await asyncio.wait_for(released.wait(), wait_time_in_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def _listen_for_releases(self) -> None:
+        """Make sure that releases by other processes wake up the waiting tasks.
+
+        Only releases within this process are noticed by default.
+        """
+
+        pass
+
+    def _notify_waiters(self, conversation_id: Text) -> None:
+        """Wake up the tasks which wait for the lock of `conversation_id`."""
+
+        for released in self._waiters.get(conversation_id, ()):
+            released.set()
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
 
@@ -164,6 +217,7 @@ class LockStore:
         if lock:
             lock.remove_ticket_for(ticket_number)
             self.save_lock(lock)
+            self._notify_waiters(conversation_id)
 
     def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
         """Remove lock for `conversation_id` if no one is waiting."""
@@ -181,7 +235,12 @@ class LockStore:
 
 
 class RedisLockStore(LockStore):
-    """Redis store for ticket locks."""
+    """Redis store for ticket locks.
+
+    Tickets are issued and removed within Redis transactions, so that concurrent
+    updates by multiple Rasa servers can't overwrite each other. Every removal of
+    tickets is published, which lets waiting servers retry right away.
+    """
 
     def __init__(
         self,
@@ -196,6 +255,8 @@ class RedisLockStore(LockStore):
         self.red = redis.StrictRedis(
             host=host, port=int(port), db=int(db), password=password, ssl=use_ssl
         )
+        self._release_listener = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         super().__init__()
 
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
@@ -210,6 +271,124 @@ class RedisLockStore(LockStore):
     def save_lock(self, lock: TicketLock) -> None:
         self.red.set(lock.conversation_id, lock.dumps())
 
+    def issue_ticket(
+        self, conversation_id: Text, lock_lifetime: float = LOCK_LIFETIME
+    ) -> int:
+        def issue(pipeline: Any) -> int:
+            # `WATCH`ed, the transaction is retried if the lock changes meanwhile
+            serialised_lock = pipeline.get(conversation_id)
+            if serialised_lock:
+                lock = TicketLock.from_dict(json.loads(serialised_lock))
+            else:
+                lock = self.create_lock(conversation_id)
+
+            ticket = lock.issue_ticket(lock_lifetime)
+
+            pipeline.multi()
+            pipeline.set(conversation_id, lock.dumps())
+
+            return ticket
+
+        return self.red.transaction(issue, conversation_id, value_from_callable=True)
+
+    def update_lock(self, conversation_id: Text) -> None:
+        self._remove_tickets(conversation_id)
+
+    def finish_serving(self, conversation_id: Text, ticket_number: int) -> None:
+        self._remove_tickets(conversation_id, ticket_number)
+
+    def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
+        deleted = self._remove_tickets(
+            conversation_id, ticket_number, delete_if_unused=True
+        )
+        self._log_deletion(conversation_id, deleted)
+
+    def _remove_tickets(
+        self,
+        conversation_id: Text,
+        ticket_number: Optional[int] = None,
+        delete_if_unused: bool = False,
+    ) -> bool:
+        """Atomically removes `ticket_number` and expired tickets from a lock.
+
+        Args:
+            conversation_id: ID of the conversation whose lock is updated.
+            ticket_number: Ticket which is removed in addition to expired tickets.
+            delete_if_unused: Whether to delete the lock if no one is waiting.
+
+        Returns:
+            `True` if the lock was deleted.
+        """
+
+        def remove(pipeline: Any) -> bool:
+            serialised_lock = pipeline.get(conversation_id)
+            if not serialised_lock:
+                return False
+
+            lock = TicketLock.from_dict(json.loads(serialised_lock))
+            number_of_tickets = len(lock.tickets)
+            if ticket_number is not None:
+                lock.remove_ticket_for(ticket_number)
+            lock.remove_expired_tickets()
+            released = len(lock.tickets) < number_of_tickets
+            delete = delete_if_unused and not lock.is_someone_waiting()
+
+            pipeline.multi()
+            if delete:
+                pipeline.delete(conversation_id)
+            elif released:
+                pipeline.set(conversation_id, lock.dumps())
+            if released:
+                pipeline.publish(
+                    f"{LOCK_RELEASED_CHANNEL_PREFIX}{conversation_id}", conversation_id
+                )
+
+            return delete
+
+        deleted = self.red.transaction(
+            remove, conversation_id, value_from_callable=True
+        )
+        # waiters of this process don't have to wait for the published message
+        self._notify_waiters(conversation_id)
+
+        return deleted
+
+    def _listen_for_releases(self) -> None:
+        import redis
+
+        # released locks are announced on the listener thread, which has to pass
+        # them on to the event loop of the waiting tasks
+        self._loop = asyncio.get_event_loop()
+
+        if self._release_listener:
+            return
+
+        try:
+            pubsub = self.red.pubsub(ignore_subscribe_messages=True)
+            pubsub.psubscribe(
+                **{f"{LOCK_RELEASED_CHANNEL_PREFIX}*": self._on_lock_released}
+            )
+            self._release_listener = pubsub.run_in_thread(
+                sleep_time=RELEASE_LISTENER_TIMEOUT, daemon=True
+            )
+        except redis.exceptions.RedisError as e:
+            logger.warning(
+                f"Failed to subscribe to released locks. Waiting tasks will only "
+                f"notice locks released by other Rasa servers after their wait time "
+                f"passed. Error: {e}"
+            )
+
+    def _on_lock_released(self, message: Dict[Text, Any]) -> None:
+        conversation_id = message["data"]
+        if isinstance(conversation_id, bytes):
+            conversation_id = conversation_id.decode(DEFAULT_ENCODING)
+
+        try:
+            self._loop.call_soon_threadsafe(self._notify_waiters, conversation_id)
+        except RuntimeError:
+            # the event loop was closed in the meantime
+            pass
+
 
 class InMemoryLockStore(LockStore):
     """In-memory store for ticket locks."""
@@ -27,7 +27,7 @@ from rasa.core.actions.action import (
 from rasa.core.domain import Domain, InvalidDomain
 from rasa.core.events import SlotSet, ActionExecuted, ActionExecutionRejected, Event
 from rasa.core.exceptions import UnsupportedDialogueModelError
-from rasa.core.featurizers import MaxHistoryTrackerFeaturizer
+from rasa.core.featurizers import MaxHistoryTrackerFeaturizer, SharedPredictionStates
 from rasa.core.interpreter import NaturalLanguageInterpreter
 from rasa.core.policies.policy import Policy, SupportedData
 from rasa.core.policies.fallback import FallbackPolicy
@@ -567,9 +567,11 @@ class SimplePolicyEnsemble(PolicyEnsemble):
         ):
             rejected_action_name = tracker.events[-1].action_name
 
+        shared_states = self._shared_prediction_states(tracker, domain)
+
         predictions = {
             f"policy_{i}_{type(p).__name__}": self._get_prediction(
-                p, tracker, domain, interpreter
+                p, tracker, domain, interpreter, shared_states=shared_states
             )
             for i, p in enumerate(self.policies)
         }
@@ -586,12 +588,40 @@ class SimplePolicyEnsemble(PolicyEnsemble):
 
         return self._pick_best_policy(predictions)
 
+    def _shared_prediction_states(
+        self, tracker: DialogueStateTracker, domain: Domain
+    ) -> Optional[SharedPredictionStates]:
+        """Creates the prediction states of the tracker once for all policies.
+
+        The states are created for the longest history of all policies whose
+        featurizers create their states the default way. Every policy then slices
+        its own history from them. Policies with other featurizers create their
+        states themselves.
+        """
+
+        max_histories = [
+            max_history
+            for policy, max_history in zip(self.policies, self._max_histories())
+            if SharedPredictionStates.supports(policy.featurizer)
+        ]
+        if len(max_histories) < 2:
+            # there is nothing to share
+            return None
+
+        if None in max_histories:
+            max_history = None
+        else:
+            max_history = max(max_histories)
+
+        return SharedPredictionStates(tracker, domain, max_history)
+
     @staticmethod
     def _get_prediction(
         policy: Policy,
         tracker: DialogueStateTracker,
         domain: Domain,
         interpreter: NaturalLanguageInterpreter,
+        shared_states: Optional[SharedPredictionStates] = None,
     ) -> Prediction:
         number_of_arguments_in_rasa_1_0 = 2
         arguments = common_utils.arguments_of(policy.predict_action_probabilities)
@@ -599,9 +629,16 @@ class SimplePolicyEnsemble(PolicyEnsemble):
             len(arguments) > number_of_arguments_in_rasa_1_0
             and "interpreter" in arguments
         ):
-            probabilities = policy.predict_action_probabilities(
-                tracker, domain, interpreter
-            )
+            if shared_states is not None and common_utils.accepts_kwargs(
+                policy.predict_action_probabilities
+            ):
+                probabilities = policy.predict_action_probabilities(
+                    tracker, domain, interpreter, shared_states=shared_states
+                )
+            else:
+                probabilities = policy.predict_action_probabilities(
+                    tracker, domain, interpreter
+                )
         else:
             common_utils.raise_warning(
                 "The function `predict_action_probabilities` of "
@@ -1,17 +1,30 @@
 import zlib
 
 import base64
+import hashlib
 import json
 import logging
 import os
 from tqdm import tqdm
-from typing import Optional, Any, Dict, List, Text
+from typing import Optional, Any, Dict, List, Text, Iterator, Tuple
 
 import rasa.utils.io
 
 from rasa.core.domain import Domain
-from rasa.core.events import ActionExecuted
-from rasa.core.featurizers import TrackerFeaturizer, MaxHistoryTrackerFeaturizer
+from rasa.core.events import (
+    ActionExecuted,
+    BotUttered,
+    Event,
+    Form,
+    SlotSet,
+    UserUttered,
+)
+from rasa.core.featurizers import (
+    TrackerFeaturizer,
+    MaxHistoryTrackerFeaturizer,
+    SharedPredictionStates,
+    binarize_intent_probabilities,
+)
 from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.core.policies.policy import Policy
 from rasa.core.trackers import DialogueStateTracker
@@ -42,8 +55,14 @@ class MemoizationPolicy(Policy):
         training stories for this, use AugmentedMemoizationPolicy.
     """
 
+    # only used for lookups which were created with the first version of the
+    # feature keys (see `FEATURE_KEY_VERSION`)
     ENABLE_FEATURE_STRING_COMPRESSION = True
 
+    # version of the feature keys of the lookup, which is persisted with the lookup
+    # so that lookups of models trained with older versions can still be used
+    FEATURE_KEY_VERSION = 2
+
     SUPPORTS_ONLINE_TRAINING = True
 
     USE_NLU_CONFIDENCE_AS_SCORE = False
@@ -84,6 +103,7 @@ class MemoizationPolicy(Policy):
 
         self.max_history = self.featurizer.max_history
         self.lookup = lookup if lookup is not None else {}
+        self.feature_key_version = self.FEATURE_KEY_VERSION
 
     def _create_lookup_from_states(
         self,
@@ -144,7 +164,19 @@ class MemoizationPolicy(Policy):
     def _create_feature_key(self, states: List[Dict]) -> Text:
         from rasa.utils import io
 
-        feature_str = json.dumps(states, sort_keys=True).replace('"', "")
+        feature_str = json.dumps(states, sort_keys=True)
+        if self.feature_key_version < 2:
+            return self._create_legacy_feature_key(feature_str)
+
+        # a fixed-width digest of the canonical representation of the states
+        return hashlib.blake2b(
+            bytes(feature_str, io.DEFAULT_ENCODING), digest_size=16
+        ).hexdigest()
+
+    def _create_legacy_feature_key(self, feature_str: Text) -> Text:
+        from rasa.utils import io
+
+        feature_str = feature_str.replace('"', "")
         if self.ENABLE_FEATURE_STRING_COMPRESSION:
             compressed = zlib.compress(bytes(feature_str, io.DEFAULT_ENCODING))
             return base64.b64encode(compressed).decode(io.DEFAULT_ENCODING)
@@ -168,6 +200,8 @@ class MemoizationPolicy(Policy):
             trackers_as_states,
             trackers_as_actions,
         ) = self.featurizer.training_states_and_actions(training_trackers, domain)
+        # the lookup is created from scratch, hence it can use the latest keys
+        self.feature_key_version = self.FEATURE_KEY_VERSION
         self.lookup = self._create_lookup_from_states(
             trackers_as_states, trackers_as_actions
         )
@@ -211,8 +245,7 @@ class MemoizationPolicy(Policy):
     ) -> List[float]:
         result = self._default_predictions(domain)
 
-        tracker_as_states = self.featurizer.prediction_states([tracker], domain)
-        states = tracker_as_states[0]
+        states = self.prediction_states(tracker, domain, kwargs.get("shared_states"))
         logger.debug(f"Current tracker state {states}")
         predicted_action_name = self.recall(states, tracker, domain)
         if predicted_action_name is not None:
@@ -231,6 +264,7 @@ class MemoizationPolicy(Policy):
         data = {
             "priority": self.priority,
             "max_history": self.max_history,
+            "feature_key_version": self.feature_key_version,
             "lookup": self.lookup,
         }
         rasa.utils.io.create_directory_for_file(memorized_file)
@@ -243,9 +277,12 @@ class MemoizationPolicy(Policy):
         memorized_file = os.path.join(path, "memorized_turns.json")
         if os.path.isfile(memorized_file):
             data = json.loads(rasa.utils.io.read_file(memorized_file))
-            return cls(
+            policy = cls(
                 featurizer=featurizer, priority=data["priority"], lookup=data["lookup"]
             )
+            # lookups persisted without a version use the first version of the keys
+            policy.feature_key_version = data.get("feature_key_version", 1)
+            return policy
         else:
             logger.info(
                 "Couldn't load memoization for policy. "
@@ -308,13 +345,8 @@ class AugmentedMemoizationPolicy(MemoizationPolicy):
             and then back to the future to recall."""
 
         logger.debug("Launch DeLorean...")
-        mcfly_tracker = self._back_to_the_future_again(tracker)
-        while mcfly_tracker is not None:
-            tracker_as_states = self.featurizer.prediction_states(
-                [mcfly_tracker], domain
-            )
-            states = tracker_as_states[0]
 
+        for states in self._states_of_the_past(tracker, domain):
             if old_states != states:
                 # check if we like new futures
                 memorised = self._recall_states(states)
@@ -323,13 +355,135 @@ class AugmentedMemoizationPolicy(MemoizationPolicy):
                     return memorised
                 old_states = states
 
-            # go back again
-            mcfly_tracker = self._back_to_the_future_again(mcfly_tracker)
-
         # No match found
         logger.debug(f"Current tracker state {old_states}")
         return None
 
+    def _states_of_the_past(
+        self, tracker: DialogueStateTracker, domain: Domain
+    ) -> Iterator[List[Optional[Dict[Text, float]]]]:
+        """Yields the prediction states of the tracker after forgetting the events
+            before its second, third, ... executed action.
+
+            States which are equal to the previously yielded states may be
+            skipped."""
+
+        applied_events = tracker.applied_events()
+
+        if not SharedPredictionStates.supports(self.featurizer) or any(
+            isinstance(event, Form) and event.name for event in applied_events
+        ):
+            # replaying events of loops can undo other events again,
+            # so the trackers of the past have to be created one by one
+            mcfly_tracker = self._back_to_the_future_again(tracker)
+            while mcfly_tracker is not None:
+                yield self.featurizer.prediction_states([mcfly_tracker], domain)[0]
+                mcfly_tracker = self._back_to_the_future_again(mcfly_tracker)
+            return
+
+        # the applied events of the trackers of the past are the applied events of
+        # this tracker from their first action on
+        action_indices = [
+            idx
+            for idx, event in enumerate(applied_events)
+            if isinstance(event, ActionExecuted)
+        ]
+        starts = action_indices[1:]
+        if not starts:
+            return
+
+        # the prediction states only cover the turns of the last `max_history`
+        # actions, the events before them only contribute to the tracker's state
+        max_history = self.featurizer.max_history
+        if max_history == 1:
+            window_start = len(applied_events)
+        elif len(action_indices) >= max_history - 1:
+            window_start = action_indices[-(max_history - 1)]
+        else:
+            window_start = 0
+
+        prefixes = self._compressed_prefixes(applied_events, starts, window_start)
+        window_events = applied_events[window_start:]
+
+        previous_prefix = None
+        for start in starts:
+            if start >= window_start:
+                past_tracker = tracker.init_copy()
+                states = self._replay_states(
+                    past_tracker, applied_events[start:], domain
+                )
+                yield self.featurizer.slice_state_history(states, max_history)
+                continue
+
+            prefix = prefixes[start]
+            if (
+                prefix is not None
+                and previous_prefix is not None
+                and len(prefix) == len(previous_prefix)
+            ):
+                # forgetting the events did not change the tracker's state
+                continue
+            previous_prefix = prefix
+
+            past_tracker = tracker.init_copy()
+            for event in prefix or applied_events[start:window_start]:
+                past_tracker.update(event)
+
+            yield self._replay_states(past_tracker, window_events, domain)
+
+    @staticmethod
+    def _compressed_prefixes(
+        events: List[Event], starts: List[int], end: int
+    ) -> Dict[int, Optional[List[Event]]]:
+        """Compresses the events from every start up to `end`.
+
+            Events which only overwrite a part of the tracker's state are dropped
+            if a later event overwrites the same part again. If there are other
+            events between a start and `end`, there is no compressed prefix for
+            this start."""
+
+        prefixes = {}
+        start_indices = set(starts)
+        latest_events = {}
+        can_be_compressed = True
+
+        for idx in range(end - 1, starts[0] - 1, -1):
+            event = events[idx]
+            overwritten_state = _overwritten_state(event)
+            if overwritten_state is None:
+                can_be_compressed = False
+            elif overwritten_state not in latest_events:
+                latest_events[overwritten_state] = event
+
+            if idx in start_indices:
+                prefixes[idx] = (
+                    list(latest_events.values()) if can_be_compressed else None
+                )
+
+        return prefixes
+
+    @staticmethod
+    def _replay_states(
+        tracker: DialogueStateTracker, events: List[Event], domain: Domain
+    ) -> List[Dict[Text, float]]:
+        """Applies the events to the tracker and creates the states before each
+            action and the state after the last event."""
+
+        states = []
+        for event in events:
+            if isinstance(event, ActionExecuted):
+                states.append(
+                    binarize_intent_probabilities(
+                        domain.get_active_states(tracker).items()
+                    )
+                )
+            tracker.update(event)
+        states.append(
+            binarize_intent_probabilities(domain.get_active_states(tracker).items())
+        )
+
+        return states
+
     def recall(
         self,
         states: List[Dict[Text, float]],
@@ -343,3 +497,16 @@ class AugmentedMemoizationPolicy(MemoizationPolicy):
             return self._recall_using_delorean(states, tracker, domain)
         else:
             return predicted_action_name
+
+
+def _overwritten_state(event: Event) -> Optional[Tuple[Any, ...]]:
+    """Returns the part of the tracker's state which is overwritten by the event.
+
+    Returns `None` for events which have other effects on the tracker.
+    """
+
+    if type(event) == SlotSet:
+        return SlotSet, event.key
+    if type(event) in [ActionExecuted, UserUttered, BotUttered]:
+        return (type(event),)
+    return None
@@ -8,6 +8,7 @@ from rasa.core.domain import Domain
 from rasa.core.featurizers import (
     MaxHistoryTrackerFeaturizer,
     BinarySingleStateFeaturizer,
+    SharedPredictionStates,
 )
 from rasa.core.featurizers import TrackerFeaturizer
 from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
@@ -148,6 +149,32 @@ class Policy:
 
         return training_data
 
+    def prediction_states(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        shared_states: Optional[SharedPredictionStates] = None,
+    ) -> List[Optional[Dict[Text, float]]]:
+        """Creates the states of the tracker which the policy predicts on.
+
+        Args:
+            tracker: the :class:`rasa.core.trackers.DialogueStateTracker`
+            domain: the :class:`rasa.core.domain.Domain`
+            shared_states: states of the tracker which the policy ensemble
+                created once for all of its policies. They are used instead of
+                creating the states again if the policy's featurizer supports it.
+
+        Returns:
+            the states of the tracker
+        """
+
+        if shared_states is not None and shared_states.can_be_used_by(
+            self.featurizer, tracker, domain
+        ):
+            return shared_states.states_for(self.featurizer)
+
+        return self.featurizer.prediction_states([tracker], domain)[0]
+
     def train(
         self,
         training_trackers: List[DialogueStateTracker],
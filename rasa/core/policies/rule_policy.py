@@ -6,7 +6,7 @@ from collections import defaultdict
 
 from rasa.core.events import FormValidation
 from rasa.core.domain import PREV_PREFIX, ACTIVE_FORM_PREFIX, Domain, InvalidDomain
-from rasa.core.featurizers import TrackerFeaturizer
+from rasa.core.featurizers import TrackerFeaturizer, SharedPredictionStates
 from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.core.policies.memoization import MemoizationPolicy
 from rasa.core.policies.policy import SupportedData
@@ -44,6 +44,123 @@ DO_NOT_VALIDATE_FORM = "do_not_validate_form"
 DO_NOT_PREDICT_FORM_ACTION = "do_not_predict_form_action"
 
 
+class _RuleTurn:
+    """Conditions a rule puts on a single turn of a conversation."""
+
+    def __init__(self, rule_turn: Text) -> None:
+        self.is_empty = not rule_turn
+        self.features = rule_turn.split()
+
+        # TODO: this is a hack to make a rule know
+        #  that slot or form should not be set;
+        #  `_None` is added inside domain to indicate that
+        #  the feature should not be present
+        self.absent_prefixes = [
+            f[: f.rfind("_")] for f in self.features if f.endswith("_None")
+        ]
+        self.required = frozenset(f for f in self.features if not f.endswith("_None"))
+
+        slots = defaultdict(set)
+        for f in self.required:
+            if f.startswith("slot"):
+                slots[f[: f.rfind("_")]].add(f)
+        self.slots = {prefix: frozenset(values) for prefix, values in slots.items()}
+
+    def is_satisfied_by(self, state: Optional[Dict[Text, float]]) -> bool:
+        """Checks if the conditions of the turn are satisfied by a state."""
+
+        if self.is_empty:
+            # an empty rule turn matches only empty states
+            return not state
+
+        if not state:
+            return False
+
+        for prefix in self.absent_prefixes:
+            if any(prefix in key for key in state.keys()):
+                return False
+
+        if not self.required.issubset(state.keys()):
+            return False
+
+        for prefix, values in self.slots.items():
+            state_values = {
+                s
+                for s in state.keys()
+                if s.startswith("slot") and s[: s.rfind("_")] == prefix
+            }
+            if state_values != values:
+                return False
+
+        return True
+
+
+class _RuleIndex:
+    """Rules of a lookup compiled for matching them against conversation states.
+
+    Every rule is indexed by the rarest feature it requires in the current turn of a
+    conversation. Matching a conversation then only needs to check the rules which
+    are indexed by a feature of its current state and the rules which don't require
+    any features in the current turn.
+    """
+
+    def __init__(self, lookup: Dict[Text, Text]) -> None:
+        self._lookup = lookup
+        self._number_of_rules = len(lookup)
+
+        # the turns of a rule go back in time
+        self._rule_turns = {
+            rule_key: [_RuleTurn(turn) for turn in reversed(rule_key.split("|"))]
+            for rule_key in lookup.keys()
+        }
+
+        feature_counts = defaultdict(int)
+        for turns in self._rule_turns.values():
+            for feature in turns[0].required:
+                feature_counts[feature] += 1
+
+        self._rules_by_feature = defaultdict(list)
+        self._rules_without_features = []
+        for rule_key, turns in self._rule_turns.items():
+            if turns[0].required:
+                rarest_feature = min(
+                    turns[0].required, key=lambda f: (feature_counts[f], f)
+                )
+                self._rules_by_feature[rarest_feature].append(rule_key)
+            else:
+                self._rules_without_features.append(rule_key)
+
+    def is_for(self, lookup: Dict[Text, Text]) -> bool:
+        """Checks if the index was compiled from the current rules of the lookup."""
+
+        return lookup is self._lookup and len(lookup) == self._number_of_rules
+
+    def _candidates(self, state: Optional[Dict[Text, float]]) -> List[Text]:
+        candidates = list(self._rules_without_features)
+        for feature in state or {}:
+            candidates.extend(self._rules_by_feature.get(feature, []))
+        return candidates
+
+    def matching_rules(self, states: List[Optional[Dict[Text, float]]]) -> Set[Text]:
+        """Finds the rules which are satisfied by the states of a conversation."""
+
+        if not states:
+            return set(self._lookup.keys())
+
+        # turn_index goes back in time
+        states = list(reversed(states))
+        return {
+            rule_key
+            for rule_key in self._candidates(states[0])
+            if all(
+                turn.is_satisfied_by(state)
+                # turns of the rule which go back further than
+                # the conversation are not checked
+                for turn, state in zip(self._rule_turns[rule_key], states)
+            )
+        }
+
+
 class RulePolicy(MemoizationPolicy):
     """Policy which handles all the rules"""
 
@@ -92,8 +209,12 @@ class RulePolicy(MemoizationPolicy):
         self._fallback_action_name = core_fallback_action_name
         self._enable_fallback_prediction = enable_fallback_prediction
 
+        self._rule_indices = {}
+
         super().__init__(featurizer=featurizer, priority=priority, lookup=lookup)
 
+        self._compile_rules()
+
     @classmethod
     def validate_against_domain(
         cls, ensemble: Optional["PolicyEnsemble"], domain: Optional[Domain]
@@ -301,70 +422,35 @@ class RulePolicy(MemoizationPolicy):
             form_unhappy_lookup
         )
 
+        self._compile_rules()
+
         # TODO use story_trackers and rule_trackers
         #  to check that stories don't contradict rules
 
         logger.debug(f"Memorized '{len(self.lookup[RULES])}' unique rules.")
 
-    @staticmethod
-    def _features_in_state(features: List[Text], state: Dict[Text, float]) -> bool:
-
-        state_slots = defaultdict(set)
-        for s in state.keys():
-            if s.startswith("slot"):
-                state_slots[s[: s.rfind("_")]].add(s)
-
-        f_slots = defaultdict(set)
-        for f in features:
-            # TODO: this is a hack to make a rule know
-            #  that slot or form should not be set;
-            #  `_None` is added inside domain to indicate that
-            #  the feature should not be present
-            if f.endswith("_None"):
-                if any(f[: f.rfind("_")] in key for key in state.keys()):
-                    return False
-            elif f not in state:
-                return False
-            elif f.startswith("slot"):
-                f_slots[f[: f.rfind("_")]].add(f)
+    def _rule_index_for(self, lookup: Dict[Text, Text]) -> "_RuleIndex":
+        """Returns the compiled index of the rules in the lookup."""
 
-        for k, v in f_slots.items():
-            if state_slots[k] != v:
-                return False
+        rule_index = self._rule_indices.get(id(lookup))
+        if rule_index is None or not rule_index.is_for(lookup):
+            rule_index = _RuleIndex(lookup)
+            self._rule_indices[id(lookup)] = rule_index
+        return rule_index
 
-        return True
-
-    def _rule_is_good(
-        self, rule_key: Text, turn_index: int, state: Dict[Text, float]
-    ) -> bool:
-        """Check if rule is satisfied with current state at turn."""
-
-        # turn_index goes back in time
-        rule_turns = list(reversed(rule_key.split("|")))
-
-        return bool(
-            # rule is shorter than current turn index
-            turn_index >= len(rule_turns)
-            # current rule and state turns are empty
-            or (not rule_turns[turn_index] and not state)
-            # check that current rule turn features are present in current state turn
-            or (
-                rule_turns[turn_index]
-                and state
-                and self._features_in_state(rule_turns[turn_index].split(), state)
-            )
-        )
+    def _compile_rules(self) -> None:
+        self._rule_indices = {}
+        for lookup in (
+            self.lookup.get(RULES),
+            self.lookup.get(RULES_FOR_FORM_UNHAPPY_PATH),
+        ):
+            if lookup is not None:
+                self._rule_index_for(lookup)
 
     def _get_possible_keys(
         self, lookup: Dict[Text, Text], states: List[Dict[Text, float]]
     ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
-        for i, state in enumerate(reversed(states)):
-            # find rule keys that correspond to current state
-            possible_keys = set(
-                filter(lambda _key: self._rule_is_good(_key, i, state), possible_keys)
-            )
-        return possible_keys
+        return self._rule_index_for(lookup).matching_rules(states)
 
     @staticmethod
     def _find_action_from_default_actions(
@@ -415,10 +501,12 @@ class RulePolicy(MemoizationPolicy):
             return ACTION_LISTEN_NAME
 
     def _find_action_from_rules(
-        self, tracker: DialogueStateTracker, domain: Domain
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        shared_states: Optional[SharedPredictionStates] = None,
     ) -> Optional[Text]:
-        tracker_as_states = self.featurizer.prediction_states([tracker], domain)
-        states = tracker_as_states[0]
+        states = self.prediction_states(tracker, domain, shared_states)
 
         logger.debug(f"Current tracker state: {states}")
 
@@ -503,7 +591,9 @@ class RulePolicy(MemoizationPolicy):
         if form_happy_path_action_name:
             return self._prediction_result(form_happy_path_action_name, tracker, domain)
 
-        rules_action_name = self._find_action_from_rules(tracker, domain)
+        rules_action_name = self._find_action_from_rules(
+            tracker, domain, kwargs.get("shared_states")
+        )
         if rules_action_name:
             return self._prediction_result(rules_action_name, tracker, domain)
 
@@ -166,7 +166,11 @@ class SklearnPolicy(Policy):
         interpreter: NaturalLanguageInterpreter = RegexInterpreter(),
         **kwargs: Any,
     ) -> List[float]:
-        X = self.featurizer.create_X([tracker], domain)
+        X = self.featurizer.create_X(
+            [tracker],
+            domain,
+            [self.prediction_states(tracker, domain, kwargs.get("shared_states"))],
+        )
         Xt = self._preprocess_data(X)
         y_proba = self.model.predict_proba(Xt)
         return self._postprocess_prediction(y_proba, domain)
@@ -343,7 +343,11 @@ class TEDPolicy(Policy):
             return self._default_predictions(domain)
 
         # create model data from tracker
-        data_X = self.featurizer.create_X([tracker], domain)
+        data_X = self.featurizer.create_X(
+            [tracker],
+            domain,
+            [self.prediction_states(tracker, domain, kwargs.get("shared_states"))],
+        )
         model_data = self._create_model_data(data_X)
 
         output = self.model.predict(model_data)
@@ -84,7 +84,7 @@ class MessageProcessor:
 
         if not self.policy_ensemble or not self.domain:
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
             common_utils.raise_warning(
                 "No policy ensemble or domain set. Skipping action prediction "
                 "and execution.",
@@ -95,7 +95,7 @@ class MessageProcessor:
         await self._predict_and_execute_next_action(message.output_channel, tracker)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         if isinstance(message.output_channel, CollectingOutputChannel):
             return message.output_channel.messages
@@ -124,7 +124,7 @@ class MessageProcessor:
 
         probabilities, policy = self._get_next_action_probabilities(tracker)
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
         scores = [
             {"action": a, "score": p}
             for a, p in zip(self.domain.action_names, probabilities)
@@ -186,7 +186,7 @@ class MessageProcessor:
               Tracker for `sender_id` if available, `None` otherwise.
         """
 
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker(sender_id)
         if not tracker:
             return None
 
@@ -194,7 +194,9 @@ class MessageProcessor:
 
         return tracker
 
-    def get_tracker(self, conversation_id: Text) -> Optional[DialogueStateTracker]:
+    async def get_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
         """Get the tracker for a conversation.
 
         In contrast to `get_tracker_with_session_start` this does not add any
@@ -210,7 +212,7 @@ class MessageProcessor:
             conversation.
         """
         conversation_id = conversation_id or UserMessage.DEFAULT_SENDER_ID
-        return self.tracker_store.get_or_create_tracker(
+        return await self.tracker_store.get_or_create_tracker_async(
             conversation_id, append_action_listen=False
         )
 
@@ -238,7 +240,7 @@ class MessageProcessor:
 
             if should_save_tracker:
                 # save tracker state to continue conversation from this state
-                self._save_tracker(tracker)
+                await self._save_tracker(tracker)
         else:
             logger.warning(
                 f"Failed to retrieve or create tracker for conversation ID "
@@ -266,7 +268,7 @@ class MessageProcessor:
             )
 
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
         else:
             logger.warning(
                 f"Failed to retrieve or create tracker for conversation ID "
@@ -393,7 +395,7 @@ class MessageProcessor:
         tracker.update(UserUttered.create_external(intent_name, entity_list))
         await self._predict_and_execute_next_action(output_channel, tracker)
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
     @staticmethod
     def _log_slots(tracker) -> None:
@@ -465,6 +467,47 @@ class MessageProcessor:
 
         return parse_data
 
+    async def _parse_messages(
+        self, messages: List[UserMessage], tracker: DialogueStateTracker = None
+    ) -> List[Dict[Text, Any]]:
+        """Parse several messages, running the NLU pipeline once for all of them.
+
+        Messages in the format /intent{"entity1": val1} are parsed separately with
+        the `RegexInterpreter` as in `_parse_message`.
+        """
+
+        parse_results: List[Optional[Dict[Text, Any]]] = [None] * len(messages)
+        nlu_indices = []
+
+        for index, message in enumerate(messages):
+            if message.text.startswith(INTENT_MESSAGE_PREFIX):
+                parse_results[index] = await RegexInterpreter().parse(
+                    message.text, message.message_id, tracker
+                )
+            else:
+                nlu_indices.append(index)
+
+        if nlu_indices:
+            nlu_results = await self.interpreter.parse_batch(
+                [messages[index].text for index in nlu_indices],
+                [messages[index].message_id for index in nlu_indices],
+                tracker,
+            )
+            for index, parse_data in zip(nlu_indices, nlu_results):
+                parse_results[index] = parse_data
+
+        for message, parse_data in zip(messages, parse_results):
+            logger.debug(
+                "Received user message '{}' with intent '{}' "
+                "and entities '{}'".format(
+                    message.text, parse_data["intent"], parse_data["entities"]
+                )
+            )
+
+            self._check_for_unseen_features(parse_data)
+
+        return parse_results
+
     async def _handle_message_with_tracker(
         self, message: UserMessage, tracker: DialogueStateTracker
     ) -> None:
@@ -761,8 +804,8 @@ class MessageProcessor:
 
         return has_expired
 
-    def _save_tracker(self, tracker: DialogueStateTracker) -> None:
-        self.tracker_store.save(tracker)
+    async def _save_tracker(self, tracker: DialogueStateTracker) -> None:
+        await self.tracker_store.save_async(tracker)
 
     def _prob_array_for_action(
         self, action_name: Text
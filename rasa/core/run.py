@@ -13,7 +13,7 @@ import rasa.utils.io
 from rasa import model, server
 from rasa.constants import ENV_SANIC_BACKLOG
 from rasa.core import agent, channels, constants
-from rasa.core.agent import Agent
+from rasa.core.agent import Agent, SharedModelDirectory
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.channels import console
 from rasa.core.channels.channel import InputChannel
@@ -161,6 +161,7 @@ def serve_application(
     ssl_ca_file: Optional[Text] = None,
     ssl_password: Optional[Text] = None,
     conversation_id: Optional[Text] = uuid.uuid4().hex,
+    workers: Optional[int] = None,
 ):
     """Run the API entrypoint."""
     from rasa import server
@@ -193,29 +194,84 @@ def serve_application(
         f"Starting Rasa server on {constants.DEFAULT_SERVER_FORMAT.format(protocol, port)}"
     )
 
+    number_of_workers = rasa.core.utils.number_of_sanic_workers(
+        endpoints.lock_store if endpoints else None, workers
+    )
+    shared_models = None
+    if number_of_workers > 1 and not remote_storage:
+        shared_models = _share_model_between_workers(model_path, endpoints)
+
     app.register_listener(
-        partial(load_agent_on_start, model_path, endpoints, remote_storage),
+        partial(
+            load_agent_on_start, model_path, endpoints, remote_storage, shared_models
+        ),
         "before_server_start",
     )
 
     # noinspection PyUnresolvedReferences
     async def clear_model_files(_app: Sanic, _loop: Text) -> None:
-        if app.agent.model_directory:
+        # shared models are used by the other workers until they are stopped
+        if app.agent.model_directory and not shared_models:
             shutil.rmtree(_app.agent.model_directory)
 
     app.register_listener(clear_model_files, "after_server_stop")
 
+    # noinspection PyUnresolvedReferences
+    async def close_event_broker(_app: Sanic, _loop: Text) -> None:
+        # brokers might buffer events which have not been published yet
+        if _app.agent.tracker_store.event_broker:
+            _app.agent.tracker_store.event_broker.close()
+
+    app.register_listener(close_event_broker, "after_server_stop")
+
+    # noinspection PyUnresolvedReferences
+    async def close_endpoint_sessions(_app: Sanic, _loop: Text) -> None:
+        # connections to e.g. the action server are kept alive between requests
+        if endpoints:
+            await endpoints.close_sessions()
+
+    app.register_listener(close_endpoint_sessions, "after_server_stop")
+
     rasa.utils.common.update_sanic_log_level(log_file)
 
-    app.run(
-        host="0.0.0.0",
-        port=port,
-        ssl=ssl_context,
-        backlog=int(os.environ.get(ENV_SANIC_BACKLOG, "100")),
-        workers=rasa.core.utils.number_of_sanic_workers(
-            endpoints.lock_store if endpoints else None
-        ),
-    )
+    try:
+        app.run(
+            host="0.0.0.0",
+            port=port,
+            ssl=ssl_context,
+            backlog=int(os.environ.get(ENV_SANIC_BACKLOG, "100")),
+            workers=number_of_workers,
+        )
+    finally:
+        if shared_models:
+            shared_models.remove()
+
+
+def _share_model_between_workers(
+    model_path: Optional[Text], endpoints: Optional[AvailableEndpoints]
+) -> SharedModelDirectory:
+    """Unpack or pull the model once in the main process for all Sanic workers.
+
+    The workers are forked when the server starts, so they load the model from the
+    shared directory instead of unpacking or downloading it once per worker.
+    """
+    shared_models = SharedModelDirectory()
+
+    if endpoints and endpoints.model:
+        loop = asyncio.get_event_loop()
+        # noinspection PyBroadException
+        try:
+            loop.run_until_complete(shared_models.pull(endpoints.model))
+        except Exception as e:
+            # the workers try again to load the model when they start
+            logger.error(f"Could not load model due to {e}.")
+        finally:
+            # the workers can't reuse the connections of the main process
+            loop.run_until_complete(endpoints.model.close_session())
+    elif model_path and os.path.exists(model_path):
+        shared_models.unpack(model_path)
+
+    return shared_models
 
 
 # noinspection PyUnusedLocal
@@ -223,6 +279,7 @@ async def load_agent_on_start(
     model_path: Text,
     endpoints: AvailableEndpoints,
     remote_storage: Optional[Text],
+    shared_models: Optional[SharedModelDirectory],
     app: Sanic,
     loop: Text,
 ):
@@ -231,11 +288,19 @@ async def load_agent_on_start(
     Used to be scheduled on server start
     (hence the `app` and `loop` arguments)."""
 
+    shared_model = shared_models.latest() if shared_models else None
+
     # noinspection PyBroadException
     try:
-        with model.get_model(model_path) as unpacked_model:
-            _, nlu_model = model.get_model_subdirectories(unpacked_model)
+        if shared_model:
+            _, nlu_model = model.get_model_subdirectories(shared_model[0])
             _interpreter = NaturalLanguageInterpreter.create(endpoints.nlu or nlu_model)
+        else:
+            with model.get_model(model_path) as unpacked_model:
+                _, nlu_model = model.get_model_subdirectories(unpacked_model)
+                _interpreter = NaturalLanguageInterpreter.create(
+                    endpoints.nlu or nlu_model
+                )
     except Exception:
         logger.debug(f"Could not load interpreter from '{model_path}'.")
         _interpreter = None
@@ -255,6 +320,7 @@ async def load_agent_on_start(
         tracker_store=_tracker_store,
         lock_store=_lock_store,
         action_endpoint=endpoints.action,
+        shared_models=shared_models,
     )
 
     if not app.agent:
@@ -271,6 +337,8 @@ async def load_agent_on_start(
             remote_storage=remote_storage,
         )
 
+    app.agent.configure_nlu_batching(endpoints.nlu_batching)
+
     logger.info("Rasa server is up and running.")
     return app.agent
 
@@ -1,13 +1,23 @@
+import asyncio
 import contextlib
+import copy
+import functools
+import heapq
 import itertools
 import json
 import logging
 import os
 import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from time import sleep
 from typing import (
+    Any,
+    Awaitable,
     Callable,
     Dict,
     Iterable,
@@ -15,6 +25,7 @@ from typing import (
     List,
     Optional,
     Text,
+    Tuple,
     Union,
     TYPE_CHECKING,
 )
@@ -27,15 +38,18 @@ from rasa.core.constants import (
     POSTGRESQL_SCHEMA,
     POSTGRESQL_MAX_OVERFLOW,
     POSTGRESQL_POOL_SIZE,
+    TRACKER_STORE_THREADS,
 )
 from rasa.core.conversation import Dialogue
 from rasa.core.domain import Domain
-from rasa.core.events import SessionStarted
+from rasa.core.events import Event, SessionStarted, deserialise_events
+from rasa.core.exceptions import InconsistentTrackerSnapshot
 from rasa.core.trackers import ActionExecuted, DialogueStateTracker, EventVerbosity
 import rasa.cli.utils as rasa_cli_utils
 from rasa.nlu.constants import INTENT_NAME_KEY
 from rasa.utils.common import class_from_module_path, raise_warning, arguments_of
 from rasa.utils.endpoints import EndpointConfig
+from rasa.utils.io import DEFAULT_ENCODING
 import sqlalchemy as sa
 
 if TYPE_CHECKING:
@@ -52,6 +66,25 @@ logger = logging.getLogger(__name__)
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# default number of threads which run the blocking calls of a tracker store
+DEFAULT_TRACKER_STORE_THREADS = 10
+
+# number of events which are fetched at once when events are streamed from a database
+EVENT_STREAM_BATCH_SIZE = 1000
+
+# prefix of the keys used by the `RedisTrackerStore` if it stores event lists
+DEFAULT_REDIS_KEY_PREFIX = "tracker:"
+# number of keys which Redis looks at for each `SCAN` call
+REDIS_SCAN_COUNT = 1000
+
+# default maximum number of trackers which are kept by a `CachedTrackerStore`
+DEFAULT_TRACKER_CACHE_SIZE = 1000
+# default number of seconds for which a `CachedTrackerStore` keeps a tracker
+DEFAULT_TRACKER_CACHE_TTL = 60
+
+# number of stored events and timestamp of the last stored event of a conversation
+StoredVersion = Tuple[int, Optional[float]]
+
 
 class TrackerStore:
     """Class to hold all of the TrackerStore classes"""
@@ -61,6 +94,7 @@ class TrackerStore:
         domain: Optional[Domain],
         event_broker: Optional[EventBroker] = None,
         retrieve_events_from_previous_conversation_sessions: bool = False,
+        snapshot_interval: Optional[int] = None,
     ) -> None:
         """Create a TrackerStore.
 
@@ -72,6 +106,10 @@ class TrackerStore:
                 will return all events (even if they are from a previous conversation
                 session). This setting only applies to `TrackerStore`s which usually
                 would only return events for the latest session.
+            snapshot_interval: If set, a snapshot of the tracker state is stored
+                alongside the events every `snapshot_interval` events. `retrieve`
+                then only applies the events after the latest snapshot instead of
+                replaying all events.
         """
         self.domain = domain
         self.event_broker = event_broker
@@ -79,6 +117,12 @@ class TrackerStore:
         self.load_events_from_previous_conversation_sessions = (
             retrieve_events_from_previous_conversation_sessions
         )
+        self.snapshot_interval = snapshot_interval
+        # if `True`, trackers restored from a snapshot are compared to the trackers
+        # recreated by replaying all events (this is meant for tests)
+        self.check_snapshot_consistency = False
+        # runs the blocking calls of the `async` interface, see `_run_in_thread`
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
 
     @staticmethod
     def create(
@@ -106,7 +150,7 @@ class TrackerStore:
             max_event_history: Value to update the tracker store's max event history to.
             append_action_listen: Whether or not to append an initial `action_listen`.
         """
-        tracker = self.retrieve(sender_id)
+        tracker = self._mark_as_persisted(self.retrieve(sender_id))
         self.max_event_history = max_event_history
         if tracker is None:
             tracker = self.create_tracker(
@@ -156,24 +200,287 @@ class TrackerStore:
         """Retrieve method that will be overridden by specific tracker"""
         raise NotImplementedError()
 
+    async def get_or_create_tracker_async(
+        self,
+        sender_id: Text,
+        max_event_history: Optional[int] = None,
+        append_action_listen: bool = True,
+    ) -> DialogueStateTracker:
+        """Returns tracker or creates one without blocking the event loop.
+
+        See `get_or_create_tracker` for the arguments.
+        """
+        if self._overrides_only_sync_method("get_or_create_tracker"):
+            # keep custom tracker stores which customise the synchronous method working
+            return await self._run_in_thread(
+                self.get_or_create_tracker,
+                sender_id,
+                max_event_history,
+                append_action_listen,
+            )
+
+        tracker = self._mark_as_persisted(await self.retrieve_async(sender_id))
+        self.max_event_history = max_event_history
+        if tracker is None:
+            tracker = await self.create_tracker_async(
+                sender_id, append_action_listen=append_action_listen
+            )
+        return tracker
+
+    async def create_tracker_async(
+        self, sender_id: Text, append_action_listen: bool = True
+    ) -> DialogueStateTracker:
+        """Creates a new tracker for `sender_id` without blocking the event loop.
+
+        See `create_tracker` for the arguments.
+        """
+        if self._overrides_only_sync_method("create_tracker"):
+            return await self._run_in_thread(
+                self.create_tracker, sender_id, append_action_listen
+            )
+
+        tracker = self.init_tracker(sender_id)
+
+        if tracker:
+            if append_action_listen:
+                tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+            await self.save_async(tracker)
+
+        return tracker
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        """Saves the tracker without blocking the event loop.
+
+        Tracker stores which only implement the synchronous interface (e.g. custom
+        tracker stores) are run in a thread pool. Tracker stores with an
+        asyncio-native client should override the `async` methods.
+        """
+        await self._run_in_thread(self.save, tracker)
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves the tracker without blocking the event loop.
+
+        See `save_async` for how synchronous tracker stores are run.
+        """
+        return await self._run_in_thread(self.retrieve, sender_id)
+
+    async def keys_async(self) -> Iterable[Text]:
+        """Returns the tracker store's keys without blocking the event loop.
+
+        See `save_async` for how synchronous tracker stores are run.
+        """
+        return await self._run_in_thread(self.keys)
+
+    def _overrides_only_sync_method(self, method_name: Text) -> bool:
+        """Checks if a subclass overrides `method_name` but not its `async` version.
+
+        The `async` methods of such tracker stores have to delegate to the
+        synchronous method, since it might have been customised.
+        """
+        async_method_name = f"{method_name}_async"
+        tracker_store_class = type(self)
+
+        return getattr(tracker_store_class, method_name) is not getattr(
+            TrackerStore, method_name
+        ) and getattr(tracker_store_class, async_method_name) is getattr(
+            TrackerStore, async_method_name
+        )
+
+    def _run_in_thread(self, func: Callable, *args: Any) -> Awaitable:
+        """Runs the blocking `func` in the tracker store's bounded thread pool.
+
+        Event brokers aren't thread-safe, so events which `func` streams are only
+        published once it finished, from the thread which runs the event loop.
+        """
+
+        if getattr(self, "_thread_pool", None) is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=int(
+                    os.environ.get(TRACKER_STORE_THREADS, DEFAULT_TRACKER_STORE_THREADS)
+                ),
+                thread_name_prefix=self.__class__.__name__,
+            )
+
+        loop = asyncio.get_event_loop()
+        call = loop.run_in_executor(
+            self._thread_pool,
+            functools.partial(_call_with_deferred_publishing, func, *args),
+        )
+        return _publish_deferred_events(call)
+
     def stream_events(self, tracker: DialogueStateTracker) -> None:
         """Streams events to a message broker"""
-        offset = self.number_of_existing_events(tracker.sender_id)
+        offset = tracker.persisted_event_count
+        if offset is None:
+            offset = self.number_of_existing_events(tracker.sender_id)
         events = tracker.events
+        deferred_events = getattr(_deferred_events, "events", None)
         for event in list(itertools.islice(events, offset, len(events))):
             body = {"sender_id": tracker.sender_id}
             body.update(event.as_dict())
-            self.event_broker.publish(body)
+            if deferred_events is not None:
+                deferred_events.append((self.event_broker, body))
+            else:
+                self.event_broker.publish(body)
 
     def number_of_existing_events(self, sender_id: Text) -> int:
         """Return number of stored events for a given sender id."""
         old_tracker = self.retrieve(sender_id)
         return len(old_tracker.events) if old_tracker else 0
 
+    async def number_of_existing_events_async(self, sender_id: Text) -> int:
+        """Returns the number of stored events without blocking the event loop.
+
+        See `save_async` for how synchronous tracker stores are run.
+        """
+        return await self._run_in_thread(self.number_of_existing_events, sender_id)
+
+    def stored_version(self, sender_id: Text) -> StoredVersion:
+        """Returns the version of the stored conversation for a given sender id.
+
+        The version consists of the number of stored events and the timestamp of
+        the last stored event. It changes whenever the stored conversation does.
+        """
+        return _version_of_tracker(self.retrieve(sender_id))
+
+    async def stored_version_async(self, sender_id: Text) -> StoredVersion:
+        """Returns the version of the stored conversation without blocking the event
+        loop.
+
+        See `save_async` for how synchronous tracker stores are run.
+        """
+        return await self._run_in_thread(self.stored_version, sender_id)
+
+    @staticmethod
+    def _mark_as_persisted(
+        tracker: Optional[DialogueStateTracker],
+    ) -> Optional[DialogueStateTracker]:
+        """Remembers on the tracker that all of its events are stored.
+
+        Saving the tracker then only has to store (and stream) the events which
+        are added after this watermark, without asking the store which events it
+        already has.
+        """
+        if tracker is not None:
+            tracker.persisted_event_count = len(tracker.events)
+        return tracker
+
     def keys(self) -> Iterable[Text]:
         """Returns the set of values for the tracker store's primary key"""
         raise NotImplementedError()
 
+    def retrieve_events(
+        self,
+        sender_id: Text,
+        after_timestamp: Optional[float] = None,
+        until_timestamp: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """Retrieves the events of a conversation within a time range.
+
+        The events are selected from the events which `retrieve` would return. The
+        default implementation retrieves the whole tracker and filters its events.
+        Tracker stores which can filter the events on the server side should
+        override this.
+
+        Args:
+            sender_id: Conversation ID whose events are retrieved.
+            after_timestamp: Only events after this timestamp are retrieved.
+            until_timestamp: Only events at or before this timestamp are retrieved.
+            limit: Maximum number of retrieved events. The earliest events are
+                retrieved first.
+
+        Returns:
+            The events of the conversation within the time range.
+        """
+        tracker = self.retrieve(sender_id)
+        if not tracker:
+            return []
+
+        return _select_events(tracker.events, after_timestamp, until_timestamp, limit)
+
+    async def retrieve_events_async(
+        self,
+        sender_id: Text,
+        after_timestamp: Optional[float] = None,
+        until_timestamp: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """Retrieves the events of a conversation without blocking the event loop.
+
+        See `retrieve_events` for the arguments.
+        """
+        return await self._run_in_thread(
+            self.retrieve_events, sender_id, after_timestamp, until_timestamp, limit
+        )
+
+    def retrieve_serialised_events(
+        self,
+        conversation_ids: Optional[Iterable[Text]] = None,
+        minimum_timestamp: Optional[float] = None,
+        maximum_timestamp: Optional[float] = None,
+    ) -> Iterator[Dict[Text, Any]]:
+        """Retrieves the serialised events of multiple conversations in a time range.
+
+        The default implementation retrieves the trackers one after another and
+        merges their events. The events are serialised lazily while they are
+        merged, but the retrieved trackers are kept until all of their events were
+        merged. Tracker stores which can filter the events on the server side should
+        override this.
+
+        Args:
+            conversation_ids: IDs of the conversations whose events are retrieved.
+                All conversations if `None`.
+            minimum_timestamp: Only events at or after this timestamp are retrieved.
+            maximum_timestamp: Only events before this timestamp are retrieved.
+
+        Returns:
+            The events in ascending order of their timestamps. Each event contains
+            its conversation ID under the `sender_id` key.
+        """
+        if conversation_ids is None:
+            conversation_ids = self.keys()
+
+        # the events of each conversation are already in order, so the sorted
+        # streams of all conversations only need to be merged
+        return heapq.merge(
+            *[
+                self._serialised_events_of_conversation(
+                    conversation_id, minimum_timestamp, maximum_timestamp
+                )
+                for conversation_id in conversation_ids
+            ],
+            key=lambda event: event["timestamp"],
+        )
+
+    def _serialised_events_of_conversation(
+        self,
+        conversation_id: Text,
+        minimum_timestamp: Optional[float],
+        maximum_timestamp: Optional[float],
+    ) -> Iterator[Dict[Text, Any]]:
+        tracker = self.retrieve(conversation_id)
+        if not tracker:
+            logger.info(
+                f"Could not retrieve tracker for conversation ID "
+                f"'{conversation_id}'. Skipping."
+            )
+            return
+
+        # only the references are sorted, the events are serialised one at a time
+        events = sorted(tracker.events, key=lambda event: event.timestamp)
+
+        for event in events:
+            if minimum_timestamp is not None and event.timestamp < minimum_timestamp:
+                continue
+            if maximum_timestamp is not None and event.timestamp >= maximum_timestamp:
+                continue
+
+            serialised = event.as_dict()
+            serialised["sender_id"] = conversation_id
+            yield serialised
+
     @staticmethod
     def serialise_tracker(tracker: DialogueStateTracker) -> Text:
         """Serializes the tracker, returns representation of the tracker."""
@@ -181,6 +488,117 @@ class TrackerStore:
 
         return json.dumps(dialogue.as_dict())
 
+    def _serialise_tracker_with_snapshot(self, tracker: DialogueStateTracker) -> Text:
+        """Serializes the tracker together with a snapshot of its state.
+
+        Stores which rewrite the whole conversation on every save refresh the
+        snapshot with each save, since this doesn't require an additional write."""
+
+        serialised = tracker.as_dialogue().as_dict()
+        snapshot = self._snapshot_to_persist(tracker)
+        if snapshot:
+            serialised["snapshot"] = snapshot
+
+        return json.dumps(serialised)
+
+    def _snapshot_to_persist(
+        self,
+        tracker: DialogueStateTracker,
+        number_of_stored_events: Optional[int] = None,
+    ) -> Optional[Dict[Text, Any]]:
+        """Returns a snapshot of the tracker if one should be persisted.
+
+        Args:
+            tracker: The tracker which is saved.
+            number_of_stored_events: Number of the tracker's events which were
+                already stored. If given, a snapshot is only taken if the saved
+                events cross a multiple of `snapshot_interval`.
+
+        Returns:
+            The snapshot or `None` if no snapshot should be persisted.
+        """
+
+        if not self.snapshot_interval:
+            return None
+
+        if number_of_stored_events is not None and (
+            number_of_stored_events // self.snapshot_interval
+            == len(tracker.events) // self.snapshot_interval
+        ):
+            return None
+
+        return tracker.snapshot()
+
+    def _recreate_from_snapshot(
+        self,
+        tracker: DialogueStateTracker,
+        evts: List[Event],
+        snapshot: Optional[Dict[Text, Any]],
+    ) -> bool:
+        """Recreates the state of a blank tracker from a stored snapshot.
+
+        Args:
+            tracker: Blank tracker which should be recreated.
+            evts: The stored events of the tracker.
+            snapshot: The stored snapshot of the tracker (if any).
+
+        Returns:
+            `False` if there is no snapshot which matches the events. The events
+            have to be replayed in that case.
+        """
+
+        if not snapshot or not tracker.recreate_from_snapshot(evts, snapshot):
+            return False
+
+        logger.debug(
+            f"Recreated tracker for sender id '{tracker.sender_id}' from snapshot "
+            f"at event {snapshot['event_offset']} of {len(evts)}."
+        )
+
+        if self.check_snapshot_consistency:
+            self._check_snapshot_consistency(tracker, evts)
+
+        return True
+
+    def _check_snapshot_consistency(
+        self, tracker: DialogueStateTracker, evts: List[Event]
+    ) -> None:
+        """Compares a tracker restored from a snapshot to a full replay of `evts`."""
+
+        replayed = DialogueStateTracker.from_events(
+            tracker.sender_id,
+            evts,
+            self.domain.slots if self.domain else None,
+            tracker.events.maxlen,
+        )
+
+        if (
+            tracker.current_state(EventVerbosity.ALL)
+            != replayed.current_state(EventVerbosity.ALL)
+            or tracker.latest_message != replayed.latest_message
+            or tracker.latest_bot_utterance != replayed.latest_bot_utterance
+        ):
+            raise InconsistentTrackerSnapshot(
+                f"The tracker for sender id '{tracker.sender_id}' which was restored "
+                f"from a snapshot differs from the tracker which is recreated by "
+                f"replaying all of its events."
+            )
+
+    def _tracker_from_dict(
+        self,
+        sender_id: Text,
+        events_as_dict: List[Dict[Text, Any]],
+        snapshot: Optional[Dict[Text, Any]] = None,
+    ) -> DialogueStateTracker:
+        """Creates a tracker from stored events and an optional snapshot."""
+
+        evts = deserialise_events(events_as_dict)
+        tracker = DialogueStateTracker(sender_id, self.domain.slots)
+        if self._recreate_from_snapshot(tracker, evts, snapshot):
+            return tracker
+
+        return DialogueStateTracker.from_events(sender_id, evts, self.domain.slots)
+
     @staticmethod
     def _deserialise_dialogue_from_pickle(
         sender_id: Text, serialised_tracker: bytes
@@ -203,33 +621,41 @@ class TrackerStore:
         if not tracker:
             return None
 
+        snapshot = None
         try:
-            dialogue = Dialogue.from_parameters(json.loads(serialised_tracker))
+            serialised = json.loads(serialised_tracker)
+            dialogue = Dialogue.from_parameters(serialised)
+            snapshot = serialised.get("snapshot")
         except UnicodeDecodeError:
             dialogue = self._deserialise_dialogue_from_pickle(
                 sender_id, serialised_tracker
             )
 
-        tracker.recreate_from_dialogue(dialogue)
+        if not self._recreate_from_snapshot(tracker, dialogue.events, snapshot):
+            tracker.recreate_from_dialogue(dialogue)
 
-        return tracker
+        return self._mark_as_persisted(tracker)
 
 
 class InMemoryTrackerStore(TrackerStore):
     """Stores conversation history in memory"""
 
     def __init__(
-        self, domain: Domain, event_broker: Optional[EventBroker] = None
+        self,
+        domain: Domain,
+        event_broker: Optional[EventBroker] = None,
+        snapshot_interval: Optional[int] = None,
     ) -> None:
         self.store = {}
-        super().__init__(domain, event_broker)
+        super().__init__(domain, event_broker, snapshot_interval=snapshot_interval)
 
     def save(self, tracker: DialogueStateTracker) -> None:
         """Updates and saves the current conversation state"""
         if self.event_broker:
             self.stream_events(tracker)
-        serialised = InMemoryTrackerStore.serialise_tracker(tracker)
+        serialised = self._serialise_tracker_with_snapshot(tracker)
         self.store[tracker.sender_id] = serialised
+        self._mark_as_persisted(tracker)
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """
@@ -250,6 +676,32 @@ class InMemoryTrackerStore(TrackerStore):
         """Returns sender_ids of the Tracker Store in memory"""
         return self.store.keys()
 
+    # the in-memory store doesn't do any I/O, so it can be called from the event loop
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        self.save(tracker)
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        return self.retrieve(sender_id)
+
+    async def retrieve_events_async(
+        self,
+        sender_id: Text,
+        after_timestamp: Optional[float] = None,
+        until_timestamp: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        return self.retrieve_events(sender_id, after_timestamp, until_timestamp, limit)
+
+    async def number_of_existing_events_async(self, sender_id: Text) -> int:
+        return self.number_of_existing_events(sender_id)
+
+    async def stored_version_async(self, sender_id: Text) -> StoredVersion:
+        return self.stored_version(sender_id)
+
+    async def keys_async(self) -> Iterable[Text]:
+        return self.keys()
+
 
 class RedisTrackerStore(TrackerStore):
     """Stores conversation history in Redis"""
@@ -264,14 +716,35 @@ class RedisTrackerStore(TrackerStore):
         event_broker: Optional[EventBroker] = None,
         record_exp: Optional[float] = None,
         use_ssl: bool = False,
+        snapshot_interval: Optional[int] = None,
+        use_event_lists: bool = False,
+        key_prefix: Text = DEFAULT_REDIS_KEY_PREFIX,
     ):
+        """Create a `RedisTrackerStore`.
+
+        Args:
+            use_event_lists: If `True`, the events of a conversation are stored in
+                a Redis list to which new events are appended, instead of storing
+                the whole serialised conversation under the conversation ID.
+                Conversations which are stored in the old format are migrated
+                when they are retrieved.
+            key_prefix: Prefix of the keys used if `use_event_lists` is `True`.
+        """
         import redis
 
         self.red = redis.StrictRedis(
             host=host, port=port, db=db, password=password, ssl=use_ssl
         )
         self.record_exp = record_exp
-        super().__init__(domain, event_broker)
+        self.use_event_lists = use_event_lists
+        self.key_prefix = key_prefix
+        super().__init__(domain, event_broker, snapshot_interval=snapshot_interval)
+
+    def _events_key(self, sender_id: Text) -> Text:
+        return f"{self.key_prefix}events:{sender_id}"
+
+    def _metadata_key(self, sender_id: Text) -> Text:
+        return f"{self.key_prefix}metadata:{sender_id}"
 
     def save(self, tracker, timeout=None):
         """Saves the current conversation state"""
@@ -281,8 +754,49 @@ class RedisTrackerStore(TrackerStore):
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(tracker.sender_id, serialised_tracker, ex=timeout)
+        if self.use_event_lists:
+            self._append_events(tracker, timeout)
+        else:
+            serialised_tracker = self._serialise_tracker_with_snapshot(tracker)
+            self.red.set(tracker.sender_id, serialised_tracker, ex=timeout)
+        self._mark_as_persisted(tracker)
+
+    def _append_events(
+        self, tracker: DialogueStateTracker, timeout: Optional[float]
+    ) -> None:
+        """Appends the events which aren't stored yet to the conversation's list.
+
+        All writes are sent in a single round trip. The events only have to be
+        counted first if the tracker doesn't know how many of them are stored.
+        """
+        events_key = self._events_key(tracker.sender_id)
+        metadata_key = self._metadata_key(tracker.sender_id)
+
+        number_of_stored_events = tracker.persisted_event_count
+        if number_of_stored_events is None:
+            number_of_stored_events = self.red.llen(events_key)
+
+        new_events = list(
+            itertools.islice(
+                tracker.events, number_of_stored_events, len(tracker.events)
+            )
+        )
+
+        pipeline = self.red.pipeline()
+        if new_events:
+            pipeline.rpush(
+                events_key, *[json.dumps(event.as_dict()) for event in new_events]
+            )
+        pipeline.hset(metadata_key, "sender_id", tracker.sender_id)
+
+        snapshot = self._snapshot_to_persist(tracker, number_of_stored_events)
+        if snapshot:
+            pipeline.hset(metadata_key, "snapshot", json.dumps(snapshot))
+
+        if timeout:
+            pipeline.expire(events_key, int(timeout))
+            pipeline.expire(metadata_key, int(timeout))
+        pipeline.execute()
 
     def retrieve(self, sender_id):
         """
@@ -292,15 +806,132 @@ class RedisTrackerStore(TrackerStore):
         Returns:
             DialogueStateTracker
         """
+        if self.use_event_lists:
+            return self._retrieve_from_event_list(sender_id)
+
         stored = self.red.get(sender_id)
         if stored is not None:
             return self.deserialise_tracker(sender_id, stored)
         else:
             return None
 
+    def _retrieve_from_event_list(
+        self, sender_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        pipeline = self.red.pipeline()
+        pipeline.hget(self._metadata_key(sender_id), "sender_id")
+        pipeline.lrange(self._events_key(sender_id), 0, -1)
+        pipeline.hget(self._metadata_key(sender_id), "snapshot")
+        stored_sender_id, stored_events, stored_snapshot = pipeline.execute()
+
+        if stored_sender_id is None:
+            return self._migrate_to_event_list(sender_id)
+
+        events = [json.loads(event) for event in stored_events]
+        snapshot = json.loads(stored_snapshot) if stored_snapshot else None
+
+        return self._mark_as_persisted(
+            self._tracker_from_dict(sender_id, events, snapshot)
+        )
+
+    def _migrate_to_event_list(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Moves a conversation which is stored in the old format to an event list.
+
+        Returns:
+            The migrated tracker or `None` if there is no conversation stored in the
+            old format.
+        """
+        stored = self.red.get(sender_id)
+        if stored is None:
+            return None
+
+        tracker = self.deserialise_tracker(sender_id, stored)
+        if tracker is None:
+            return None
+
+        logger.debug(f"Migrating tracker for '{sender_id}' to an event list.")
+        # keep the expiry of the old record
+        ttl = self.red.ttl(sender_id)
+
+        events_key = self._events_key(sender_id)
+        metadata_key = self._metadata_key(sender_id)
+        pipeline = self.red.pipeline()
+        pipeline.delete(events_key, metadata_key)
+        if tracker.events:
+            pipeline.rpush(
+                events_key, *[json.dumps(event.as_dict()) for event in tracker.events]
+            )
+        pipeline.hset(metadata_key, "sender_id", sender_id)
+        if ttl is not None and ttl > 0:
+            pipeline.expire(events_key, ttl)
+            pipeline.expire(metadata_key, ttl)
+        pipeline.delete(sender_id)
+        pipeline.execute()
+
+        return self._mark_as_persisted(tracker)
+
+    def migrate_to_event_lists(self) -> int:
+        """Migrates all conversations which are stored in the old format.
+
+        Returns:
+            The number of migrated conversations.
+        """
+        migrated = 0
+        for sender_id in self._legacy_keys():
+            try:
+                if self._migrate_to_event_list(sender_id):
+                    migrated += 1
+            except Exception as e:
+                logger.warning(f"Could not migrate key '{sender_id}': {e}")
+
+        return migrated
+
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        if self.use_event_lists and self.red.exists(self._metadata_key(sender_id)):
+            return self.red.llen(self._events_key(sender_id))
+
+        return super().number_of_existing_events(sender_id)
+
+    def stored_version(self, sender_id: Text) -> StoredVersion:
+        """Returns the version of the stored conversation for a given sender id."""
+        if self.use_event_lists and self.red.exists(self._metadata_key(sender_id)):
+            pipeline = self.red.pipeline()
+            pipeline.llen(self._events_key(sender_id))
+            pipeline.lindex(self._events_key(sender_id), -1)
+            number_of_events, last_event = pipeline.execute()
+
+            last_timestamp = json.loads(last_event)["timestamp"] if last_event else None
+            return number_of_events, last_timestamp
+
+        return super().stored_version(sender_id)
+
     def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store"""
-        return self.red.keys()
+        if not self.use_event_lists:
+            return list(self._decoded_keys())
+
+        # every stored conversation has a metadata hash, even if it has no events
+        metadata_prefix = self._metadata_key("")
+        sender_ids = {
+            key[len(metadata_prefix) :]
+            for key in self._decoded_keys(f"{metadata_prefix}*")
+        }
+        # conversations which weren't migrated yet
+        sender_ids.update(self._legacy_keys())
+
+        return list(sender_ids)
+
+    def _legacy_keys(self) -> Iterator[Text]:
+        """Returns the keys of conversations which are stored in the old format."""
+        for key in self._decoded_keys():
+            if not key.startswith(self.key_prefix):
+                yield key
+
+    def _decoded_keys(self, pattern: Optional[Text] = None) -> Iterator[Text]:
+        # `SCAN` doesn't block Redis like `KEYS` does for large databases
+        for key in self.red.scan_iter(match=pattern, count=REDIS_SCAN_COUNT):
+            yield key.decode(DEFAULT_ENCODING) if isinstance(key, bytes) else key
 
 
 class DynamoTrackerStore(TrackerStore):
@@ -312,6 +943,7 @@ class DynamoTrackerStore(TrackerStore):
         table_name: Text = "states",
         region: Text = "us-east-1",
         event_broker: Optional[EndpointConfig] = None,
+        snapshot_interval: Optional[int] = None,
     ):
         """Initialize `DynamoTrackerStore`.
 
@@ -322,14 +954,35 @@ class DynamoTrackerStore(TrackerStore):
             region: The name of the region associated with the client.
                 A client is associated with a single region.
             event_broker: An event broker used to publish events.
+            snapshot_interval: Interval (in events) in which snapshots of the
+                tracker state are stored.
         """
         import boto3
 
         self.client = boto3.client("dynamodb", region_name=region)
         self.region = region
         self.table_name = table_name
-        self.db = self.get_or_create_table(table_name)
-        super().__init__(domain, event_broker)
+        self._tables = threading.local()
+        self._tables.table = self.get_or_create_table(table_name)
+        super().__init__(domain, event_broker, snapshot_interval=snapshot_interval)
+
+    @property
+    def db(self) -> "boto3.resources.factory.dynamodb.Table":
+        """Returns the table resource of the current thread.
+
+        boto3 resources are not thread-safe, but the blocking methods of the tracker
+        store are run in a thread pool (see `TrackerStore.save_async`).
+        """
+        table = getattr(self._tables, "table", None)
+        if table is None:
+            import boto3
+
+            dynamo = boto3.session.Session().resource(
+                "dynamodb", region_name=self.region
+            )
+            table = self._tables.table = dynamo.Table(self.table_name)
+
+        return table
 
     def get_or_create_table(
         self, table_name: Text
@@ -363,6 +1016,7 @@ class DynamoTrackerStore(TrackerStore):
         if self.event_broker:
             self.stream_events(tracker)
         self.db.put_item(Item=self.serialise_tracker(tracker))
+        self._mark_as_persisted(tracker)
 
     def serialise_tracker(self, tracker: "DialogueStateTracker") -> Dict:
         """Serializes the tracker, returns object with decimal types"""
@@ -373,6 +1027,9 @@ class DynamoTrackerStore(TrackerStore):
                 "session_date": int(datetime.now(tz=timezone.utc).timestamp()),
             }
         )
+        snapshot = self._snapshot_to_persist(tracker)
+        if snapshot:
+            d["snapshot"] = snapshot
         # DynamoDB cannot store `float`s, so we'll convert them to `Decimal`s
         return core_utils.replace_floats_with_decimals(d)
 
@@ -390,12 +1047,15 @@ class DynamoTrackerStore(TrackerStore):
             return None
 
         events = dialogues[0].get("events", [])
+        snapshot = dialogues[0].get("snapshot")
 
         # `float`s are stored as `Decimal` objects - we need to convert them back
         events_with_floats = core_utils.replace_decimals_with_floats(events)
+        if snapshot:
+            snapshot = core_utils.replace_decimals_with_floats(snapshot)
 
-        return DialogueStateTracker.from_dict(
-            sender_id, events_with_floats, self.domain.slots
+        return self._mark_as_persisted(
+            self._tracker_from_dict(sender_id, events_with_floats, snapshot)
         )
 
     def keys(self) -> Iterable[Text]:
@@ -424,6 +1084,7 @@ class MongoTrackerStore(TrackerStore):
         auth_source: Optional[Text] = "admin",
         collection: Optional[Text] = "conversations",
         event_broker: Optional[EventBroker] = None,
+        snapshot_interval: Optional[int] = None,
     ):
         from pymongo.database import Database
         from pymongo import MongoClient
@@ -439,7 +1100,7 @@ class MongoTrackerStore(TrackerStore):
 
         self.db = Database(self.client, db)
         self.collection = collection
-        super().__init__(domain, event_broker)
+        super().__init__(domain, event_broker, snapshot_interval=snapshot_interval)
 
         self._ensure_indices()
 
@@ -466,18 +1127,21 @@ class MongoTrackerStore(TrackerStore):
         if self.event_broker:
             self.stream_events(tracker)
 
-        additional_events = self._additional_events(tracker)
+        additional_events = [e.as_dict() for e in self._additional_events(tracker)]
+
+        state = self._current_tracker_state_without_events(tracker)
+        snapshot = self._snapshot_to_persist(
+            tracker, len(tracker.events) - len(additional_events)
+        )
+        if snapshot:
+            state["snapshot"] = snapshot
 
         self.conversations.update_one(
             {"sender_id": tracker.sender_id},
-            {
-                "$set": self._current_tracker_state_without_events(tracker),
-                "$push": {
-                    "events": {"$each": [e.as_dict() for e in additional_events]}
-                },
-            },
+            {"$set": state, "$push": {"events": {"$each": additional_events}}},
             upsert=True,
         )
+        self._mark_as_persisted(tracker)
 
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
@@ -490,14 +1154,16 @@ class MongoTrackerStore(TrackerStore):
 
         """
 
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
-        )
+        number_of_stored_events = tracker.persisted_event_count
+        if number_of_stored_events is None:
+            stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
+            all_events = self._events_from_serialized_tracker(stored)
+            number_of_stored_events = len(
+                self._events_since_last_session_start(all_events)
+            )
 
         return itertools.islice(
-            tracker.events, number_events_since_last_session, len(tracker.events)
+            tracker.events, number_of_stored_events, len(tracker.events)
         )
 
     @staticmethod
@@ -553,12 +1219,121 @@ class MongoTrackerStore(TrackerStore):
         if not self.load_events_from_previous_conversation_sessions:
             events = self._events_since_last_session_start(events)
 
-        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        return self._mark_as_persisted(
+            self._tracker_from_dict(sender_id, events, stored.get("snapshot"))
+        )
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store"""
         return [c["sender_id"] for c in self.conversations.find()]
 
+    def retrieve_events(
+        self,
+        sender_id: Text,
+        after_timestamp: Optional[float] = None,
+        until_timestamp: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """Retrieves the events of a conversation within a time range.
+
+        The events are selected by Mongo. See `TrackerStore.retrieve_events` for
+        the arguments.
+        """
+        conditions = []
+        if not self.load_events_from_previous_conversation_sessions:
+            # `$max` of no session starts is `null`, which is less than any timestamp
+            conditions.append({"$gte": ["$$event.timestamp", "$session_start"]})
+        if after_timestamp is not None:
+            conditions.append({"$gt": ["$$event.timestamp", after_timestamp]})
+        if until_timestamp is not None:
+            conditions.append({"$lte": ["$$event.timestamp", until_timestamp]})
+
+        events = {
+            "$filter": {
+                "input": "$events",
+                "as": "event",
+                "cond": {"$and": conditions},
+            }
+        }
+        if limit is not None:
+            events = {"$slice": [events, limit]}
+
+        pipeline = [
+            {"$match": {"sender_id": sender_id}},
+            {
+                "$project": {
+                    "events": 1,
+                    "session_starts": {
+                        "$filter": {
+                            "input": "$events",
+                            "as": "event",
+                            "cond": {
+                                "$eq": ["$$event.event", SessionStarted.type_name]
+                            },
+                        }
+                    },
+                }
+            },
+            {
+                "$project": {
+                    "events": 1,
+                    "session_start": {"$max": "$session_starts.timestamp"},
+                }
+            },
+            {"$project": {"_id": 0, "events": events}},
+        ]
+
+        stored = list(self.conversations.aggregate(pipeline))
+        if not stored:
+            return []
+
+        return deserialise_events(stored[0]["events"])
+
+    def retrieve_serialised_events(
+        self,
+        conversation_ids: Optional[Iterable[Text]] = None,
+        minimum_timestamp: Optional[float] = None,
+        maximum_timestamp: Optional[float] = None,
+    ) -> Iterator[Dict[Text, Any]]:
+        """Retrieves the serialised events of multiple conversations in a time range.
+
+        The events are filtered and sorted by Mongo. See
+        `TrackerStore.retrieve_serialised_events` for the arguments.
+        """
+        conditions = []
+        if minimum_timestamp is not None:
+            conditions.append({"$gte": ["$$event.timestamp", minimum_timestamp]})
+        if maximum_timestamp is not None:
+            conditions.append({"$lt": ["$$event.timestamp", maximum_timestamp]})
+
+        pipeline = []
+        if conversation_ids is not None:
+            pipeline.append({"$match": {"sender_id": {"$in": list(conversation_ids)}}})
+        pipeline += [
+            {
+                "$project": {
+                    "sender_id": 1,
+                    "events": {
+                        "$filter": {
+                            "input": "$events",
+                            "as": "event",
+                            "cond": {"$and": conditions},
+                        }
+                    },
+                }
+            },
+            {"$unwind": {"path": "$events", "includeArrayIndex": "event_index"}},
+            # keep the order of events with the same timestamp
+            {"$sort": {"events.timestamp": 1, "sender_id": 1, "event_index": 1}},
+        ]
+
+        for stored in self.conversations.aggregate(
+            pipeline, allowDiskUse=True, batchSize=EVENT_STREAM_BATCH_SIZE
+        ):
+            event = stored["events"]
+            event["sender_id"] = stored["sender_id"]
+            yield event
+
 
 def _create_sequence(table_name: Text) -> "Sequence":
     """Creates a sequence object for a specific table name.
@@ -675,6 +1450,14 @@ class SQLTrackerStore(TrackerStore):
         action_name = sa.Column(sa.String(255))
         data = sa.Column(sa.Text)
 
+    class SQLTrackerSnapshot(Base):
+        """Represents the latest snapshot of a tracker in the SQL Tracker Store"""
+
+        __tablename__ = "tracker_snapshots"
+
+        sender_id = sa.Column(sa.String(255), primary_key=True)
+        data = sa.Column(sa.Text)
+
     def __init__(
         self,
         domain: Optional[Domain] = None,
@@ -687,6 +1470,8 @@ class SQLTrackerStore(TrackerStore):
         event_broker: Optional[EventBroker] = None,
         login_db: Optional[Text] = None,
         query: Optional[Dict] = None,
+        snapshot_interval: Optional[int] = None,
+        create_session_index: bool = False,
     ) -> None:
         import sqlalchemy.exc
 
@@ -721,6 +1506,9 @@ class SQLTrackerStore(TrackerStore):
                     # the first services finishes the table creation.
                     logger.error(f"Could not create tables: {e}")
 
+                if create_session_index:
+                    self._create_session_index()
+
                 self.sessionmaker = sa.orm.session.sessionmaker(bind=self.engine)
                 break
             except (
@@ -733,7 +1521,40 @@ class SQLTrackerStore(TrackerStore):
 
         logger.debug(f"Connection to SQL database '{db}' successful.")
 
-        super().__init__(domain, event_broker)
+        super().__init__(domain, event_broker, snapshot_interval=snapshot_interval)
+
+    def _create_session_index(self) -> None:
+        """Create composite indices which speed up retrieving conversations.
+
+        The index on `(sender_id, type_name, timestamp)` covers what the
+        `SessionStarted` subquery of `_event_query` filters and aggregates on. The
+        index on `(sender_id, timestamp)` covers the time ranges of
+        `retrieve_events`.
+        """
+        self._create_index(
+            "ix_events_sender_id_type_name_timestamp",
+            ["sender_id", "type_name", "timestamp"],
+        )
+        self._create_index("ix_events_sender_id_timestamp", ["sender_id", "timestamp"])
+
+    def _create_index(self, index_name: Text, column_names: List[Text]) -> None:
+        """Create an index on the events table if it doesn't exist yet."""
+        import sqlalchemy.exc
+
+        table_name = self.SQLEvent.__tablename__
+        existing_indices = sa.inspect(self.engine).get_indexes(table_name)
+        if any(index["name"] == index_name for index in existing_indices):
+            return
+
+        # build the index on a copy of the table so that it doesn't become part of
+        # the shared metadata which is used by every `SQLTrackerStore`
+        table = self.SQLEvent.__table__.tometadata(sa.MetaData())
+        index = sa.Index(index_name, *[table.c[name] for name in column_names])
+        try:
+            index.create(self.engine)
+        except (sqlalchemy.exc.OperationalError, sqlalchemy.exc.ProgrammingError) as e:
+            # the index might have been created by another service in the meantime
+            logger.error(f"Could not create index '{index_name}': {e}")
 
     @staticmethod
     def get_db_url(
@@ -836,12 +1657,73 @@ class SQLTrackerStore(TrackerStore):
         finally:
             session.close()
 
+    def _run_in_thread(self, func: Callable, *args: Any) -> Awaitable:
+        url = self.engine.url
+        in_memory_databases = (None, "", ":memory:")
+        if url.get_backend_name() == "sqlite" and url.database in in_memory_databases:
+            # every thread has its own connection to an in-memory SQLite database and
+            # hence its own database, so the calls have to stay in the current thread
+            return _call_in_current_thread(func, *args)
+
+        return super()._run_in_thread(func, *args)
+
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the SQLTrackerStore"""
         with self.session_scope() as session:
             sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
             return [sender_id for (sender_id,) in sender_ids]
 
+    def retrieve_events(
+        self,
+        sender_id: Text,
+        after_timestamp: Optional[float] = None,
+        until_timestamp: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """Retrieves the events of a conversation within a time range.
+
+        The events are selected by the database. See `TrackerStore.retrieve_events`
+        for the arguments.
+        """
+        with self.session_scope() as session:
+            query = self._event_query(session, sender_id)
+            if after_timestamp is not None:
+                query = query.filter(self.SQLEvent.timestamp > after_timestamp)
+            if until_timestamp is not None:
+                query = query.filter(self.SQLEvent.timestamp <= until_timestamp)
+            if limit is not None:
+                query = query.limit(limit)
+
+            return deserialise_events([json.loads(event.data) for event in query])
+
+    def retrieve_serialised_events(
+        self,
+        conversation_ids: Optional[Iterable[Text]] = None,
+        minimum_timestamp: Optional[float] = None,
+        maximum_timestamp: Optional[float] = None,
+    ) -> Iterator[Dict[Text, Any]]:
+        """Retrieves the serialised events of multiple conversations in a time range.
+
+        The events are filtered and sorted by the database and fetched in batches.
+        See `TrackerStore.retrieve_serialised_events` for the arguments.
+        """
+        with self.session_scope() as session:
+            query = session.query(self.SQLEvent.sender_id, self.SQLEvent.data)
+            if conversation_ids is not None:
+                query = query.filter(
+                    self.SQLEvent.sender_id.in_(list(conversation_ids))
+                )
+            if minimum_timestamp is not None:
+                query = query.filter(self.SQLEvent.timestamp >= minimum_timestamp)
+            if maximum_timestamp is not None:
+                query = query.filter(self.SQLEvent.timestamp < maximum_timestamp)
+
+            query = query.order_by(self.SQLEvent.timestamp, self.SQLEvent.id)
+            for sender_id, data in query.yield_per(EVENT_STREAM_BATCH_SIZE):
+                event = json.loads(data)
+                event["sender_id"] = sender_id
+                yield event
+
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Create a tracker from all previously stored events."""
 
@@ -853,8 +1735,10 @@ class SQLTrackerStore(TrackerStore):
 
             if self.domain and len(events) > 0:
                 logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
-                    sender_id, events, self.domain.slots
+                return self._mark_as_persisted(
+                    self._tracker_from_dict(
+                        sender_id, events, self._stored_snapshot(session, sender_id)
+                    )
                 )
             else:
                 logger.debug(
@@ -864,6 +1748,21 @@ class SQLTrackerStore(TrackerStore):
                 )
                 return None
 
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+
+        with self.session_scope() as session:
+            return self._event_query(session, sender_id).count()
+
+    def stored_version(self, sender_id: Text) -> StoredVersion:
+        """Returns the version of the stored conversation for a given sender id."""
+
+        with self.session_scope() as session:
+            query = self._event_query(session, sender_id)
+            last_event = query.order_by(None).order_by(self.SQLEvent.id.desc()).first()
+
+            return query.count(), last_event.timestamp if last_event else None
+
     def _event_query(self, session: "Session", sender_id: Text) -> "Query":
         """Provide the query to retrieve the conversation events for a specific sender.
 
@@ -899,6 +1798,17 @@ class SQLTrackerStore(TrackerStore):
 
         return event_query.order_by(self.SQLEvent.timestamp)
 
+    def _stored_snapshot(
+        self, session: "Session", sender_id: Text
+    ) -> Optional[Dict[Text, Any]]:
+        """Returns the latest stored snapshot of the tracker for `sender_id`."""
+
+        if not self.snapshot_interval:
+            return None
+
+        snapshot = session.query(self.SQLTrackerSnapshot).get(sender_id)
+        return json.loads(snapshot.data) if snapshot else None
+
     def save(self, tracker: DialogueStateTracker) -> None:
         """Update database with events from the current conversation."""
 
@@ -907,41 +1817,64 @@ class SQLTrackerStore(TrackerStore):
 
         with self.session_scope() as session:
             # only store recent events
-            events = self._additional_events(session, tracker)
+            events = list(self._additional_events(session, tracker))
 
-            for event in events:
-                data = event.as_dict()
-                intent = (
-                    data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
+            if events:
+                # insert all new events with a single `executemany`
+                session.execute(
+                    self.SQLEvent.__table__.insert(),
+                    [self._event_row(tracker.sender_id, event) for event in events],
                 )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
+
+            snapshot = self._snapshot_to_persist(
+                tracker, len(tracker.events) - len(events)
+            )
+            if snapshot:
+                session.merge(
+                    self.SQLTrackerSnapshot(
+                        sender_id=tracker.sender_id, data=json.dumps(snapshot)
                     )
                 )
             session.commit()
 
+        self._mark_as_persisted(tracker)
+
         logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
 
+    @staticmethod
+    def _event_row(sender_id: Text, event: Event) -> Dict[Text, Any]:
+        """Returns the column values of the stored `event`."""
+
+        data = event.as_dict()
+        return {
+            "sender_id": sender_id,
+            "type_name": event.type_name,
+            "timestamp": data.get("timestamp"),
+            "intent_name": (
+                data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
+            ),
+            "action_name": data.get("name"),
+            "data": json.dumps(data),
+        }
+
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
     ) -> Iterator:
-        """Return events from the tracker which aren't currently stored."""
+        """Return events from the tracker which aren't currently stored.
+
+        Trackers which were retrieved from or saved to this store remember how many
+        of their events are persisted (see `_mark_as_persisted`). The stored events
+        only have to be counted for other trackers.
+        """
+
+        number_of_stored_events = tracker.persisted_event_count
+        if number_of_stored_events is None:
+            number_of_stored_events = self._event_query(
+                session, tracker.sender_id
+            ).count()
 
-        number_of_events_since_last_session = self._event_query(
-            session, tracker.sender_id
-        ).count()
         return itertools.islice(
-            tracker.events, number_of_events_since_last_session, len(tracker.events)
+            tracker.events, number_of_stored_events, len(tracker.events)
         )
 
 
@@ -980,6 +1913,11 @@ class FailSafeTrackerStore(TrackerStore):
         if self._fallback_tracker_store:
             self._fallback_tracker_store.domain = domain
 
+    @property
+    def tracker_store(self) -> TrackerStore:
+        """Returns the primary tracker store."""
+        return self._tracker_store
+
     @property
     def fallback_tracker_store(self) -> TrackerStore:
         if not self._fallback_tracker_store:
@@ -1014,12 +1952,343 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             return []
 
+    def retrieve_events(
+        self,
+        sender_id: Text,
+        after_timestamp: Optional[float] = None,
+        until_timestamp: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        try:
+            return self._tracker_store.retrieve_events(
+                sender_id, after_timestamp, until_timestamp, limit
+            )
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return []
+
+    async def retrieve_events_async(
+        self,
+        sender_id: Text,
+        after_timestamp: Optional[float] = None,
+        until_timestamp: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        try:
+            return await self._tracker_store.retrieve_events_async(
+                sender_id, after_timestamp, until_timestamp, limit
+            )
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return []
+
+    def retrieve_serialised_events(
+        self,
+        conversation_ids: Optional[Iterable[Text]] = None,
+        minimum_timestamp: Optional[float] = None,
+        maximum_timestamp: Optional[float] = None,
+    ) -> Iterator[Dict[Text, Any]]:
+        return self._tracker_store.retrieve_serialised_events(
+            conversation_ids, minimum_timestamp, maximum_timestamp
+        )
+
     def save(self, tracker: DialogueStateTracker) -> None:
         try:
             self._tracker_store.save(tracker)
         except Exception as e:
             self.on_tracker_store_error(e)
             self.fallback_tracker_store.save(tracker)
+            if tracker is not None:
+                # the events are missing in the primary tracker store
+                tracker.persisted_event_count = None
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        try:
+            return await self._tracker_store.retrieve_async(sender_id)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return None
+
+    async def keys_async(self) -> Iterable[Text]:
+        try:
+            return await self._tracker_store.keys_async()
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return []
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        try:
+            await self._tracker_store.save_async(tracker)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            await self.fallback_tracker_store.save_async(tracker)
+            if tracker is not None:
+                # the events are missing in the primary tracker store
+                tracker.persisted_event_count = None
+
+
+class TrackerCacheStatistics:
+    """Counts how often a `CachedTrackerStore` could use its cached trackers."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        # cached trackers which had expired or were outdated
+        self.stale = 0
+        # cached trackers which were dropped because the cache was full
+        self.evictions = 0
+
+    def as_dict(self) -> Dict[Text, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+        }
+
+
+class CachedTrackerStore(TrackerStore):
+    """Wraps a tracker store and keeps the recently saved trackers in memory.
+
+    Trackers are written through to the wrapped tracker store. Retrieving a cached
+    tracker skips loading and replaying its events. A cached tracker is only handed
+    out to a single caller: it is removed from the cache when it is retrieved and
+    cached again when it is saved. Trackers which were changed but not saved are
+    never used, and neither are trackers which are older than `ttl` seconds.
+
+    If conversations are not pinned to a single Rasa server, other servers might
+    update a conversation in the meantime. With `validate` enabled, a cached
+    tracker is only used if the wrapped tracker store still holds the same version
+    of the conversation, i.e. the same number of events and the same timestamp of
+    the last event (see `TrackerStore.stored_version`). This is cheap to check for
+    the `SQLTrackerStore` and for the `RedisTrackerStore` with `use_event_lists`.
+    """
+
+    def __init__(
+        self,
+        tracker_store: TrackerStore,
+        max_size: int = DEFAULT_TRACKER_CACHE_SIZE,
+        ttl: float = DEFAULT_TRACKER_CACHE_TTL,
+        validate: bool = True,
+        statistics: Optional[TrackerCacheStatistics] = None,
+    ) -> None:
+        """Create a `CachedTrackerStore`.
+
+        Args:
+            tracker_store: The tracker store which persists the trackers.
+            max_size: Maximum number of cached trackers. The least recently saved
+                trackers are dropped first.
+            ttl: Number of seconds for which a saved tracker is kept.
+            validate: Whether to check if a cached tracker is still up to date
+                before it is used.
+            statistics: Collects the number of cache hits and misses.
+        """
+        self._tracker_store = tracker_store
+        self.max_size = max(int(max_size), 1)
+        self.ttl = ttl
+        self.validate = validate
+        self.statistics = statistics or TrackerCacheStatistics()
+        self._cache: "OrderedDict[Text, Tuple[DialogueStateTracker, float]]" = (
+            OrderedDict()
+        )
+
+        super().__init__(tracker_store.domain, tracker_store.event_broker)
+
+    @property
+    def domain(self) -> Optional[Domain]:
+        return self._tracker_store.domain
+
+    @domain.setter
+    def domain(self, domain: Optional[Domain]) -> None:
+        self._tracker_store.domain = domain
+
+    @property
+    def tracker_store(self) -> TrackerStore:
+        """Returns the wrapped tracker store."""
+        return self._tracker_store
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _take_from_cache(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        cached = self._cache.pop(sender_id, None)
+        if cached is None:
+            return None
+
+        tracker, expires_at = cached
+        has_expired = time.time() > expires_at
+        # trackers which were changed without saving them have unpersisted events
+        was_changed = tracker.persisted_event_count != len(tracker.events)
+        if has_expired or was_changed:
+            self.statistics.stale += 1
+            return None
+
+        return tracker
+
+    def _use_if_up_to_date(
+        self, tracker: DialogueStateTracker, stored_version: StoredVersion
+    ) -> Optional[DialogueStateTracker]:
+        if stored_version != _version_of_tracker(tracker):
+            logger.debug(
+                f"Cached tracker for conversation '{tracker.sender_id}' is outdated."
+            )
+            self.statistics.stale += 1
+            return None
+
+        return tracker
+
+    def _add_to_cache(self, tracker: DialogueStateTracker) -> None:
+        # all events are stored now
+        self._mark_as_persisted(tracker)
+
+        self._cache.pop(tracker.sender_id, None)
+        self._cache[tracker.sender_id] = (tracker, time.time() + self.ttl)
+
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+            self.statistics.evictions += 1
+
+    def _count_hit_or_miss(self, tracker: Optional[DialogueStateTracker]) -> bool:
+        if tracker is None:
+            self.statistics.misses += 1
+            return False
+
+        self.statistics.hits += 1
+        return True
+
+    def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        tracker = self._take_from_cache(sender_id)
+        if tracker is not None and self.validate:
+            tracker = self._use_if_up_to_date(
+                tracker, self._tracker_store.stored_version(sender_id)
+            )
+
+        if self._count_hit_or_miss(tracker):
+            return tracker
+
+        return self._tracker_store.retrieve(sender_id)
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        tracker = self._take_from_cache(sender_id)
+        if tracker is not None and self.validate:
+            tracker = self._use_if_up_to_date(
+                tracker, await self._tracker_store.stored_version_async(sender_id)
+            )
+
+        if self._count_hit_or_miss(tracker):
+            return tracker
+
+        return await self._tracker_store.retrieve_async(sender_id)
+
+    def save(self, tracker: DialogueStateTracker) -> None:
+        self._tracker_store.save(tracker)
+        self._add_to_cache(tracker)
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        await self._tracker_store.save_async(tracker)
+        self._add_to_cache(tracker)
+
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        return self._tracker_store.number_of_existing_events(sender_id)
+
+    async def number_of_existing_events_async(self, sender_id: Text) -> int:
+        return await self._tracker_store.number_of_existing_events_async(sender_id)
+
+    def stored_version(self, sender_id: Text) -> StoredVersion:
+        return self._tracker_store.stored_version(sender_id)
+
+    async def stored_version_async(self, sender_id: Text) -> StoredVersion:
+        return await self._tracker_store.stored_version_async(sender_id)
+
+    def keys(self) -> Iterable[Text]:
+        return self._tracker_store.keys()
+
+    async def keys_async(self) -> Iterable[Text]:
+        return await self._tracker_store.keys_async()
+
+    def retrieve_events(
+        self,
+        sender_id: Text,
+        after_timestamp: Optional[float] = None,
+        until_timestamp: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        return self._tracker_store.retrieve_events(
+            sender_id, after_timestamp, until_timestamp, limit
+        )
+
+    async def retrieve_events_async(
+        self,
+        sender_id: Text,
+        after_timestamp: Optional[float] = None,
+        until_timestamp: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        return await self._tracker_store.retrieve_events_async(
+            sender_id, after_timestamp, until_timestamp, limit
+        )
+
+    def retrieve_serialised_events(
+        self,
+        conversation_ids: Optional[Iterable[Text]] = None,
+        minimum_timestamp: Optional[float] = None,
+        maximum_timestamp: Optional[float] = None,
+    ) -> Iterator[Dict[Text, Any]]:
+        return self._tracker_store.retrieve_serialised_events(
+            conversation_ids, minimum_timestamp, maximum_timestamp
+        )
+
+
+def _select_events(
+    events: Iterable[Event],
+    after_timestamp: Optional[float],
+    until_timestamp: Optional[float],
+    limit: Optional[int],
+) -> List[Event]:
+    """Selects the events within a time range, see `TrackerStore.retrieve_events`."""
+    selected = [
+        event
+        for event in events
+        if (after_timestamp is None or event.timestamp > after_timestamp)
+        and (until_timestamp is None or event.timestamp <= until_timestamp)
+    ]
+
+    return selected[:limit] if limit is not None else selected
+
+
+def _version_of_tracker(tracker: Optional[DialogueStateTracker]) -> StoredVersion:
+    """Returns the version of a conversation, see `TrackerStore.stored_version`."""
+    if not tracker or not tracker.events:
+        return 0, None
+
+    return len(tracker.events), tracker.events[-1].timestamp
+
+
+async def _call_in_current_thread(func: Callable, *args: Any) -> Any:
+    return func(*args)
+
+
+# events which are streamed by a call in the thread pool of a tracker store, see
+# `TrackerStore._run_in_thread`
+_deferred_events = threading.local()
+
+
+def _call_with_deferred_publishing(
+    func: Callable, *args: Any
+) -> Tuple[Any, List[Tuple[EventBroker, Dict[Text, Any]]]]:
+    _deferred_events.events = []
+    try:
+        return func(*args), _deferred_events.events
+    finally:
+        _deferred_events.events = None
+
+
+async def _publish_deferred_events(call: Awaitable) -> Any:
+    result, events = await call
+    for event_broker, event in events:
+        event_broker.publish(event)
+
+    return result
 
 
 def _create_from_endpoint_config(
@@ -1031,6 +2300,17 @@ def _create_from_endpoint_config(
 
     domain = domain or Domain.empty()
 
+    cache_kwargs = {}
+    if endpoint_config is not None:
+        # the cache settings aren't passed on to the tracker store
+        endpoint_config = copy.copy(endpoint_config)
+        endpoint_config.kwargs = dict(endpoint_config.kwargs)
+        cache_kwargs = {
+            key: endpoint_config.kwargs.pop(key)
+            for key in ("cache_size", "cache_ttl", "validate_cache")
+            if key in endpoint_config.kwargs
+        }
+
     if endpoint_config is None or endpoint_config.type is None:
         # default tracker store if no type is set
         tracker_store = InMemoryTrackerStore(domain, event_broker)
@@ -1066,6 +2346,14 @@ def _create_from_endpoint_config(
 
     logger.debug(f"Connected to {tracker_store.__class__.__name__}.")
 
+    if cache_kwargs.get("cache_size"):
+        tracker_store = CachedTrackerStore(
+            tracker_store,
+            max_size=cache_kwargs["cache_size"],
+            ttl=cache_kwargs.get("cache_ttl", DEFAULT_TRACKER_CACHE_TTL),
+            validate=cache_kwargs.get("validate_cache", True),
+        )
+
     return tracker_store
 
 
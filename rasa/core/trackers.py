@@ -1,5 +1,6 @@
 import copy
 import logging
+import weakref
 from collections import deque
 from enum import Enum
 from typing import (
@@ -14,6 +15,8 @@ from typing import (
     Deque,
     Iterable,
     Union,
+    FrozenSet,
+    Tuple,
 )
 
 from rasa.nlu.constants import (
@@ -77,12 +80,83 @@ class AnySlotDict(dict):
         return True
 
 
+class _StateHistory:
+    """Incrementally computed states of a tracker's history for one domain.
+
+    Applied events are appended as the tracker is updated and only replayed
+    once the states are requested. The history has to be discarded whenever
+    events change the already applied events retroactively (e.g. reverting
+    events or loop executions which undo previous events)."""
+
+    def __init__(self, tracker: "DialogueStateTracker", domain: Domain) -> None:
+        self._domain = weakref.ref(domain)
+        self.form_names = {
+            event.name
+            for event in tracker.events
+            if isinstance(event, Form) and event.name
+        }
+        self.applied_events = tracker.applied_events()
+        self._pending_events = list(self.applied_events)
+        self._replay_tracker = tracker.init_copy()
+        self._states: List[FrozenSet[Tuple[Text, float]]] = []
+
+    def is_for(self, domain: Domain) -> bool:
+        return self._domain() is domain
+
+    def can_append(self, event: Event, tracker: "DialogueStateTracker") -> bool:
+        """Checks if `event` extends the applied events without changing them."""
+
+        if isinstance(
+            event, (Restarted, SessionStarted, ActionReverted, UserUtteranceReverted)
+        ):
+            return False
+
+        if tracker.events.maxlen is not None and (
+            len(tracker.events) >= tracker.events.maxlen
+        ):
+            # the oldest events start to drop out of the tracker
+            return False
+
+        if isinstance(event, Form) and event.name and event.name not in self.form_names:
+            # previous executions of this loop might have to be undone now
+            return False
+
+        return not (
+            isinstance(event, ActionExecuted)
+            and event.action_name in self.form_names
+            and not tracker._first_loop_execution_or_unhappy_path(
+                event.action_name, self.applied_events
+            )
+        )
+
+    def append(self, event: Event) -> None:
+        self.applied_events.append(event)
+        self._pending_events.append(event)
+
+    def states(self, domain: Domain) -> List[FrozenSet[Tuple[Text, float]]]:
+        """Returns the states before each action and the current state."""
+
+        for event in self._pending_events:
+            if isinstance(event, ActionExecuted):
+                self._states.append(self._current_state(domain))
+            self._replay_tracker.update(event)
+        self._pending_events = []
+
+        return self._states + [self._current_state(domain)]
+
+    def _current_state(self, domain: Domain) -> FrozenSet[Tuple[Text, float]]:
+        return frozenset(domain.get_active_states(self._replay_tracker).items())
+
+
 class DialogueStateTracker:
     """Maintains the state of a conversation.
 
     The field max_event_history will only give you these last events,
     it can be set in the tracker_store"""
 
+    # whether the states of the tracker's history are cached between predictions
+    cache_state_history = True
+
     @classmethod
     def from_dict(
         cls,
@@ -142,6 +216,11 @@ class DialogueStateTracker:
         self.sender_source = sender_source
         # whether the tracker belongs to a rule-based data
         self.is_rule_tracker = is_rule_tracker
+        # cached states of the tracker's history, see `past_states`
+        self._state_history: Optional[_StateHistory] = None
+        # number of leading events which are already persisted in a tracker store
+        # (`None` if the tracker wasn't retrieved from or saved to a tracker store)
+        self.persisted_event_count: Optional[int] = None
 
         ###
         # current state of the tracker - MUST be re-creatable by processing
@@ -200,11 +279,33 @@ class DialogueStateTracker:
 
         return None
 
-    def past_states(self, domain) -> deque:
-        """Generate the past states of this tracker based on the history."""
+    def past_states(self, domain: Domain) -> deque:
+        """Generate the past states of this tracker based on the history.
+
+        The states are cached for the passed domain and extended as new events
+        are applied to the tracker, so that the history is only replayed again
+        after events which change the already applied events (e.g. `Restarted`).
+        """
+
+        if not self.cache_state_history:
+            return deque(self._state_history_for(domain).states(domain))
 
-        generated_states = domain.states_for_tracker_history(self)
-        return deque(frozenset(s.items()) for s in generated_states)
+        if self._state_history is None or not self._state_history.is_for(domain):
+            self._state_history = self._state_history_for(domain)
+
+        return deque(self._state_history.states(domain))
+
+    def _state_history_for(self, domain: Domain) -> _StateHistory:
+        return _StateHistory(self, domain)
+
+    def _update_state_history(self, event: Event) -> None:
+        if self._state_history is None:
+            return
+
+        if self._state_history.can_append(event, self):
+            self._state_history.append(event)
+        else:
+            self._state_history = None
 
     def change_form_to(self, form_name: Text) -> None:
         """Activate or deactivate a form"""
@@ -470,6 +571,87 @@ class DialogueStateTracker:
         self.events.extend(dialogue.events)
         self.replay_events()
 
+    def snapshot(self) -> Optional[Dict[Text, Any]]:
+        """Return a snapshot of the current state of the tracker.
+
+        The tracker can later be restored from the snapshot and its events with
+        `recreate_from_snapshot`, which only applies the events which were added
+        after the snapshot was taken. Returns `None` if the state can't be captured
+        by a snapshot."""
+
+        if not self.events:
+            return None
+
+        if self.events.maxlen is not None and len(self.events) >= self.events.maxlen:
+            # older events might have been dropped, so the event offset of the
+            # snapshot wouldn't match the stored events
+            return None
+
+        latest_message_index = _index_of_latest(
+            self.events, self.latest_message, UserUttered.empty()
+        )
+        latest_bot_utterance_index = _index_of_latest(
+            self.events, self.latest_bot_utterance, BotUttered.empty()
+        )
+        if latest_message_index == -1 or latest_bot_utterance_index == -1:
+            return None
+
+        return {
+            "event_offset": len(self.events),
+            "first_event_timestamp": self.events[0].timestamp,
+            "latest_event_timestamp": self.events[-1].timestamp,
+            "latest_event": self.events[-1].type_name,
+            "slots": self.current_slot_values(),
+            "paused": self._paused,
+            "followup_action": self.followup_action,
+            "latest_action_name": self.latest_action_name,
+            "latest_message_index": latest_message_index,
+            "latest_bot_utterance_index": latest_bot_utterance_index,
+            "active_loop": copy.deepcopy(self.active_loop),
+        }
+
+    def recreate_from_snapshot(
+        self, evts: List[Event], snapshot: Dict[Text, Any]
+    ) -> bool:
+        """Use a snapshot and the events of a tracker to update the trackers state.
+
+        The state is taken from the snapshot and only the events after the
+        snapshot's event offset are applied. The result is identical to replaying
+        all events.
+
+        Returns:
+            `False` if the snapshot doesn't belong to the passed events. The tracker
+            is left untouched in that case.
+        """
+
+        if not _snapshot_matches(evts, snapshot, self.events.maxlen):
+            return False
+
+        # the stored snapshot might contain numbers as floats, e.g. in DynamoDB
+        offset = int(snapshot["event_offset"])
+        latest_message_index = snapshot["latest_message_index"]
+        latest_bot_utterance_index = snapshot["latest_bot_utterance_index"]
+
+        self._reset()
+        self.events.extend(evts[:offset])
+
+        for key, value in snapshot["slots"].items():
+            if key in self.slots:
+                self.slots[key].value = value
+        self._paused = snapshot["paused"]
+        self.followup_action = snapshot["followup_action"]
+        self.latest_action_name = snapshot["latest_action_name"]
+        if latest_message_index is not None:
+            self.latest_message = evts[int(latest_message_index)]
+        if latest_bot_utterance_index is not None:
+            self.latest_bot_utterance = evts[int(latest_bot_utterance_index)]
+        self.active_loop = copy.deepcopy(snapshot["active_loop"])
+
+        for event in evts[offset:]:
+            self.update(event)
+
+        return True
+
     def copy(self) -> "DialogueStateTracker":
         """Creates a duplicate of this tracker"""
         return self.travel_back_in_time(float("inf"))
@@ -506,6 +688,7 @@ class DialogueStateTracker:
 
         self.events.append(event)
         event.apply_to(self)
+        self._update_state_history(event)
 
         if domain and isinstance(event, UserUttered):
             # store all entities as slots
@@ -602,6 +785,8 @@ class DialogueStateTracker:
         self.latest_bot_utterance = BotUttered.empty()
         self.followup_action = ACTION_LISTEN_NAME
         self.active_loop = {}
+        # the applied events change, hence the states have to be recomputed
+        self._state_history = None
 
     def _reset_slots(self) -> None:
         """Set all the slots to their initial value."""
@@ -627,6 +812,12 @@ class DialogueStateTracker:
             raise ValueError("events, if given, must be a list of events")
         return deque(evts, self._max_event_history)
 
+    def __getstate__(self) -> Dict[Text, Any]:
+        state = self.__dict__.copy()
+        # the cached states reference the domain and are cheap to recreate
+        state["_state_history"] = None
+        return state
+
     def __eq__(self, other) -> bool:
         if isinstance(self, type(other)):
             return other.events == self.events and self.sender_id == other.sender_id
@@ -672,3 +863,35 @@ class DialogueStateTracker:
             return None
 
         return self.active_loop.get("name")
+
+
+def _index_of_latest(evts: Deque[Event], latest: Event, empty: Event) -> Optional[int]:
+    """Find the position of `latest` in the events.
+
+    Returns `None` if `latest` is the empty placeholder event and `-1` if it is
+    not part of the events at all."""
+
+    for idx, event in enumerate(reversed(evts)):
+        if event is latest:
+            return len(evts) - 1 - idx
+
+    return None if latest == empty else -1
+
+
+def _snapshot_matches(
+    evts: List[Event], snapshot: Dict[Text, Any], max_event_history: Optional[int]
+) -> bool:
+    """Check whether a tracker snapshot was taken from (a prefix of) `evts`."""
+
+    offset = int(snapshot.get("event_offset") or 0)
+    if not offset or offset > len(evts):
+        return False
+
+    if max_event_history is not None and len(evts) > max_event_history:
+        return False
+
+    return (
+        evts[0].timestamp == snapshot.get("first_event_timestamp")
+        and evts[offset - 1].timestamp == snapshot.get("latest_event_timestamp")
+        and evts[offset - 1].type_name == snapshot.get("latest_event")
+    )
@@ -46,6 +46,9 @@ ExtractorConfig = namedtuple(
 class TrackerWithCachedStates(DialogueStateTracker):
     """A tracker wrapper that caches the state creation of the tracker."""
 
+    # the states are cached by the tracker itself, see `past_states`
+    cache_state_history = False
+
     def __init__(
         self,
         sender_id: Text,
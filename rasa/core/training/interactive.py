@@ -1665,7 +1665,9 @@ def run_interactive_learning(
     # before_server_start handlers make sure the agent is loaded before the
     # interactive learning IO starts
     app.register_listener(
-        partial(run.load_agent_on_start, server_args.get("model"), endpoints, None),
+        partial(
+            run.load_agent_on_start, server_args.get("model"), endpoints, None, None
+        ),
         "before_server_start",
     )
 
@@ -416,8 +416,18 @@ class AvailableEndpoints:
         )
         lock_store = read_endpoint_config(endpoint_file, endpoint_type="lock_store")
         event_broker = read_endpoint_config(endpoint_file, endpoint_type="event_broker")
-
-        return cls(nlg, nlu, action, model, tracker_store, lock_store, event_broker)
+        nlu_batching = read_endpoint_config(endpoint_file, endpoint_type="nlu_batching")
+
+        return cls(
+            nlg,
+            nlu,
+            action,
+            model,
+            tracker_store,
+            lock_store,
+            event_broker,
+            nlu_batching,
+        )
 
     def __init__(
         self,
@@ -428,6 +438,7 @@ class AvailableEndpoints:
         tracker_store: Optional[EndpointConfig] = None,
         lock_store: Optional[EndpointConfig] = None,
         event_broker: Optional[EndpointConfig] = None,
+        nlu_batching: Optional[EndpointConfig] = None,
     ) -> None:
         self.model = model
         self.action = action
@@ -436,6 +447,14 @@ class AvailableEndpoints:
         self.tracker_store = tracker_store
         self.lock_store = lock_store
         self.event_broker = event_broker
+        self.nlu_batching = nlu_batching
+
+    async def close_sessions(self) -> None:
+        """Closes the HTTP connections which are kept open to the endpoints."""
+
+        for endpoint in [self.model, self.action, self.nlu, self.nlg]:
+            if endpoint:
+                await endpoint.close_session()
 
 
 def read_endpoints_from_path(
@@ -558,11 +577,14 @@ def _lock_store_is_redis_lock_store(
     return lock_store is not None and lock_store.type == "redis"
 
 
-def number_of_sanic_workers(lock_store: Union[EndpointConfig, LockStore, None]) -> int:
+def number_of_sanic_workers(
+    lock_store: Union[EndpointConfig, LockStore, None], workers: Optional[int] = None
+) -> int:
     """Get the number of Sanic workers to use in `app.run()`.
 
-    If the environment variable constants.ENV_SANIC_WORKERS is set and is not equal to
-    1, that value will only be permitted if the used lock store supports shared
+    The number of workers is taken from `workers` (e.g. set with `rasa run
+    --workers`) or from the environment variable constants.ENV_SANIC_WORKERS. A
+    value other than 1 will only be permitted if the used lock store supports shared
     resources across multiple workers (e.g. ``RedisLockStore``).
     """
 
@@ -572,31 +594,32 @@ def number_of_sanic_workers(lock_store: Union[EndpointConfig, LockStore, None])
         )
         return DEFAULT_SANIC_WORKERS
 
-    try:
-        env_value = int(os.environ.get(ENV_SANIC_WORKERS, DEFAULT_SANIC_WORKERS))
-    except ValueError:
-        logger.error(
-            f"Cannot convert environment variable `{ENV_SANIC_WORKERS}` "
-            f"to int ('{os.environ[ENV_SANIC_WORKERS]}')."
-        )
-        return _log_and_get_default_number_of_workers()
+    if workers is None:
+        try:
+            workers = int(os.environ.get(ENV_SANIC_WORKERS, DEFAULT_SANIC_WORKERS))
+        except ValueError:
+            logger.error(
+                f"Cannot convert environment variable `{ENV_SANIC_WORKERS}` "
+                f"to int ('{os.environ[ENV_SANIC_WORKERS]}')."
+            )
+            return _log_and_get_default_number_of_workers()
 
-    if env_value == DEFAULT_SANIC_WORKERS:
+    if workers == DEFAULT_SANIC_WORKERS:
         return _log_and_get_default_number_of_workers()
 
-    if env_value < 1:
+    if workers < 1:
         logger.debug(
             f"Cannot set number of Sanic workers to the desired value "
-            f"({env_value}). The number of workers must be at least 1."
+            f"({workers}). The number of workers must be at least 1."
         )
         return _log_and_get_default_number_of_workers()
 
     if _lock_store_is_redis_lock_store(lock_store):
-        logger.debug(f"Using {env_value} Sanic workers.")
-        return env_value
+        logger.debug(f"Using {workers} Sanic workers.")
+        return workers
 
-    logger.debug(
-        f"Unable to assign desired number of Sanic workers ({env_value}) as "
+    logger.warning(
+        f"Unable to assign desired number of Sanic workers ({workers}) as "
         f"no `RedisLockStore` endpoint configuration has been found."
     )
     return _log_and_get_default_number_of_workers()
@@ -1,6 +1,6 @@
 import asyncio
 from functools import reduce
-from typing import Text, Optional, List, Dict
+from typing import Text, Optional, List, Dict, Iterable
 import logging
 
 from rasa.core.domain import Domain
@@ -68,6 +68,24 @@ class TrainingDataImporter:
 
         raise NotImplementedError()
 
+    def get_story_files(self) -> Optional[List[Text]]:
+        """Retrieves the paths of the files which the stories are loaded from.
+
+        Returns:
+            The file paths or `None` if the stories are not read from local files.
+        """
+
+        return None
+
+    def get_nlu_files(self) -> Optional[List[Text]]:
+        """Retrieves the paths of the files which the NLU training data is loaded from.
+
+        Returns:
+            The file paths or `None` if the NLU data is not read from local files.
+        """
+
+        return None
+
     @staticmethod
     def load_from_config(
         config_path: Text,
@@ -195,6 +213,12 @@ class NluDataImporter(TrainingDataImporter):
     async def get_nlu_data(self, language: Optional[Text] = "en") -> TrainingData:
         return await self._importer.get_nlu_data(language)
 
+    def get_story_files(self) -> Optional[List[Text]]:
+        return []
+
+    def get_nlu_files(self) -> Optional[List[Text]]:
+        return self._importer.get_nlu_files()
+
 
 class CoreDataImporter(TrainingDataImporter):
     """Importer that skips any NLU related file reading."""
@@ -222,6 +246,12 @@ class CoreDataImporter(TrainingDataImporter):
     async def get_nlu_data(self, language: Optional[Text] = "en") -> TrainingData:
         return TrainingData()
 
+    def get_story_files(self) -> Optional[List[Text]]:
+        return self._importer.get_story_files()
+
+    def get_nlu_files(self) -> Optional[List[Text]]:
+        return []
+
 
 class CombinedDataImporter(TrainingDataImporter):
     """A ``TrainingDataImporter`` that supports using multiple ``TrainingDataImporter``s as
@@ -271,3 +301,22 @@ class CombinedDataImporter(TrainingDataImporter):
         return reduce(
             lambda merged, other: merged.merge(other), nlu_data, TrainingData()
         )
+
+    def get_story_files(self) -> Optional[List[Text]]:
+        return _combined_files(
+            importer.get_story_files() for importer in self._importers
+        )
+
+    def get_nlu_files(self) -> Optional[List[Text]]:
+        return _combined_files(importer.get_nlu_files() for importer in self._importers)
+
+
+def _combined_files(files: Iterable[Optional[List[Text]]]) -> Optional[List[Text]]:
+    combined = []
+    for importer_files in files:
+        if importer_files is None:
+            # the data of at least one importer doesn't come from local files
+            return None
+        combined.extend(importer_files)
+
+    return combined
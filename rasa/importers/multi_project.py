@@ -194,3 +194,9 @@ class MultiProjectImporter(TrainingDataImporter):
 
     async def get_nlu_data(self, language: Optional[Text] = "en") -> TrainingData:
         return utils.training_data_from_paths(self._nlu_paths, language)
+
+    def get_story_files(self) -> Optional[List[Text]]:
+        return self._story_paths
+
+    def get_nlu_files(self) -> Optional[List[Text]]:
+        return self._nlu_paths
@@ -54,6 +54,12 @@ class RasaFileImporter(TrainingDataImporter):
     async def get_nlu_data(self, language: Optional[Text] = "en") -> TrainingData:
         return utils.training_data_from_paths(self._nlu_files, language)
 
+    def get_story_files(self) -> Optional[List[Text]]:
+        return self._story_files
+
+    def get_nlu_files(self) -> Optional[List[Text]]:
+        return self._nlu_files
+
     async def get_domain(self) -> Domain:
         domain = Domain.empty()
         try:
@@ -5,7 +5,18 @@ import shutil
 import tempfile
 import typing
 from pathlib import Path
-from typing import Text, Tuple, Union, Optional, List, Dict, NamedTuple
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Text,
+    Tuple,
+    Union,
+)
 
 import rasa.utils.io
 from rasa.cli.utils import print_success, create_output_path
@@ -19,7 +30,7 @@ from rasa.constants import (
     DEFAULT_NLU_SUBDIRECTORY_NAME,
 )
 
-from rasa.core.utils import get_dict_hash
+from rasa.core.utils import get_dict_hash, get_file_hash
 from rasa.exceptions import ModelNotFound
 from rasa.utils.common import TempDirectoryPath
 
@@ -45,6 +56,10 @@ FINGERPRINT_STORIES_KEY = "stories"
 FINGERPRINT_NLU_DATA_KEY = "messages"
 FINGERPRINT_TRAINED_AT_KEY = "trained_at"
 
+FINGERPRINT_CACHE_FILE_PATH = ".fingerprint_cache.json"
+# number of training data fingerprints which are kept in the fingerprint cache
+MAX_CACHED_FINGERPRINTS = 100
+
 
 class Section(NamedTuple):
     """Defines relevant fingerprint sections which are used to decide whether a model
@@ -118,6 +133,119 @@ class FingerprintComparisonResult:
         return self.force_training or self.nlu
 
 
+class TrainingDataFingerprintCache:
+    """Caches the fingerprints of training data by the content of its files.
+
+    The content hash of every training data file is stored together with the
+    modification time and size of the file, so unchanged files don't have to be
+    read again. The fingerprints of the stories and the NLU data are looked up by
+    the content hashes of the files they were loaded from, which means that the
+    training data only has to be loaded and hashed if any of these files changed.
+    """
+
+    def __init__(self, cache_file: Text) -> None:
+        """Creates a cache which is persisted to `cache_file`."""
+
+        self.cache_file = cache_file
+        self._file_hashes: Dict[Text, Dict[Text, Any]] = {}
+        self._fingerprints: Dict[Text, int] = {}
+
+        if os.path.isfile(cache_file):
+            try:
+                cache = rasa.utils.io.read_json_file(cache_file)
+                self._file_hashes = cache.get("files", {})
+                self._fingerprints = cache.get("fingerprints", {})
+            except (ValueError, AttributeError) as e:
+                logger.debug(f"Ignoring invalid fingerprint cache '{cache_file}'. {e}")
+
+    def file_hash(self, path: Text) -> Text:
+        """Returns the content hash of a file.
+
+        The file is only read if its modification time or size changed since it
+        was hashed last.
+        """
+
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+
+        cached = self._file_hashes.get(path, {})
+        if (
+            cached.get("mtime") == stat.st_mtime_ns
+            and cached.get("size") == stat.st_size
+        ):
+            return cached["hash"]
+
+        file_hash = get_file_hash(path)
+        self._file_hashes[path] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": file_hash,
+        }
+        return file_hash
+
+    def key(self, files: List[Text], *additional_parts: Text) -> Optional[Text]:
+        """Builds the cache key for training data which is loaded from `files`.
+
+        Args:
+            files: Paths of the files which the training data is loaded from.
+            additional_parts: Anything else the loaded training data depends on.
+
+        Returns:
+            A key which changes whenever the content of any of the files changes or
+            `None` if any of the files can't be read.
+        """
+
+        try:
+            file_hashes = [[path, self.file_hash(path)] for path in files]
+        except OSError as e:
+            logger.debug(f"Can't use cached training data fingerprint. {e}")
+            return None
+
+        return get_dict_hash(
+            {
+                "files": file_hashes,
+                "additional_parts": list(additional_parts),
+                "version": rasa.__version__,
+            }
+        )
+
+    def get(self, key: Text) -> Optional[int]:
+        """Returns the cached fingerprint for a key."""
+
+        fingerprint = self._fingerprints.pop(key, None)
+        if fingerprint is not None:
+            # keep recently used fingerprints when the cache is pruned
+            self._fingerprints[key] = fingerprint
+
+        return fingerprint
+
+    def set(self, key: Text, fingerprint: int) -> None:
+        """Caches the fingerprint for a key."""
+
+        self._fingerprints.pop(key, None)
+        self._fingerprints[key] = fingerprint
+
+    def persist(self) -> None:
+        """Persists the cache and drops entries which aren't needed anymore."""
+
+        file_hashes = {
+            path: cached
+            for path, cached in self._file_hashes.items()
+            if os.path.exists(path)
+        }
+        fingerprints = dict(list(self._fingerprints.items())[-MAX_CACHED_FINGERPRINTS:])
+
+        try:
+            rasa.utils.io.create_directory_for_file(self.cache_file)
+            rasa.utils.io.dump_obj_as_json_to_file(
+                self.cache_file, {"files": file_hashes, "fingerprints": fingerprints}
+            )
+        except OSError as e:
+            logger.debug(
+                f"Failed to persist fingerprint cache '{self.cache_file}'. {e}"
+            )
+
+
 def get_model(model_path: Text = DEFAULT_MODELS_PATH) -> TempDirectoryPath:
     """Get a model and unpack it. Raises a `ModelNotFound` exception if
     no model could be found at the provided path.
@@ -266,11 +394,16 @@ def create_package_rasa(
     return output_filename
 
 
-async def model_fingerprint(file_importer: "TrainingDataImporter") -> Fingerprint:
+async def model_fingerprint(
+    file_importer: "TrainingDataImporter", cache_directory: Optional[Text] = None
+) -> Fingerprint:
     """Create a model fingerprint from its used configuration and training data.
 
     Args:
         file_importer: File importer which provides the training data and model config.
+        cache_directory: Directory of the `TrainingDataFingerprintCache`. If it is
+            given, the stories and the NLU data are only loaded if their files
+            changed since they were fingerprinted last.
 
     Returns:
         The fingerprint.
@@ -283,8 +416,26 @@ async def model_fingerprint(file_importer: "TrainingDataImporter") -> Fingerprin
 
     config = await file_importer.get_config()
     domain = await file_importer.get_domain()
-    stories = await file_importer.get_stories()
-    nlu_data = await file_importer.get_nlu_data()
+
+    cache = None
+    if cache_directory:
+        cache = TrainingDataFingerprintCache(
+            os.path.join(cache_directory, FINGERPRINT_CACHE_FILE_PATH)
+        )
+
+    stories_hash = await _training_data_hash(
+        file_importer.get_stories,
+        file_importer.get_story_files(),
+        cache,
+        # stories are parsed using the domain
+        str(hash(domain)),
+    )
+    nlu_data_hash = await _training_data_hash(
+        file_importer.get_nlu_data, file_importer.get_nlu_files(), cache
+    )
+
+    if cache:
+        cache.persist()
 
     domain_dict = domain.as_dict()
     responses = domain_dict.pop("responses")
@@ -300,13 +451,32 @@ async def model_fingerprint(file_importer: "TrainingDataImporter") -> Fingerprin
         ),
         FINGERPRINT_DOMAIN_WITHOUT_NLG_KEY: hash(domain_without_nlg),
         FINGERPRINT_NLG_KEY: get_dict_hash(responses),
-        FINGERPRINT_NLU_DATA_KEY: hash(nlu_data),
-        FINGERPRINT_STORIES_KEY: hash(stories),
+        FINGERPRINT_NLU_DATA_KEY: nlu_data_hash,
+        FINGERPRINT_STORIES_KEY: stories_hash,
         FINGERPRINT_TRAINED_AT_KEY: time.time(),
         FINGERPRINT_RASA_VERSION_KEY: rasa.__version__,
     }
 
 
+async def _training_data_hash(
+    load_training_data: Callable[[], Awaitable[Any]],
+    files: Optional[List[Text]],
+    cache: Optional[TrainingDataFingerprintCache],
+    *additional_key_parts: Text,
+) -> int:
+    key = None
+    if cache and files is not None:
+        key = cache.key(files, *additional_key_parts)
+
+    fingerprint = cache.get(key) if key else None
+    if fingerprint is None:
+        fingerprint = hash(await load_training_data())
+        if key:
+            cache.set(key, fingerprint)
+
+    return fingerprint
+
+
 def _get_hash_of_config(
     config: Optional[Dict],
     include_keys: Optional[List[Text]] = None,
@@ -836,18 +836,58 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
 
     # process helpers
     def _predict(self, message: Message) -> Optional[Dict[Text, tf.Tensor]]:
+        return self._predict_batch([message])[0]
+
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, tf.Tensor]]]:
+        """Predicts all messages in one padded batch.
+
+        Returns the prediction output of every message as a batch of size 1, so
+        that it can be handled in the same way as a single prediction.
+        """
+
         if self.model is None:
             logger.debug(
                 f"There is no trained model for '{self.__class__.__name__}': The "
                 f"component is either not trained or didn't receive enough training "
                 f"data."
             )
-            return None
+            return [None] * len(messages)
+
+        # create session data from all messages and convert it into one batch
+        model_data = self._create_model_data(messages, training=False)
+
+        predict_out = self.model.predict(model_data)
+
+        # sentence features have a sequence length of 1, see `_get_sequence_lengths`
+        sequence_lengths = np.ones(len(messages), dtype=np.int32)
+        if model_data.get(TEXT_SEQUENCE_LENGTH):
+            sequence_lengths += model_data.get(TEXT_SEQUENCE_LENGTH)[0].astype(np.int32)
+
+        return [
+            self._predict_out_for_example(predict_out, index, sequence_length)
+            for index, sequence_length in enumerate(sequence_lengths)
+        ]
+
+    @staticmethod
+    def _predict_out_for_example(
+        predict_out: Dict[Text, tf.Tensor], index: int, sequence_length: int
+    ) -> Dict[Text, tf.Tensor]:
+        """Slices the output of a single example out of the batch output.
+
+        Entity predictions are cut to the sequence length of the example, so that
+        the padding of the batch does not end up in the predicted tags.
+        """
 
-        # create session data from message and convert it into a batch of 1
-        model_data = self._create_model_data([message], training=False)
+        example_out = {}
+        for key, value in predict_out.items():
+            if key.startswith("e_"):
+                example_out[key] = value[index : index + 1, :sequence_length]
+            else:
+                example_out[key] = value[index : index + 1]
 
-        return self.model.predict(model_data)
+        return example_out
 
     def _predict_label(
         self, predict_out: Optional[Dict[Text, tf.Tensor]]
@@ -947,6 +987,17 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
 
         out = self._predict(message)
 
+        self._set_predictions(message, out)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Return the most likely labels of all messages using a single prediction."""
+
+        for message, out in zip(messages, self._predict_batch(messages)):
+            self._set_predictions(message, out)
+
+    def _set_predictions(
+        self, message: Message, out: Optional[Dict[Text, tf.Tensor]]
+    ) -> None:
         if self.component_config[INTENT_CLASSIFICATION]:
             label, label_ranking = self._predict_label(out)
 
@@ -1918,9 +1969,10 @@ class DIET(RasaModel):
             batch_in, self.predict_data_signature
         )
 
+        batch_dim = self._get_batch_dim(tf_batch_data)
         mask_sequence_text = self._get_mask_for(tf_batch_data, TEXT_SEQUENCE_LENGTH)
         sequence_lengths = self._get_sequence_lengths(
-            tf_batch_data, TEXT_SEQUENCE_LENGTH, batch_dim=1
+            tf_batch_data, TEXT_SEQUENCE_LENGTH, batch_dim
         )
 
         mask = self._compute_mask(sequence_lengths)
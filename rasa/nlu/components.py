@@ -554,6 +554,23 @@ class Component(metaclass=ComponentMetaclass):
 
         pass
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process a batch of incoming messages.
+
+        Components which are able to process several messages at once (e.g. by
+        running a single forward pass of a neural network over a padded batch)
+        should overwrite this method. By default every message of the batch is
+        passed to :meth:`rasa.nlu.components.Component.process`.
+
+        Args:
+            messages: The :class:`rasa.nlu.training_data.message.Message` objects
+                to process.
+
+        """
+
+        for message in messages:
+            self.process(message, **kwargs)
+
     def persist(self, file_name: Text, model_dir: Text) -> Optional[Dict[Text, Any]]:
         """Persist this component to disk for future loading.
 
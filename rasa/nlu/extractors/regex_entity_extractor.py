@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 from typing import Any, Dict, List, Optional, Text
 
 import rasa.utils.io as io_utils
@@ -38,12 +37,16 @@ class RegexEntityExtractor(EntityExtractor):
     def __init__(
         self,
         component_config: Optional[Dict[Text, Any]] = None,
-        patterns: Optional[List[Dict[Text, Text]]] = None,
+        patterns: Optional[List[Dict[Text, Any]]] = None,
     ):
         super(RegexEntityExtractor, self).__init__(component_config)
 
         self.case_sensitive = self.component_config["case_sensitive"]
-        self.patterns = patterns or []
+        self._set_patterns(patterns or [])
+
+    def _set_patterns(self, patterns: List[Dict[Text, Any]]) -> None:
+        self.patterns = patterns
+        self._matchers = pattern_utils.compile_patterns(patterns, self.case_sensitive)
 
     def train(
         self,
@@ -51,11 +54,13 @@ class RegexEntityExtractor(EntityExtractor):
         config: Optional[RasaNLUModelConfig] = None,
         **kwargs: Any,
     ) -> None:
-        self.patterns = pattern_utils.extract_patterns(
-            training_data,
-            use_lookup_tables=self.component_config["use_lookup_tables"],
-            use_regexes=self.component_config["use_regexes"],
-            use_only_entities=True,
+        self._set_patterns(
+            pattern_utils.extract_patterns(
+                training_data,
+                use_lookup_tables=self.component_config["use_lookup_tables"],
+                use_regexes=self.component_config["use_regexes"],
+                use_only_entities=True,
+            )
         )
 
         if not self.patterns:
@@ -81,17 +86,8 @@ class RegexEntityExtractor(EntityExtractor):
         """Extract entities of the given type from the given user message."""
         entities = []
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        for pattern in self.patterns:
-            matches = re.finditer(pattern["pattern"], message.text, flags=flags)
-            matches = list(matches)
-
-            for match in matches:
-                start_index = match.start()
-                end_index = match.end()
+        for pattern, matcher in zip(self.patterns, self._matchers):
+            for start_index, end_index in matcher.find(message.text):
                 entities.append(
                     {
                         ENTITY_ATTRIBUTE_TYPE: pattern["name"],
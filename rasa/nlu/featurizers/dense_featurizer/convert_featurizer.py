@@ -220,6 +220,15 @@ class ConveRTFeaturizer(DenseFeaturizer):
 
         self._set_features([message], sequence_features, sentence_features, TEXT)
 
+    def process_batch(
+        self, messages: List[Message], *, tf_hub_module: Any = None, **kwargs: Any
+    ) -> None:
+        sequence_features, sentence_features = self._compute_features(
+            messages, tf_hub_module
+        )
+
+        self._set_features(messages, sequence_features, sentence_features, TEXT)
+
     def _set_features(
         self,
         examples: List[Message],
@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 from typing import Any, Dict, List, Optional, Text, Union, Type, Tuple
 
 import numpy as np
@@ -44,13 +43,19 @@ class RegexFeaturizer(SparseFeaturizer):
     def __init__(
         self,
         component_config: Optional[Dict[Text, Any]] = None,
-        known_patterns: Optional[List[Dict[Text, Text]]] = None,
+        known_patterns: Optional[List[Dict[Text, Any]]] = None,
     ) -> None:
 
         super().__init__(component_config)
 
-        self.known_patterns = known_patterns if known_patterns else []
         self.case_sensitive = self.component_config["case_sensitive"]
+        self._set_known_patterns(known_patterns if known_patterns else [])
+
+    def _set_known_patterns(self, known_patterns: List[Dict[Text, Any]]) -> None:
+        self.known_patterns = known_patterns
+        self._matchers = pattern_utils.compile_patterns(
+            known_patterns, self.case_sensitive
+        )
 
     def train(
         self,
@@ -59,10 +64,12 @@ class RegexFeaturizer(SparseFeaturizer):
         **kwargs: Any,
     ) -> None:
 
-        self.known_patterns = pattern_utils.extract_patterns(
-            training_data,
-            use_lookup_tables=self.component_config["use_lookup_tables"],
-            use_regexes=self.component_config["use_regexes"],
+        self._set_known_patterns(
+            pattern_utils.extract_patterns(
+                training_data,
+                use_lookup_tables=self.component_config["use_lookup_tables"],
+                use_regexes=self.component_config["use_regexes"],
+            )
         )
 
         for example in training_data.training_examples:
@@ -115,30 +122,30 @@ class RegexFeaturizer(SparseFeaturizer):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
         sequence_length = len(tokens)
 
         sequence_features = np.zeros([sequence_length, len(self.known_patterns)])
         sentence_features = np.zeros([1, len(self.known_patterns)])
 
         for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = re.finditer(pattern["pattern"], message.text, flags=flags)
-            matches = list(matches)
+            matches = self._matchers[pattern_index].find(message.text)
 
+            # tokens and matches are both sorted by their positions, so a single
+            # sweep over them finds all tokens which overlap with a match
+            match_index = 0
             for token_index, t in enumerate(tokens):
                 patterns = t.get("pattern", default={})
                 patterns[pattern["name"]] = False
 
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
-                        patterns[pattern["name"]] = True
-                        sequence_features[token_index][pattern_index] = 1.0
-                        if attribute in [RESPONSE, TEXT]:
-                            # sentence vector should contain all patterns
-                            sentence_features[0][pattern_index] = 1.0
+                while match_index < len(matches) and matches[match_index][1] <= t.start:
+                    match_index += 1
+
+                if match_index < len(matches) and matches[match_index][0] < t.end:
+                    patterns[pattern["name"]] = True
+                    sequence_features[token_index][pattern_index] = 1.0
+                    if attribute in [RESPONSE, TEXT]:
+                        # sentence vector should contain all patterns
+                        sentence_features[0][pattern_index] = 1.0
 
                 t.set("pattern", patterns)
 
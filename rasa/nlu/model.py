@@ -379,3 +379,43 @@ class Interpreter:
         output = self.default_output_attributes()
         output.update(message.as_dict(only_output_properties=only_output_properties))
         return output
+
+    def parse_batch(
+        self,
+        texts: List[Text],
+        time: Optional[datetime.datetime] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        """Parse a batch of input texts, classify them and return pipeline results.
+
+        Every component processes all messages of the batch at once, which allows
+        components to e.g. run a single padded forward pass for the whole batch.
+        The results are returned in the order of the passed texts."""
+
+        outputs: List[Optional[Dict[Text, Any]]] = [None] * len(texts)
+        messages = []
+        message_indices = []
+
+        for index, text in enumerate(texts):
+            if not text:
+                # see `parse` for why empty strings are not passed to the components
+                output = self.default_output_attributes()
+                output["text"] = ""
+                outputs[index] = output
+                continue
+
+            messages.append(Message(text, self.default_output_attributes(), time=time))
+            message_indices.append(index)
+
+        if messages:
+            for component in self.pipeline:
+                component.process_batch(messages, **self.context)
+
+        for index, message in zip(message_indices, messages):
+            output = self.default_output_attributes()
+            output.update(
+                message.as_dict(only_output_properties=only_output_properties)
+            )
+            outputs[index] = output
+
+        return outputs
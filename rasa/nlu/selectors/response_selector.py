@@ -327,6 +327,11 @@ class ResponseSelector(DIETClassifier):
         """Return the most likely response and its similarity to the input."""
 
         out = self._predict(message)
+        self._set_predictions(message, out)
+
+    def _set_predictions(
+        self, message: Message, out: Optional[Dict[Text, tf.Tensor]]
+    ) -> None:
         label, label_ranking = self._predict_label(out)
         retrieval_intent_name = self.retrieval_intent_mapping.get(label.get("name"))
 
@@ -573,9 +578,10 @@ class DIET2DIET(DIET):
             batch_in, self.predict_data_signature
         )
 
+        batch_dim = self._get_batch_dim(tf_batch_data)
         sequence_mask_text = super()._get_mask_for(tf_batch_data, TEXT_SEQUENCE_LENGTH)
         sequence_lengths_text = self._get_sequence_lengths(
-            tf_batch_data, TEXT_SEQUENCE_LENGTH, batch_dim=1
+            tf_batch_data, TEXT_SEQUENCE_LENGTH, batch_dim
         )
         mask_text = self._compute_mask(sequence_lengths_text)
 
@@ -540,3 +540,15 @@ class HFTransformersNLP(Component):
             LANGUAGE_MODEL_DOCS[TEXT],
             self._get_docs_for_batch([message], attribute=TEXT)[0],
         )
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Compute tokens and dense features for a batch of incoming messages.
+
+        Args:
+            messages: Incoming message objects
+        """
+
+        batch_docs = self._get_docs_for_batch(messages, attribute=TEXT)
+
+        for message, doc in zip(messages, batch_docs):
+            message.set(LANGUAGE_MODEL_DOCS[TEXT], doc)
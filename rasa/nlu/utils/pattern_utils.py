@@ -1,34 +1,183 @@
+import logging
 import re
-from typing import Dict, List, Text, Union
+import time
+from typing import Any, Dict, List, Text, Tuple, Union
 
 import rasa.utils.io as io_utils
 from rasa.nlu.training_data import TrainingData
 
+logger = logging.getLogger(__name__)
 
-def _convert_lookup_tables_to_regex(
+
+class LookupTableMatcher:
+    """Finds the elements of a lookup table in texts.
+
+    The matches are the same as the ones of a regex `(\\bfirst\\b|\\bsecond\\b|...)`
+    of the escaped elements: Elements only match between word boundaries, if
+    several elements match at the same position the element listed first wins, and
+    matches don't overlap. Instead of trying every element at every position of the
+    text, the text between two word boundaries is looked up in an index of the
+    elements. Matching therefore doesn't get slower with the size of the lookup
+    table.
+    """
+
+    def __init__(self, elements: List[Text], case_sensitive: bool = True) -> None:
+        self.case_sensitive = case_sensitive
+
+        # maps the elements to their position in the lookup table
+        self._element_indices: Dict[Text, int] = {}
+        for index, element in enumerate(elements):
+            if element:
+                self._element_indices.setdefault(self._normalize(element), index)
+
+        self._max_element_length = max(map(len, self._element_indices), default=0)
+
+    def _normalize(self, text: Text) -> Text:
+        if self.case_sensitive:
+            return text
+
+        return "".join(map(_fold_case, text))
+
+    def find(self, text: Text) -> List[Tuple[int, int]]:
+        """Returns the start and end positions of the matches in `text`."""
+
+        normalized_text = self._normalize(text)
+        boundaries = _word_boundaries(text)
+        matches = []
+        end_of_last_match = 0
+
+        for start_index, start in enumerate(boundaries):
+            if start < end_of_last_match:
+                continue
+
+            best_match = None
+            for end_index in range(start_index + 1, len(boundaries)):
+                end = boundaries[end_index]
+                if end - start > self._max_element_length:
+                    break
+
+                element_index = self._element_indices.get(normalized_text[start:end])
+                if element_index is not None and (
+                    best_match is None or element_index < best_match[0]
+                ):
+                    best_match = (element_index, end)
+
+            if best_match is not None:
+                matches.append((start, best_match[1]))
+                end_of_last_match = best_match[1]
+
+        return matches
+
+
+def _fold_case(character: Text) -> Text:
+    """Case folds a character without changing the positions in the text."""
+
+    for folded in (character.casefold(), character.lower()):
+        if len(folded) == 1:
+            return folded
+
+    return character
+
+
+def _word_boundaries(text: Text) -> List[int]:
+    """Returns the positions in `text` at which the regex `\\b` matches."""
+
+    boundaries = []
+    previous_is_word_character = False
+
+    for position, character in enumerate(text):
+        # same definition of word characters as the one of `re` for `str` patterns
+        is_word_character = character.isalnum() or character == "_"
+        if is_word_character != previous_is_word_character:
+            boundaries.append(position)
+        previous_is_word_character = is_word_character
+
+    if previous_is_word_character:
+        boundaries.append(len(text))
+
+    return boundaries
+
+
+class RegexMatcher:
+    """Finds the matches of a regex feature in texts.
+
+    The regex is compiled once instead of relying on the cache of `re`, which only
+    keeps a limited number of compiled patterns.
+    """
+
+    def __init__(self, pattern: Text, case_sensitive: bool = True) -> None:
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self.regex = re.compile(pattern, flags)
+
+    def find(self, text: Text) -> List[Tuple[int, int]]:
+        """Returns the start and end positions of the matches in `text`."""
+
+        return [match.span() for match in self.regex.finditer(text)]
+
+
+def compile_patterns(
+    patterns: List[Dict[Text, Any]], case_sensitive: bool
+) -> List[Union[RegexMatcher, LookupTableMatcher]]:
+    """Compiles the regex features and lookup tables once for all messages.
+
+    The regexes are deliberately not combined into a single alternation of named
+    groups: `re` only applies its optimizations for literal prefixes to individual
+    patterns, which makes a scan with a combined regex a lot slower than scans with
+    the individual patterns. Matching each pattern separately also keeps matches of
+    different patterns which overlap.
+
+    Args:
+        patterns: Regex features and lookup tables as returned by `extract_patterns`.
+        case_sensitive: Whether the patterns are matched case sensitive.
+
+    Returns:
+        A matcher for every pattern.
+    """
+    start = time.perf_counter()
+
+    matchers = [
+        LookupTableMatcher(pattern["elements"], case_sensitive)
+        if "elements" in pattern
+        else RegexMatcher(pattern["pattern"], case_sensitive)
+        for pattern in patterns
+    ]
+
+    if patterns:
+        logger.debug(
+            f"Compiled {len(patterns)} regex features and lookup tables in "
+            f"{(time.perf_counter() - start) * 1000:.1f} ms."
+        )
+
+    return matchers
+
+
+def _convert_lookup_tables(
     training_data: TrainingData, use_only_entities: bool = False
-) -> List[Dict[Text, Text]]:
-    """Convert the lookup tables from the training data to regex patterns.
+) -> List[Dict[Text, Any]]:
+    """Collect the elements of the lookup tables from the training data.
+
     Args:
         training_data: The training data.
-        use_only_entities: If True only regex features with a name equal to a entity
+        use_only_entities: If True only lookup tables with a name equal to a entity
           are considered.
 
     Returns:
-        A list of regex patterns.
+        A list of lookup tables with their elements.
     """
-    patterns = []
+    lookup_tables = []
     for table in training_data.lookup_tables:
         if use_only_entities and table["name"] not in training_data.entities:
             continue
-        regex_pattern = _generate_lookup_regex(table)
-        lookup_regex = {"name": table["name"], "pattern": regex_pattern}
-        patterns.append(lookup_regex)
-    return patterns
+        lookup_tables.append(
+            {"name": table["name"], "elements": _lookup_table_elements(table)}
+        )
+    return lookup_tables
 
 
-def _generate_lookup_regex(lookup_table: Dict[Text, Union[Text, List[Text]]]) -> Text:
-    """Creates a regex pattern from the given lookup table.
+def _lookup_table_elements(
+    lookup_table: Dict[Text, Union[Text, List[Text]]]
+) -> List[Text]:
+    """Returns the elements of the given lookup table.
 
     The lookup table is either a file or a list of entries.
 
@@ -36,22 +185,16 @@ def _generate_lookup_regex(lookup_table: Dict[Text, Union[Text, List[Text]]]) ->
         lookup_table: The lookup table.
 
     Returns:
-        The regex pattern.
+        The elements.
     """
     lookup_elements = lookup_table["elements"]
 
     # if it's a list, it should be the elements directly
     if isinstance(lookup_elements, list):
-        elements_to_regex = lookup_elements
-    # otherwise it's a file path.
-    else:
-        elements_to_regex = _read_lookup_table_file(lookup_elements)
-
-    # sanitize the regex, escape special characters
-    elements_sanitized = [re.escape(e) for e in elements_to_regex]
+        return lookup_elements
 
-    # regex matching elements with word boundaries on either side
-    return "(\\b" + "\\b|\\b".join(elements_sanitized) + "\\b)"
+    # otherwise it's a file path.
+    return _read_lookup_table_file(lookup_elements)
 
 
 def _read_lookup_table_file(lookup_table_file: Text) -> List[Text]:
@@ -71,13 +214,13 @@ def _read_lookup_table_file(lookup_table_file: Text) -> List[Text]:
             f"Please make sure you've provided the correct path."
         )
 
-    elements_to_regex = []
+    elements = []
     with f:
         for line in f:
             new_element = line.strip()
             if new_element:
-                elements_to_regex.append(new_element)
-    return elements_to_regex
+                elements.append(new_element)
+    return elements
 
 
 def _collect_regex_features(
@@ -108,11 +251,11 @@ def extract_patterns(
     use_lookup_tables: bool = True,
     use_regexes: bool = True,
     use_only_entities: bool = False,
-) -> List[Dict[Text, Text]]:
+) -> List[Dict[Text, Any]]:
     """Extract a list of patterns from the training data.
 
-    The patterns are constructed using the regex features and lookup tables defined
-    in the training data.
+    The patterns are the regex features (with a `pattern`) and the lookup tables
+    (with their `elements`) defined in the training data.
 
     Args:
         training_data: The training data.
@@ -122,7 +265,7 @@ def extract_patterns(
         use_lookup_tables: Boolean indicating whether to use lookup tables or not.
 
     Returns:
-        The list of regex patterns.
+        The list of patterns.
     """
     if not training_data.lookup_tables and not training_data.regex_features:
         return []
@@ -132,8 +275,6 @@ def extract_patterns(
     if use_regexes:
         patterns.extend(_collect_regex_features(training_data, use_only_entities))
     if use_lookup_tables:
-        patterns.extend(
-            _convert_lookup_tables_to_regex(training_data, use_only_entities)
-        )
+        patterns.extend(_convert_lookup_tables(training_data, use_only_entities))
 
     return patterns
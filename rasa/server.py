@@ -33,10 +33,15 @@ from rasa.core.channels.channel import (
     UserMessage,
 )
 from rasa.core.domain import InvalidDomain
+from rasa.core.interpreter import BatchingInterpreter
 from rasa.core.events import Event
 from rasa.core.lock_store import LockStore
 from rasa.core.test import test
-from rasa.core.tracker_store import TrackerStore
+from rasa.core.tracker_store import (
+    CachedTrackerStore,
+    FailSafeTrackerStore,
+    TrackerStore,
+)
 from rasa.core.trackers import DialogueStateTracker, EventVerbosity
 from rasa.core.utils import AvailableEndpoints
 from rasa.nlu.emulators.no_emulator import NoEmulator
@@ -228,6 +233,24 @@ async def get_tracker(
     return tracker  # pytype: disable=bad-return-type
 
 
+async def get_tracker_until(
+    processor: "MessageProcessor", conversation_id: Text, until_time: float
+) -> DialogueStateTracker:
+    """Get the tracker of a conversation as it was at `until_time`.
+
+    Only the events up to `until_time` are retrieved from the tracker store."""
+    tracker_store = processor.tracker_store
+    events = await tracker_store.retrieve_events_async(
+        conversation_id, until_timestamp=until_time
+    )
+
+    tracker = tracker_store.init_tracker(conversation_id)
+    for event in events:
+        tracker.update(event)
+
+    return tracker
+
+
 def _validate_tracker(
     tracker: Optional[DialogueStateTracker], conversation_id: Text
 ) -> None:
@@ -361,9 +384,32 @@ async def _load_agent(
             {"parameter": "model", "in": "query"},
         )
 
+    if endpoints:
+        loaded_agent.configure_nlu_batching(endpoints.nlu_batching)
+
     return loaded_agent
 
 
+def _endpoint_statistics(agent: Agent) -> Dict[Text, Dict[Text, Any]]:
+    """Returns the request timings of the HTTP endpoints which the agent uses."""
+
+    # the interpreter might be wrapped by a `BatchingInterpreter`
+    interpreter = getattr(agent.interpreter, "interpreter", agent.interpreter)
+
+    endpoints = {
+        "action_endpoint": agent.action_endpoint,
+        "nlg": getattr(agent.nlg, "nlg_endpoint", None),
+        "nlu": getattr(interpreter, "endpoint_config", None),
+        "models": agent.model_server,
+    }
+
+    return {
+        name: endpoint.statistics.as_dict()
+        for name, endpoint in endpoints.items()
+        if isinstance(endpoint, EndpointConfig)
+    }
+
+
 def configure_cors(
     app: Sanic, cors_origins: Union[Text, List[Text], None] = ""
 ) -> None:
@@ -446,14 +492,26 @@ def create_app(
     async def status(request: Request):
         """Respond with the model name and the fingerprint of that model."""
 
-        return response.json(
-            {
-                "model_file": app.agent.path_to_model_archive
-                or app.agent.model_directory,
-                "fingerprint": model.fingerprint_from_path(app.agent.model_directory),
-                "num_active_training_jobs": app.active_training_processes.value,
-            }
-        )
+        status_data = {
+            "model_file": app.agent.path_to_model_archive or app.agent.model_directory,
+            "fingerprint": model.fingerprint_from_path(app.agent.model_directory),
+            "num_active_training_jobs": app.active_training_processes.value,
+        }
+
+        if isinstance(app.agent.interpreter, BatchingInterpreter):
+            status_data["nlu_batching"] = app.agent.interpreter.statistics.as_dict()
+
+        tracker_store = app.agent.tracker_store
+        if isinstance(tracker_store, FailSafeTrackerStore):
+            tracker_store = tracker_store.tracker_store
+        if isinstance(tracker_store, CachedTrackerStore):
+            status_data["tracker_cache"] = tracker_store.statistics.as_dict()
+
+        endpoint_statistics = _endpoint_statistics(app.agent)
+        if endpoint_statistics:
+            status_data["endpoints"] = endpoint_statistics
+
+        return response.json(status_data)
 
     @app.get("/conversations/<conversation_id>/tracker")
     @requires_auth(app, auth_token)
@@ -464,12 +522,13 @@ def create_app(
         verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
         until_time = rasa.utils.endpoints.float_arg(request, "until")
 
-        tracker = await get_tracker(app.agent.create_processor(), conversation_id)
+        processor = app.agent.create_processor()
+        if until_time is not None:
+            tracker = await get_tracker_until(processor, conversation_id, until_time)
+        else:
+            tracker = await get_tracker(processor, conversation_id)
 
         try:
-            if until_time is not None:
-                tracker = tracker.travel_back_in_time(until_time)
-
             state = tracker.current_state(verbosity)
             return response.json(state)
         except Exception as e:
@@ -494,14 +553,14 @@ def create_app(
         try:
             async with app.agent.lock_store.lock(conversation_id):
                 processor = app.agent.create_processor()
-                tracker = processor.get_tracker(conversation_id)
+                tracker = await processor.get_tracker(conversation_id)
                 _validate_tracker(tracker, conversation_id)
 
                 events = _get_events_from_request_body(request)
 
                 for event in events:
                     tracker.update(event, app.agent.domain)
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -553,7 +612,7 @@ def create_app(
                 )
 
                 # will override an existing tracker with the same id!
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -568,15 +627,16 @@ def create_app(
     async def retrieve_story(request: Request, conversation_id: Text):
         """Get an end-to-end story corresponding to this conversation."""
 
-        # retrieve tracker and set to requested state
-        tracker = await get_tracker(app.agent.create_processor(), conversation_id)
-
         until_time = rasa.utils.endpoints.float_arg(request, "until")
 
-        try:
-            if until_time is not None:
-                tracker = tracker.travel_back_in_time(until_time)
+        # retrieve tracker in the requested state
+        processor = app.agent.create_processor()
+        if until_time is not None:
+            tracker = await get_tracker_until(processor, conversation_id, until_time)
+        else:
+            tracker = await get_tracker(processor, conversation_id)
 
+        try:
             # dump and return tracker
             state = tracker.export_stories(e2e=True)
             return response.text(state)
@@ -950,6 +1010,53 @@ def create_app(
                 500, "ParsingError", f"An unexpected error occurred. Error: {e}"
             )
 
+    @app.post("/model/parse/batch")
+    @requires_auth(app, auth_token)
+    @ensure_loaded_agent(app)
+    async def parse_batch(request: Request) -> HTTPResponse:
+        validate_request_body(
+            request,
+            "No text messages defined in request_body. Add a list of text messages "
+            "to the request body in order to obtain their intents and extracted "
+            "entities.",
+        )
+
+        texts = request.json.get("texts") if isinstance(request.json, dict) else None
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise ErrorResponse(
+                400,
+                "BadRequest",
+                "The request body needs to contain a list of text messages under "
+                "the key 'texts'.",
+                {"parameter": "texts", "in": "body"},
+            )
+
+        emulation_mode = request.args.get("emulation_mode")
+        emulator = _create_emulator(emulation_mode)
+
+        try:
+            data = [emulator.normalise_request_json({"text": text}) for text in texts]
+            try:
+                parsed_data = await app.agent.parse_messages_using_nlu_interpreter(
+                    [d.get("text") for d in data]
+                )
+            except Exception as e:
+                logger.debug(traceback.format_exc())
+                raise ErrorResponse(
+                    400, "ParsingError", f"An unexpected error occurred. Error: {e}"
+                )
+            response_data = [emulator.normalise_response_json(d) for d in parsed_data]
+
+            return response.json(response_data)
+
+        except ErrorResponse:
+            raise
+        except Exception as e:
+            logger.debug(traceback.format_exc())
+            raise ErrorResponse(
+                500, "ParsingError", f"An unexpected error occurred. Error: {e}"
+            )
+
     @app.put("/model")
     @requires_auth(app, auth_token)
     async def load_model(request: Request) -> HTTPResponse:
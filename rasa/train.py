@@ -156,6 +156,27 @@ async def _train_async_internal(
         Path of the trained model archive.
     """
 
+    old_model = model.get_latest_model(output_path)
+    new_fingerprint = None
+    fingerprint_comparison = FingerprintComparisonResult(force_training=force_training)
+    if not force_training and old_model:
+        # fingerprinting doesn't load the training data if its files didn't change
+        new_fingerprint = await model.model_fingerprint(
+            file_importer, cache_directory=output_path
+        )
+        fingerprint_comparison = model.should_retrain(
+            new_fingerprint, old_model, train_path
+        )
+
+    if not fingerprint_comparison.is_training_required():
+        # the old model contains a Core and an NLU model, so it was trained with
+        # the same stories and NLU data, neither of which is empty
+        print_success(
+            "Nothing changed. You can use the old model stored at '{}'."
+            "".format(os.path.abspath(old_model))
+        )
+        return old_model
+
     stories, nlu_data = await asyncio.gather(
         file_importer.get_stories(), file_importer.get_nlu_data()
     )
@@ -186,39 +207,29 @@ async def _train_async_internal(
             additional_arguments=core_additional_arguments,
         )
 
-    new_fingerprint = await model.model_fingerprint(file_importer)
-    old_model = model.get_latest_model(output_path)
-    fingerprint_comparison = FingerprintComparisonResult(force_training=force_training)
-    if not force_training:
-        fingerprint_comparison = model.should_retrain(
-            new_fingerprint, old_model, train_path
+    if new_fingerprint is None:
+        new_fingerprint = await model.model_fingerprint(
+            file_importer, cache_directory=output_path
         )
 
-    if fingerprint_comparison.is_training_required():
-        await _do_training(
-            file_importer,
-            output_path=output_path,
-            train_path=train_path,
-            fingerprint_comparison_result=fingerprint_comparison,
-            fixed_model_name=fixed_model_name,
-            persist_nlu_training_data=persist_nlu_training_data,
-            core_additional_arguments=core_additional_arguments,
-            nlu_additional_arguments=nlu_additional_arguments,
-            old_model_zip_path=old_model,
-        )
-
-        return model.package_model(
-            fingerprint=new_fingerprint,
-            output_directory=output_path,
-            train_path=train_path,
-            fixed_model_name=fixed_model_name,
-        )
+    await _do_training(
+        file_importer,
+        output_path=output_path,
+        train_path=train_path,
+        fingerprint_comparison_result=fingerprint_comparison,
+        fixed_model_name=fixed_model_name,
+        persist_nlu_training_data=persist_nlu_training_data,
+        core_additional_arguments=core_additional_arguments,
+        nlu_additional_arguments=nlu_additional_arguments,
+        old_model_zip_path=old_model,
+    )
 
-    print_success(
-        "Nothing changed. You can use the old model stored at '{}'."
-        "".format(os.path.abspath(old_model))
+    return model.package_model(
+        fingerprint=new_fingerprint,
+        output_directory=output_path,
+        train_path=train_path,
+        fixed_model_name=fixed_model_name,
     )
-    return old_model
 
 
 async def _do_training(
@@ -412,7 +423,9 @@ async def _train_core_with_validated_data(
 
         if train_path is None:
             # Only Core was trained.
-            new_fingerprint = await model.model_fingerprint(file_importer)
+            new_fingerprint = await model.model_fingerprint(
+                file_importer, cache_directory=output
+            )
             return model.package_model(
                 fingerprint=new_fingerprint,
                 output_directory=output,
@@ -544,7 +557,9 @@ async def _train_nlu_with_validated_data(
 
         if train_path is None:
             # Only NLU was trained
-            new_fingerprint = await model.model_fingerprint(file_importer)
+            new_fingerprint = await model.model_fingerprint(
+                file_importer, cache_directory=output
+            )
 
             return model.package_model(
                 fingerprint=new_fingerprint,
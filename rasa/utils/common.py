@@ -46,6 +46,16 @@ def arguments_of(func: Callable) -> List[Text]:
     return list(inspect.signature(func).parameters.keys())
 
 
+def accepts_kwargs(func: Callable) -> bool:
+    """Check if the function `func` accepts arbitrary keyword arguments."""
+    import inspect
+
+    return any(
+        parameter.kind == inspect.Parameter.VAR_KEYWORD
+        for parameter in inspect.signature(func).parameters.values()
+    )
+
+
 def read_global_config() -> Dict[Text, Any]:
     """Read global Rasa configuration."""
     # noinspection PyBroadException
@@ -1,12 +1,19 @@
 import aiohttp
+import asyncio
 import logging
 import os
 from aiohttp.client_exceptions import ContentTypeError
 from sanic.request import Request
-from typing import Any, Optional, Text, Dict
+from types import SimpleNamespace
+from typing import Any, Optional, Text, Dict, List
 
 import rasa.utils.io
-from rasa.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.constants import (
+    DEFAULT_ENDPOINT_KEEPALIVE_TIMEOUT,
+    DEFAULT_ENDPOINT_POOL_SIZE,
+    DEFAULT_ENDPOINT_POOL_SIZE_PER_HOST,
+    DEFAULT_REQUEST_TIMEOUT,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -67,8 +74,97 @@ def concat_url(base: Text, subpath: Optional[Text]) -> Text:
     return url + subpath
 
 
+class EndpointStatistics:
+    """Collects the timings of the requests which were sent to an endpoint."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.failed_requests = 0
+        # total time in seconds from sending a request until receiving the response
+        self.request_time = 0.0
+        # connections which had to be opened (including e.g. TLS handshakes)
+        self.new_connections = 0
+        self.connection_time = 0.0
+        # connections which were taken from the connection pool
+        self.reused_connections = 0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Creates an `aiohttp` trace config which records the request timings."""
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        trace_config.on_connection_create_start.append(self._on_connection_start)
+        trace_config.on_connection_create_end.append(self._on_connection_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+
+        return trace_config
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_event_loop().time()
+
+    async def _on_request_start(
+        self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any
+    ) -> None:
+        context.request_start = self._now()
+
+    async def _on_request_end(
+        self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any
+    ) -> None:
+        self.requests += 1
+        self.request_time += self._now() - context.request_start
+
+    async def _on_request_exception(
+        self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any
+    ) -> None:
+        self.requests += 1
+        self.failed_requests += 1
+        self.request_time += self._now() - context.request_start
+
+    async def _on_connection_start(
+        self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any
+    ) -> None:
+        context.connection_start = self._now()
+
+    async def _on_connection_end(
+        self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any
+    ) -> None:
+        self.new_connections += 1
+        self.connection_time += self._now() - context.connection_start
+
+    async def _on_connection_reused(
+        self, _: aiohttp.ClientSession, __: SimpleNamespace, ___: Any
+    ) -> None:
+        self.reused_connections += 1
+
+    def as_dict(self) -> Dict[Text, Any]:
+        return {
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "average_request_time_in_ms": (
+                1000 * self.request_time / self.requests if self.requests else 0.0
+            ),
+            "new_connections": self.new_connections,
+            "average_connection_time_in_ms": (
+                1000 * self.connection_time / self.new_connections
+                if self.new_connections
+                else 0.0
+            ),
+            "reused_connections": self.reused_connections,
+        }
+
+
 class EndpointConfig:
-    """Configuration for an external HTTP endpoint."""
+    """Configuration for an external HTTP endpoint.
+
+    Requests to the endpoint share a single client session. Its connection pool
+    keeps connections alive, so that consecutive requests don't have to open a new
+    connection (and do a new TLS handshake) every time. The pool is configured with
+    `pool_size` (connections in total), `pool_size_per_host` and
+    `keepalive_timeout` (seconds until an idle connection is closed).
+    """
 
     def __init__(
         self,
@@ -89,7 +185,17 @@ class EndpointConfig:
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.kwargs = kwargs
 
-    def session(self) -> aiohttp.ClientSession:
+        self.statistics = EndpointStatistics()
+        self._pooled_session: Optional[aiohttp.ClientSession] = None
+        self._pooled_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def session(
+        self,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        trace_configs: Optional[List[aiohttp.TraceConfig]] = None,
+    ) -> aiohttp.ClientSession:
+        """Creates a new client session. The caller has to close it."""
+
         # create authentication parameters
         if self.basic_auth:
             auth = aiohttp.BasicAuth(
@@ -102,8 +208,71 @@ class EndpointConfig:
             headers=self.headers,
             auth=auth,
             timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            connector=connector,
+            trace_configs=trace_configs,
         )
 
+    def pooled_session(self) -> aiohttp.ClientSession:
+        """Returns the client session which is shared by all requests.
+
+        The session is created on first use. Sessions can't be used across event
+        loops, e.g. in forked Sanic workers, so a new session is created if the
+        current event loop is a different one. The session of the previous event
+        loop is closed.
+        """
+
+        loop = asyncio.get_event_loop()
+        if (
+            self._pooled_session is None
+            or self._pooled_session.closed
+            or self._pooled_session_loop is not loop
+        ):
+            self._close_stale_session(loop)
+
+            # the pool parameters are left in `kwargs`, as endpoint configs of e.g.
+            # custom tracker stores might use the same names for their own arguments
+            connector = aiohttp.TCPConnector(
+                limit=self.kwargs.get("pool_size", DEFAULT_ENDPOINT_POOL_SIZE),
+                limit_per_host=self.kwargs.get(
+                    "pool_size_per_host", DEFAULT_ENDPOINT_POOL_SIZE_PER_HOST
+                ),
+                keepalive_timeout=self.kwargs.get(
+                    "keepalive_timeout", DEFAULT_ENDPOINT_KEEPALIVE_TIMEOUT
+                ),
+            )
+            self._pooled_session = self.session(
+                connector, [self.statistics.trace_config()]
+            )
+            self._pooled_session_loop = loop
+
+        return self._pooled_session
+
+    def _close_stale_session(self, loop: asyncio.AbstractEventLoop) -> None:
+        stale_session = self._pooled_session
+        if stale_session is None or stale_session.closed:
+            return
+
+        if self._pooled_session_loop.is_running():
+            # the previous event loop is still running in another thread
+            asyncio.run_coroutine_threadsafe(
+                stale_session.close(), self._pooled_session_loop
+            )
+        else:
+            asyncio.ensure_future(stale_session.close(), loop=loop)
+
+    async def close_session(self) -> None:
+        """Closes the shared client session and its open connections."""
+
+        if (
+            self._pooled_session is not None
+            and not self._pooled_session.closed
+            and self._pooled_session_loop is asyncio.get_event_loop()
+        ):
+            await self._pooled_session.close()
+
+        self._pooled_session = None
+        self._pooled_session_loop = None
+
     def combine_parameters(
         self, kwargs: Optional[Dict[Text, Any]] = None
     ) -> Dict[Text, Any]:
@@ -141,22 +310,21 @@ class EndpointConfig:
             del kwargs["headers"]
 
         url = concat_url(self.url, subpath)
-        async with self.session() as session:
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                params=self.combine_parameters(kwargs),
-                **kwargs,
-            ) as response:
-                if response.status >= 400:
-                    raise ClientResponseError(
-                        response.status, response.reason, await response.content.read()
-                    )
-                try:
-                    return await response.json()
-                except ContentTypeError:
-                    return None
+        async with self.pooled_session().request(
+            method,
+            url,
+            headers=headers,
+            params=self.combine_parameters(kwargs),
+            **kwargs,
+        ) as response:
+            if response.status >= 400:
+                raise ClientResponseError(
+                    response.status, response.reason, await response.content.read()
+                )
+            try:
+                return await response.json()
+            except ContentTypeError:
+                return None
 
     @classmethod
     def from_dict(cls, data) -> "EndpointConfig":
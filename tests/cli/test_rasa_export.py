@@ -10,7 +10,9 @@ from _pytest.pytester import RunResult
 import rasa.core.utils as rasa_core_utils
 from rasa.cli import export
 from rasa.core.brokers.pika import PikaEventBroker
+from rasa.core.domain import Domain
 from rasa.core.events import UserUttered
+from rasa.core.tracker_store import InMemoryTrackerStore
 from rasa.core.trackers import DialogueStateTracker
 from rasa.exceptions import PublishingError, NoEventsToMigrateError
 from tests.conftest import (
@@ -26,7 +28,8 @@ def test_export_help(run: Callable[..., RunResult]):
     help_text = """usage: rasa export [-h] [-v] [-vv] [--quiet] [--endpoints ENDPOINTS]
                    [--minimum-timestamp MINIMUM_TIMESTAMP]
                    [--maximum-timestamp MAXIMUM_TIMESTAMP]
-                   [--conversation-ids CONVERSATION_IDS]"""
+                   [--conversation-ids CONVERSATION_IDS]
+                   [--checkpoint-file CHECKPOINT_FILE]"""
 
     lines = help_text.split("\n")
 
@@ -192,6 +195,7 @@ def prepare_namespace_and_mocked_tracker_store_with_events(
         conversation_ids=",".join(requested_conversation_ids),
         minimum_timestamp=1.0,
         maximum_timestamp=10.0,
+        checkpoint_file=None,
     )
 
     # prepare events from different senders and different timestamps
@@ -202,16 +206,12 @@ def prepare_namespace_and_mocked_tracker_store_with_events(
         all_conversation_ids[2]: [events[5]],
     }
 
-    def _get_tracker(conversation_id: Text) -> DialogueStateTracker:
-        return DialogueStateTracker.from_events(
-            conversation_id, events_for_conversation_id[conversation_id]
+    tracker_store = InMemoryTrackerStore(Domain.empty())
+    for conversation_id, conversation_events in events_for_conversation_id.items():
+        tracker_store.save(
+            DialogueStateTracker.from_events(conversation_id, conversation_events)
         )
 
-    # mock tracker store
-    tracker_store = Mock()
-    tracker_store.keys.return_value = all_conversation_ids
-    tracker_store.retrieve.side_effect = _get_tracker
-
     monkeypatch.setattr(export, "_get_tracker_store", lambda _: tracker_store)
 
     return events, namespace
@@ -222,28 +222,22 @@ def test_export_trackers(tmp_path: Path, monkeypatch: MonkeyPatch):
         tmp_path, monkeypatch
     )
 
-    # mock event broker so we can check its `publish` method is called
+    # mock event broker so we can check its `publish_batch` method is called
     event_broker = Mock()
-    event_broker.publish = Mock()
     monkeypatch.setattr(export, "_get_event_broker", lambda _: event_broker)
 
     # run the export function
     export.export_trackers(namespace)
 
-    # check that only events 1, 2, 3, and 4 have been published
+    # check that only events 1, 2, 3, and 4 have been published in one batch
     # event 6 was sent by `id-3` which was not requested, and event 5
     # lies outside the requested time range
-    calls = event_broker.publish.mock_calls
-
-    # only four events were published (i.e. `publish()` method was called four times)
-    assert len(calls) == 4
+    event_broker.publish_batch.assert_called_once()
+    published_events = event_broker.publish_batch.call_args[0][0]
 
-    # call objects are tuples of (name, pos. args, kwargs)
-    # args itself is a tuple, and we want to access the first one, hence `call[1][0]`
-    # check that events 1-4 were published
-    assert all(
-        any(call[1][0]["text"] == event.text for call in calls) for event in events[:4]
-    )
+    assert [event["text"] for event in published_events] == [
+        event.text for event in events[:4]
+    ]
 
 
 @pytest.mark.parametrize("exception", [NoEventsToMigrateError, PublishingError(123)])
@@ -254,9 +248,9 @@ def test_export_trackers_publishing_exceptions(
         tmp_path, monkeypatch
     )
 
-    # mock event broker so we can check its `publish` method is called
+    # mock event broker so we can check its `publish_batch` method is called
     event_broker = Mock()
-    event_broker.publish.side_effect = exception
+    event_broker.publish_batch.side_effect = exception
     monkeypatch.setattr(export, "_get_event_broker", lambda _: event_broker)
 
     with pytest.raises(SystemExit):
@@ -31,7 +31,7 @@ from rasa.core.events import (
 )
 from rasa.core.interpreter import RegexInterpreter
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator
-from rasa.core.policies.rule_policy import RulePolicy
+from rasa.core.policies.rule_policy import RulePolicy, RULES
 from rasa.core.trackers import DialogueStateTracker
 from rasa.core.training.generator import TrackerWithCachedStates
 
@@ -1172,3 +1172,40 @@ def test_predict_nothing_if_fallback_disabled():
     action_probabilities = policy.predict_action_probabilities(new_conversation, domain)
 
     assert max(action_probabilities) == 0
+
+
+def test_rules_are_matched_using_an_index_of_the_current_turn():
+    lookup = {
+        "prev_action_listen intent_greet": "utter_greet",
+        "prev_action_listen intent_goodbye": "utter_goodbye",
+        "prev_utter_ask|prev_action_listen intent_affirm": "utter_affirmed",
+        "prev_action_listen slot_name_None": "utter_ask_name",
+    }
+    policy = RulePolicy(lookup={RULES: lookup})
+    rule_index = policy._rule_index_for(lookup)
+
+    state = {"prev_action_listen": 1.0, "intent_greet": 1.0}
+    # rules which require features of the current turn which are not present
+    # are not checked at all
+    assert set(rule_index._candidates(state)) == {
+        "prev_action_listen intent_greet",
+        "prev_action_listen slot_name_None",
+    }
+    assert policy._get_possible_keys(lookup, [state]) == {
+        "prev_action_listen intent_greet",
+        "prev_action_listen slot_name_None",
+    }
+
+    states = [
+        {"prev_utter_ask": 1.0},
+        {"prev_action_listen": 1.0, "intent_affirm": 1.0},
+    ]
+    assert policy._get_possible_keys(lookup, states) == {
+        "prev_utter_ask|prev_action_listen intent_affirm",
+        "prev_action_listen slot_name_None",
+    }
+
+    # the index is compiled again if the rules change
+    lookup["prev_action_listen intent_greet"] = "utter_greet_again"
+    lookup["prev_action_listen"] = "utter_anything"
+    assert "prev_action_listen" in policy._get_possible_keys(lookup, [state])
@@ -1,6 +1,8 @@
-from typing import List
+from collections import OrderedDict
+from typing import List, Text
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 
 import rasa.core
@@ -354,6 +356,140 @@ async def test_remote_action_endpoint_responds_400(
     assert "Custom action 'my_action' rejected to run" in str(execinfo.value)
 
 
+async def test_remote_action_sends_events_since_last_call(
+    default_channel, default_nlg, default_domain
+):
+    url = "https://example.com/webhooks/events-since-last-call"
+    endpoint = EndpointConfig(url, event_verbosity="since_last_call")
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "since-last-call", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []}, repeat=True)
+
+        await remote_action.run(default_channel, default_nlg, tracker, default_domain)
+        new_event = ActionExecuted("my_action")
+        tracker.update(new_event)
+        await remote_action.run(default_channel, default_nlg, tracker, default_domain)
+
+        r = latest_request(mocked, "post", url)
+
+    first_call, second_call = [call.kwargs["json"] for call in r]
+    assert first_call["events_offset"] == 0
+    assert len(first_call["tracker"]["events"]) == 2
+    assert second_call["event_verbosity"] == "since_last_call"
+    assert second_call["events_offset"] == 2
+    assert second_call["tracker"]["events"] == [new_event.as_dict()]
+
+
+async def test_remote_action_sends_all_events_if_sent_events_changed(
+    default_channel, default_nlg, default_domain
+):
+    url = "https://example.com/webhooks/replaced-conversation"
+    endpoint = EndpointConfig(url, event_verbosity="since_last_call")
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "replaced", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+    # same number of events, but the conversation was replaced in the meantime
+    replaced_tracker = DialogueStateTracker.from_events(
+        "replaced",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("bye", timestamp=1)],
+    )
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []}, repeat=True)
+
+        await remote_action.run(default_channel, default_nlg, tracker, default_domain)
+        await remote_action.run(
+            default_channel, default_nlg, replaced_tracker, default_domain
+        )
+
+        r = latest_request(mocked, "post", url)
+
+    second_call = r[1].kwargs["json"]
+    assert second_call["events_offset"] == 0
+    assert len(second_call["tracker"]["events"]) == 2
+
+
+def test_action_server_states_are_limited(monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(action, "_action_server_states", OrderedDict())
+    monkeypatch.setattr(action, "MAX_ACTION_SERVERS", 2)
+
+    states = [
+        action.ActionServerState.for_endpoint(
+            EndpointConfig(f"https://example.com/{i}", cache_domain=True)
+        )
+        for i in range(3)
+    ]
+
+    def state_of(url: Text) -> action.ActionServerState:
+        return action.ActionServerState.for_endpoint(
+            EndpointConfig(url, cache_domain=True)
+        )
+
+    assert len(action._action_server_states) == 2
+    assert state_of("https://example.com/2") is states[2]
+    # the least recently used state was dropped
+    assert state_of("https://example.com/0") is not states[0]
+
+
+async def test_remote_action_sends_cached_domain_only_once(
+    default_channel, default_nlg, default_tracker, default_domain
+):
+    url = "https://example.com/webhooks/cached-domain"
+    endpoint = EndpointConfig(url, event_verbosity="applied", cache_domain=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []}, repeat=True)
+
+        for _ in range(2):
+            await remote_action.run(
+                default_channel, default_nlg, default_tracker, default_domain
+            )
+
+        r = latest_request(mocked, "post", url)
+
+    first_call, second_call = [call.kwargs["json"] for call in r]
+    assert first_call["domain"] == default_domain.as_dict()
+    assert first_call["domain_hash"] == default_domain.fingerprint
+    assert "domain" not in second_call
+    assert second_call["domain_hash"] == default_domain.fingerprint
+
+
+async def test_remote_action_resends_state_missing_on_action_server(
+    default_channel, default_nlg, default_domain
+):
+    url = "https://example.com/webhooks/restarted-action-server"
+    endpoint = EndpointConfig(url, event_verbosity="since_last_call", cache_domain=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "restarted", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []})
+        # noinspection PyTypeChecker
+        mocked.post(url, exception=ClientResponseError(412, None, ""))
+        mocked.post(url, payload={"events": [], "responses": []})
+
+        await remote_action.run(default_channel, default_nlg, tracker, default_domain)
+        tracker.update(ActionExecuted("my_action"))
+        await remote_action.run(default_channel, default_nlg, tracker, default_domain)
+
+        r = latest_request(mocked, "post", url)
+
+    rejected_call, repeated_call = [call.kwargs["json"] for call in r[1:]]
+    assert rejected_call["events_offset"] == 2
+    assert "domain" not in rejected_call
+    assert repeated_call["events_offset"] == 0
+    assert len(repeated_call["tracker"]["events"]) == 3
+    assert repeated_call["domain"] == default_domain.as_dict()
+
+
 async def test_action_utter_retrieved_response(
     default_channel, default_nlg, default_tracker, default_domain
 ):
@@ -1,4 +1,8 @@
 import asyncio
+import copy
+import os
+import tempfile
+from pathlib import Path
 from typing import Any, Dict, Text, List, Callable, Optional
 from unittest.mock import Mock
 
@@ -17,7 +21,7 @@ from rasa.core.policies.ted_policy import TEDPolicy
 from rasa.core.policies.mapping_policy import MappingPolicy
 import rasa.utils.io
 from rasa.core import jobs, utils
-from rasa.core.agent import Agent, load_agent
+from rasa.core.agent import Agent, SharedModelDirectory, load_agent
 from rasa.core.channels.channel import UserMessage
 from rasa.core.domain import Domain, InvalidDomain
 from rasa.core.interpreter import INTENT_MESSAGE_PREFIX
@@ -219,6 +223,76 @@ async def test_pull_model_with_invalid_domain(
     assert error_message in caplog.text
 
 
+async def test_only_one_worker_pulls_shared_models(
+    model_server: TestClient, tmp_path: Path
+):
+    model_endpoint_config = EndpointConfig.from_dict(
+        {"url": model_server.make_url("/model"), "wait_time_between_pulls": None}
+    )
+    shared_models = SharedModelDirectory(str(tmp_path))
+    # forked workers inherit the shared model directory of the main process
+    workers = [copy.copy(shared_models) for _ in range(3)]
+
+    agents = [
+        await rasa.core.agent.load_from_server(Agent(), model_endpoint_config, worker)
+        for worker in workers
+    ]
+
+    assert [worker.is_pulling_worker() for worker in workers] == [True, False, False]
+    assert model_server.app.number_of_model_requests == 1
+    assert {agent.fingerprint for agent in agents} == {"somehash"}
+    assert {agent.model_directory for agent in agents} == {shared_models.latest()[0]}
+
+
+def test_pulling_worker_hands_over_if_lease_expires(tmp_path: Path):
+    shared_models = SharedModelDirectory(str(tmp_path), pulling_lease=1000)
+    first_worker, second_worker = [copy.copy(shared_models) for _ in range(2)]
+
+    assert first_worker.is_pulling_worker()
+    assert not second_worker.is_pulling_worker()
+
+    # the first worker stops renewing its lease, e.g. because it crashed
+    shared_models._lease_expires_at.value = 0
+
+    assert second_worker.is_pulling_worker()
+    assert not first_worker.is_pulling_worker()
+
+
+def test_pulling_worker_limits_pulls(tmp_path: Path):
+    shared_models = SharedModelDirectory(str(tmp_path))
+
+    assert shared_models.should_pull(wait_time_between_pulls=1000)
+    assert shared_models.is_pulling_worker()
+    assert not shared_models.should_pull(wait_time_between_pulls=1000)
+
+
+def test_shared_model_directory_keeps_latest_and_previous_model(tmp_path: Path):
+    shared_models = SharedModelDirectory(str(tmp_path))
+    assert shared_models.latest() is None
+
+    model_directories = []
+    for fingerprint in range(3):
+        model_directories.append(tempfile.mkdtemp(dir=str(tmp_path)))
+        shared_models.publish(model_directories[-1], str(fingerprint))
+
+    assert shared_models.latest() == (model_directories[-1], "2")
+    assert [os.path.exists(directory) for directory in model_directories] == [
+        False,
+        True,
+        True,
+    ]
+
+
+async def test_load_agent_from_shared_model(trained_rasa_model: Text, tmp_path: Path):
+    shared_models = SharedModelDirectory(str(tmp_path))
+    shared_models.unpack(trained_rasa_model)
+
+    agent = await load_agent(model_path=None, shared_models=shared_models)
+
+    assert agent.is_ready()
+    assert agent.model_directory == shared_models.latest()[0]
+
+
 async def test_load_agent(trained_rasa_model: Text):
     agent = await load_agent(model_path=trained_rasa_model)
 
@@ -1,13 +1,17 @@
 import json
 import logging
+import threading
+import time
 from pathlib import Path
 
-from typing import Union, Text, List, Optional, Type
+from typing import Any, Dict, Union, Text, List, Optional, Type
 
 import pytest
+import sqlalchemy
 from _pytest.logging import LogCaptureFixture
 
 from _pytest.monkeypatch import MonkeyPatch
+from unittest.mock import Mock
 
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.brokers.file import FileEventBroker
@@ -226,3 +230,289 @@ def test_pika_logs_in_debug_mode(caplog: LogCaptureFixture, monkeypatch: MonkeyP
             )
 
     assert len(caplog.records) > 0
+
+
+class FakeKafkaFuture:
+    def __init__(self) -> None:
+        self.errbacks = []
+
+    def add_errback(self, errback, *args) -> "FakeKafkaFuture":
+        self.errbacks.append((errback, args))
+        return self
+
+
+class FakeKafkaProducer:
+    instances = []
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.buffer = []
+        self.sent = []
+        self.closed = False
+        FakeKafkaProducer.instances.append(self)
+
+    def send(self, topic: Text, value: Dict) -> FakeKafkaFuture:
+        # events are only buffered and sent in a batch once `linger_ms` passed
+        self.buffer.append((topic, self.kwargs["value_serializer"](value)))
+        return FakeKafkaFuture()
+
+    def flush(self) -> None:
+        self.sent.extend(self.buffer)
+        self.buffer = []
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_kafka_broker_reuses_producer_and_flushes_on_close(monkeypatch: MonkeyPatch):
+    import kafka
+
+    FakeKafkaProducer.instances = []
+    monkeypatch.setattr(kafka, "KafkaProducer", FakeKafkaProducer)
+
+    broker = KafkaEventBroker(
+        "localhost", topic="rasa", linger_ms=100, compression_type="gzip"
+    )
+    events = [event.as_dict() for event in TEST_EVENTS]
+    for event in events:
+        broker.publish(event)
+
+    assert len(FakeKafkaProducer.instances) == 1
+    producer = FakeKafkaProducer.instances[0]
+    assert producer.kwargs["linger_ms"] == 100
+    assert producer.kwargs["compression_type"] == "gzip"
+    assert not producer.sent
+    assert not producer.closed
+
+    broker.close()
+
+    assert [json.loads(value) for _, value in producer.sent] == events
+    assert all(topic == "rasa" for topic, _ in producer.sent)
+    assert producer.closed
+
+    # a new producer is created once events are published after closing
+    broker.publish(events[0])
+    assert len(FakeKafkaProducer.instances) == 2
+
+
+def test_kafka_broker_close_without_producer():
+    KafkaEventBroker("localhost").close()
+
+
+def _sql_broker_events(broker: SQLEventBroker) -> List[Dict]:
+    with broker.session_scope() as session:
+        return [
+            json.loads(event.data)
+            for event in session.query(broker.SQLBrokerEvent)
+            .order_by(broker.SQLBrokerEvent.id)
+            .all()
+        ]
+
+
+def test_sql_broker_write_behind_inserts_in_batches(tmp_path: Path):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"),
+        write_behind=True,
+        batch_size=2,
+        flush_interval=60,
+    )
+    statements = []
+    sqlalchemy.event.listen(
+        broker.engine,
+        "before_cursor_execute",
+        lambda _, __, statement, *args: statements.append(statement),
+    )
+
+    events = [event.as_dict() for event in TEST_EVENTS]
+    for event in events:
+        broker.publish(event)
+
+    broker.close()
+
+    assert _sql_broker_events(broker) == events
+    # one statement for the first batch and one for the rest flushed on `close`
+    inserts = [s for s in statements if s.startswith("INSERT")]
+    assert len(inserts) == 2
+
+
+def test_sql_broker_write_behind_flushes_after_interval(tmp_path: Path):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"), write_behind=True, flush_interval=0.01
+    )
+
+    broker.publish(TEST_EVENTS[0].as_dict())
+
+    deadline = time.monotonic() + 5
+    while not _sql_broker_events(broker) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert _sql_broker_events(broker) == [TEST_EVENTS[0].as_dict()]
+    broker.close()
+
+
+@pytest.mark.parametrize("retry_failed_inserts", [True, False])
+def test_sql_broker_write_behind_failed_insert(
+    tmp_path: Path, monkeypatch: MonkeyPatch, retry_failed_inserts: bool
+):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"),
+        write_behind=True,
+        flush_interval=0.01,
+        retry_failed_inserts=retry_failed_inserts,
+    )
+    insert_rows = broker._insert_rows
+    attempts = []
+    first_attempt = threading.Event()
+
+    def fail_once(rows: List[Dict]) -> List[Dict]:
+        attempts.append(len(rows))
+        first_attempt.set()
+        if len(attempts) == 1:
+            with monkeypatch.context() as m:
+                m.setattr(broker.engine, "begin", Mock(side_effect=Exception()))
+                return insert_rows(rows)
+        return insert_rows(rows)
+
+    monkeypatch.setattr(broker, "_insert_rows", fail_once)
+
+    broker.publish(TEST_EVENTS[0].as_dict())
+    assert first_attempt.wait(timeout=5)
+    broker.publish(TEST_EVENTS[1].as_dict())
+    broker.close()
+
+    if retry_failed_inserts:
+        expected = [TEST_EVENTS[0].as_dict(), TEST_EVENTS[1].as_dict()]
+    else:
+        expected = [TEST_EVENTS[1].as_dict()]
+    assert _sql_broker_events(broker) == expected
+
+
+def test_sql_broker_write_behind_drops_events_which_fail_permanently(
+    tmp_path: Path, caplog: LogCaptureFixture
+):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"),
+        write_behind=True,
+        flush_interval=0.01,
+        max_insert_retries=2,
+    )
+
+    def reject_invalid_event(*args: Any) -> None:
+        parameters = args[3]
+        if "invalid" in str(parameters):
+            raise ValueError("The database rejects this event.")
+
+    sqlalchemy.event.listen(
+        broker.engine, "before_cursor_execute", reject_invalid_event
+    )
+
+    valid_events = [{"event": "action", "sender_id": str(i)} for i in range(2)]
+    with caplog.at_level(logging.ERROR):
+        broker.publish_batch([valid_events[0], {"event": "invalid"}])
+
+        deadline = time.monotonic() + 5
+        while "Dropping" not in caplog.text and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert "Dropping 1 events" in caplog.text
+
+    # the worker inserts new events afterwards
+    broker.publish(valid_events[1])
+    broker.close()
+
+    assert _sql_broker_events(broker) == valid_events
+
+
+def test_sql_broker_write_behind_drops_events_if_buffer_is_full(
+    tmp_path: Path, monkeypatch: MonkeyPatch, caplog: LogCaptureFixture
+):
+    # without a worker nothing is taken out of the buffer
+    monkeypatch.setattr(SQLEventBroker, "_insert_buffered_events", lambda _: None)
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"),
+        write_behind=True,
+        max_buffer_size=1,
+        publish_timeout=0.01,
+    )
+
+    broker.publish(TEST_EVENTS[0].as_dict())
+    with caplog.at_level(logging.ERROR):
+        broker.publish(TEST_EVENTS[1].as_dict())
+
+    assert "Dropping event" in caplog.text
+    assert broker._buffer.qsize() == 1
+
+
+def test_sql_broker_write_behind_close_stops_retrying(
+    tmp_path: Path, monkeypatch: MonkeyPatch, caplog: LogCaptureFixture
+):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"),
+        write_behind=True,
+        batch_size=2,
+        flush_interval=60,
+        close_timeout=5,
+    )
+    attempts = []
+    failed_batch = threading.Event()
+
+    def fail(rows: List[Dict]) -> List[Dict]:
+        attempts.append(len(rows))
+        if len(rows) == broker.batch_size:
+            failed_batch.set()
+        return rows
+
+    monkeypatch.setattr(broker, "_insert_rows", fail)
+
+    for event in TEST_EVENTS[:3]:
+        broker.publish(event.as_dict())
+    # the worker retries the full batch without reading from the buffer
+    assert failed_batch.wait(timeout=5)
+
+    with caplog.at_level(logging.ERROR):
+        broker.close()
+
+    assert broker._worker is None
+    assert "3 buffered events" in caplog.text
+
+    # publishing after the broker was closed inserts the event directly
+    monkeypatch.undo()
+    broker.publish(TEST_EVENTS[0].as_dict())
+    assert _sql_broker_events(broker) == [TEST_EVENTS[0].as_dict()]
+
+
+def test_sql_broker_write_behind_close_waits_for_publishing_threads(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"), write_behind=True, flush_interval=60
+    )
+    buffer_event = broker._buffer_event
+    buffering = threading.Event()
+
+    def slow_buffer_event(event: Dict) -> None:
+        buffering.set()
+        # `close` is called while the event is buffered
+        time.sleep(0.1)
+        buffer_event(event)
+
+    monkeypatch.setattr(broker, "_buffer_event", slow_buffer_event)
+
+    publisher = threading.Thread(
+        target=broker.publish, args=(TEST_EVENTS[0].as_dict(),)
+    )
+    publisher.start()
+    assert buffering.wait(timeout=5)
+    broker.close()
+    publisher.join()
+
+    assert _sql_broker_events(broker) == [TEST_EVENTS[0].as_dict()]
+
+
+def test_sql_broker_publish_batch(tmp_path: Path):
+    broker = SQLEventBroker(db=str(tmp_path / "events.db"))
+    events = [event.as_dict() for event in TEST_EVENTS]
+
+    broker.publish_batch(events)
+
+    assert _sql_broker_events(broker) == events
@@ -422,3 +422,81 @@ def test_mutual_exclusion_of_rule_policy_and_old_rule_like_policies(
     policy_config = [{"name": policy_name} for policy_name in policies]
     with pytest.raises(InvalidPolicyConfig):
         PolicyEnsemble.from_dict({"policies": policy_config})
+
+
+def test_shared_prediction_states_are_sliced_for_each_policy(default_domain: Domain):
+    from rasa.core.featurizers import (
+        MaxHistoryTrackerFeaturizer,
+        BinarySingleStateFeaturizer,
+    )
+    from rasa.core.policies.memoization import (
+        MemoizationPolicy,
+        AugmentedMemoizationPolicy,
+    )
+
+    non_standard_featurizer = MaxHistoryTrackerFeaturizer(
+        BinarySingleStateFeaturizer(), max_history=8, use_intent_probabilities=True
+    )
+    ensemble = SimplePolicyEnsemble(
+        [
+            MemoizationPolicy(max_history=2),
+            AugmentedMemoizationPolicy(max_history=4),
+            MemoizationPolicy(featurizer=non_standard_featurizer, priority=1),
+        ]
+    )
+
+    tracker = DialogueStateTracker.from_events(
+        "sender",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": "greet", "confidence": 0.7}),
+            ActionExecuted("utter_greet"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("bye", {"name": "goodbye", "confidence": 0.4}),
+        ],
+    )
+
+    shared_states = ensemble._shared_prediction_states(tracker, default_domain)
+    # the longest history of the policies with default featurizers
+    assert shared_states.max_history == 4
+
+    for policy in ensemble.policies:
+        states = policy.prediction_states(tracker, default_domain, shared_states)
+        expected = policy.featurizer.prediction_states([tracker], default_domain)
+        assert states == expected[0]
+
+    assert not shared_states.can_be_used_by(
+        non_standard_featurizer, tracker, default_domain
+    )
+
+    # the shared states are outdated as soon as the tracker changes
+    tracker.update(ActionExecuted("utter_goodbye"))
+    assert not shared_states.can_be_used_by(
+        ensemble.policies[0].featurizer, tracker, default_domain
+    )
+
+
+def test_shared_prediction_states_are_passed_to_policies(default_domain: Domain):
+    class StatesPolicy(WorkingPolicy):
+        def predict_action_probabilities(
+            self,
+            tracker: DialogueStateTracker,
+            domain: Domain,
+            interpreter: NaturalLanguageInterpreter = RegexInterpreter(),
+            **kwargs: Any,
+        ) -> List[float]:
+            self.shared_states = kwargs.get("shared_states")
+            return [1.0] + [0.0] * (domain.num_actions - 1)
+
+    ensemble = SimplePolicyEnsemble([StatesPolicy(), StatesPolicy(priority=2)])
+    tracker = DialogueStateTracker.from_events(
+        "sender", [ActionExecuted(ACTION_LISTEN_NAME)]
+    )
+
+    ensemble.probabilities_using_best_policy(
+        tracker, default_domain, RegexInterpreter()
+    )
+
+    first, second = ensemble.policies
+    assert first.shared_states is not None
+    assert first.shared_states is second.shared_states
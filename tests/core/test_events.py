@@ -1,11 +1,13 @@
 import copy
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 import pytz
 import time
 from datetime import datetime
 from dateutil import parser
 from typing import Type
+from unittest.mock import Mock, call
 
 from rasa.core import utils
 from rasa.core.events import (
@@ -26,6 +28,7 @@ from rasa.core.events import (
     UserUtteranceReverted,
     AgentUttered,
     SessionStarted,
+    deserialise_events,
 )
 
 
@@ -300,3 +303,43 @@ def test_event_default_metadata(event_class: Type[Event]):
         assert event.as_dict()["metadata"] == {}
     else:
         assert "metadata" not in event.as_dict()
+
+
+def test_resolve_event_class_defined_after_first_lookup():
+    assert Event.resolve_by_type("action") is ActionExecuted
+
+    class MyEvent(Event):
+        type_name = "my_custom_event"
+
+    assert Event.resolve_by_type("my_custom_event") is MyEvent
+
+
+def test_resolve_by_type_prefers_first_defined_class():
+    class MyActionExecuted(ActionExecuted):
+        pass
+
+    assert Event.resolve_by_type(ActionExecuted.type_name) is ActionExecuted
+
+
+def test_deserialise_many_events(monkeypatch: MonkeyPatch):
+    events = [
+        UserUttered("hello", {"name": "greet", "confidence": 1.0}, [], timestamp=1),
+        ActionExecuted("utter_greet", timestamp=2),
+        BotUttered("hey there", timestamp=3),
+        SlotSet("name", "Peter", timestamp=4),
+        ActionExecuted("action_listen", timestamp=5),
+    ]
+    serialised = [event.as_dict() for event in events] * 20000
+
+    # force the registry of event classes to be rebuilt
+    class MyEvent(Event):
+        type_name = "my_other_custom_event"
+
+    all_subclasses = Mock(wraps=utils.all_subclasses)
+    monkeypatch.setattr(utils, "all_subclasses", all_subclasses)
+
+    deserialised = deserialise_events(serialised)
+
+    assert deserialised == events * 20000
+    # the event classes are looked up once instead of once per event
+    assert all_subclasses.call_args_list.count(call(Event)) == 1
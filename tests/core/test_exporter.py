@@ -12,8 +12,8 @@ import rasa.utils.io as io_utils
 from rasa.core.brokers.pika import PikaEventBroker
 from rasa.core.brokers.sql import SQLEventBroker
 from rasa.core.constants import RASA_EXPORT_PROCESS_ID_HEADER_NAME
-from rasa.core.events import SessionStarted, ActionExecuted
-from rasa.core.tracker_store import SQLTrackerStore
+from rasa.core.events import Event, SessionStarted, ActionExecuted
+from rasa.core.tracker_store import InMemoryTrackerStore, SQLTrackerStore
 from rasa.core.trackers import DialogueStateTracker
 from rasa.exceptions import (
     NoConversationsInTrackerStoreError,
@@ -79,6 +79,16 @@ def test_get_conversation_ids_to_process_error(
         exporter._get_conversation_ids_to_process()
 
 
+def _tracker_store_with_events(events: Dict[Text, List[Event]]) -> InMemoryTrackerStore:
+    tracker_store = InMemoryTrackerStore(Domain.empty())
+    for conversation_id, conversation_events in events.items():
+        tracker_store.save(
+            DialogueStateTracker.from_events(conversation_id, conversation_events)
+        )
+
+    return tracker_store
+
+
 def test_fetch_events_within_time_range():
     conversation_ids = ["some-id", "another-id"]
 
@@ -88,21 +98,13 @@ def test_fetch_events_within_time_range():
     event_3 = random_user_uttered_event(1)
     events = {conversation_ids[0]: [event_1, event_2], conversation_ids[1]: [event_3]}
 
-    def _get_tracker(conversation_id: Text) -> DialogueStateTracker:
-        return DialogueStateTracker.from_events(
-            conversation_id, events[conversation_id]
-        )
-
-    # create mock tracker store
-    tracker_store = Mock()
-    tracker_store.retrieve.side_effect = _get_tracker
-    tracker_store.keys.return_value = conversation_ids
+    tracker_store = _tracker_store_with_events(events)
 
     exporter = MockExporter(tracker_store)
     exporter.requested_conversation_ids = conversation_ids
 
     # noinspection PyProtectedMember
-    fetched_events = exporter._fetch_events_within_time_range()
+    fetched_events = list(exporter._fetch_events_within_time_range())
 
     # events should come back for all requested conversation IDs
     assert all(
@@ -115,10 +117,9 @@ def test_fetch_events_within_time_range():
 
 
 def test_fetch_events_within_time_range_tracker_does_not_err():
-    # create mock tracker store that returns `None` on `retrieve()`
-    tracker_store = Mock()
-    tracker_store.retrieve.return_value = None
-    tracker_store.keys.return_value = [uuid.uuid4()]
+    # create tracker store that returns `None` on `retrieve()`
+    tracker_store = InMemoryTrackerStore(Domain.empty())
+    tracker_store.keys = Mock(return_value=[uuid.uuid4().hex])
 
     exporter = MockExporter(tracker_store)
 
@@ -129,12 +130,8 @@ def test_fetch_events_within_time_range_tracker_does_not_err():
 
 
 def test_fetch_events_within_time_range_tracker_contains_no_events():
-    # create mock tracker store that returns `None` on `retrieve()`
-    tracker_store = Mock()
-    tracker_store.retrieve.return_value = DialogueStateTracker.from_events(
-        "a great ID", []
-    )
-    tracker_store.keys.return_value = ["a great ID"]
+    # create tracker store with a tracker without events
+    tracker_store = _tracker_store_with_events({"a great ID": []})
 
     exporter = MockExporter(tracker_store)
 
@@ -163,64 +160,54 @@ def test_fetch_events_within_time_range_with_session_events():
     exporter = MockExporter(tracker_store=tracker_store)
 
     # noinspection PyProtectedMember
-    fetched_events = exporter._fetch_events_within_time_range()
+    fetched_events = list(exporter._fetch_events_within_time_range())
 
     assert len(fetched_events) == len(events)
 
 
 # noinspection PyProtectedMember
-def test_sort_and_select_events_by_timestamp():
+def test_fetch_events_within_time_range_selects_events_by_timestamp():
     events = [
-        event.as_dict()
-        for event in [
-            random_user_uttered_event(3),
-            random_user_uttered_event(2),
-            random_user_uttered_event(1),
-        ]
+        random_user_uttered_event(3),
+        random_user_uttered_event(2),
+        random_user_uttered_event(1),
     ]
+    tracker_store = _tracker_store_with_events(
+        {"some-id": events[:2], "another-id": events[2:]}
+    )
+    serialised_events = [event.as_dict() for event in events]
+    serialised_events[0]["sender_id"] = serialised_events[1]["sender_id"] = "some-id"
+    serialised_events[2]["sender_id"] = "another-id"
 
-    tracker_store = Mock()
     exporter = MockExporter(tracker_store)
 
-    selected_events = exporter._sort_and_select_events_by_timestamp(events)
-
     # events are sorted
-    assert selected_events == list(
-        sorted(selected_events, key=lambda e: e["timestamp"])
+    assert list(exporter._fetch_events_within_time_range()) == list(
+        reversed(serialised_events)
     )
 
     # apply minimum timestamp requirement, expect to get only two events back
     exporter.minimum_timestamp = 2.0
-    assert exporter._sort_and_select_events_by_timestamp(events) == [
-        events[1],
-        events[0],
+    assert list(exporter._fetch_events_within_time_range()) == [
+        serialised_events[1],
+        serialised_events[0],
     ]
     exporter.minimum_timestamp = None
 
     # apply maximum timestamp requirement, expect to get only one
     exporter.maximum_timestamp = 1.1
-    assert exporter._sort_and_select_events_by_timestamp(events) == [events[2]]
+    assert list(exporter._fetch_events_within_time_range()) == [serialised_events[2]]
 
     # apply both requirements, get one event back
     exporter.minimum_timestamp = 2.0
     exporter.maximum_timestamp = 2.1
-    assert exporter._sort_and_select_events_by_timestamp(events) == [events[1]]
-
+    assert list(exporter._fetch_events_within_time_range()) == [serialised_events[1]]
 
-# noinspection PyProtectedMember
-def test_sort_and_select_events_by_timestamp_error():
-    tracker_store = Mock()
-    exporter = MockExporter(tracker_store)
-
-    # no events given
-    with pytest.raises(NoEventsInTimeRangeError):
-        exporter._sort_and_select_events_by_timestamp([])
-
-    # supply list of events, apply timestamp constraint and no events survive
+    # no events survive the timestamp constraints
     exporter.minimum_timestamp = 3.1
-    events = [random_user_uttered_event(3).as_dict()]
+    exporter.maximum_timestamp = None
     with pytest.raises(NoEventsInTimeRangeError):
-        exporter._sort_and_select_events_by_timestamp(events)
+        exporter._fetch_events_within_time_range()
 
 
 def test_get_message_headers_pika_event_broker():
@@ -272,9 +259,9 @@ def test_publish_with_headers_non_pika_event_broker():
 
 
 def test_publishing_error():
-    # mock event broker so it raises on `publish()`
+    # mock event broker so it raises on `publish_batch()`
     event_broker = Mock()
-    event_broker.publish.side_effect = ValueError()
+    event_broker.publish_batch.side_effect = ValueError()
 
     exporter = MockExporter(event_broker=event_broker)
 
@@ -288,3 +275,47 @@ def test_publishing_error():
     with pytest.raises(PublishingError):
         # noinspection PyProtectedMember
         exporter.publish_events()
+
+
+def test_publish_events_in_batches_with_checkpoint(tmp_path: Path):
+    events = [random_user_uttered_event(timestamp) for timestamp in range(1, 6)]
+    tracker_store = _tracker_store_with_events({"some-id": events})
+    event_broker = Mock()
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    exporter = MockExporter(tracker_store, event_broker)
+    exporter.batch_size = 2
+    exporter.checkpoint_path = checkpoint_path
+
+    assert exporter.publish_events() == 5
+
+    batches = [call[0][0] for call in event_broker.publish_batch.call_args_list]
+    assert [[event["timestamp"] for event in batch] for batch in batches] == [
+        [1, 2],
+        [3, 4],
+        [5],
+    ]
+    assert io_utils.read_json_file(checkpoint_path) == {"timestamp": 5}
+
+    # the next export continues from the checkpoint
+    event_broker = Mock()
+    exporter = MockExporter(tracker_store, event_broker)
+    exporter.checkpoint_path = checkpoint_path
+
+    assert exporter.publish_events() == 1
+    assert event_broker.publish_batch.call_args[0][0][0]["timestamp"] == 5
+
+
+def test_publishing_error_reports_last_published_batch():
+    events = [random_user_uttered_event(timestamp) for timestamp in range(1, 6)]
+    tracker_store = _tracker_store_with_events({"some-id": events})
+    event_broker = Mock()
+    event_broker.publish_batch.side_effect = [None, ValueError()]
+
+    exporter = MockExporter(tracker_store, event_broker)
+    exporter.batch_size = 2
+
+    with pytest.raises(PublishingError) as error:
+        exporter.publish_events()
+
+    assert error.value.timestamp == 2
@@ -1,8 +1,13 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Text
+
 import pytest
 from aioresponses import aioresponses
 
 from rasa.core.interpreter import (
     INTENT_MESSAGE_PREFIX,
+    BatchingInterpreter,
+    NaturalLanguageInterpreter,
     RasaNLUHttpInterpreter,
     RegexInterpreter,
 )
@@ -120,3 +125,129 @@ async def test_http_interpreter(endpoint_url, joined_url):
         response = {"text": "message_text", "token": None, "message_id": "message_id"}
 
         assert query == response
+
+
+class CountingInterpreter(RegexInterpreter):
+    def __init__(self) -> None:
+        self.batches = []
+
+    async def parse_batch(
+        self,
+        texts: List[Text],
+        message_ids: Optional[List[Optional[Text]]] = None,
+        tracker=None,
+    ) -> List[Dict[Text, Any]]:
+        self.batches.append(texts)
+        return await super().parse_batch(texts, message_ids, tracker)
+
+
+async def test_batching_interpreter_coalesces_concurrent_messages():
+    wrapped = CountingInterpreter()
+    interpreter = BatchingInterpreter(wrapped, max_batch_size=3, max_wait_time_in_ms=50)
+
+    texts = [f"{INTENT_MESSAGE_PREFIX}intent_{i}" for i in range(5)]
+    results = await asyncio.gather(*[interpreter.parse(text) for text in texts])
+
+    assert [r["intent"][INTENT_NAME_KEY] for r in results] == [
+        f"intent_{i}" for i in range(5)
+    ]
+    # the first batch is full, the second one is flushed after the wait time
+    assert wrapped.batches == [texts[:3], texts[3:]]
+
+    statistics = interpreter.statistics.as_dict()
+    assert statistics["batch_size"]["count"] == 2
+    assert statistics["batch_size"]["sum"] == 5
+    assert statistics["latency_in_ms"]["count"] == 2
+
+
+async def test_batching_interpreter_propagates_errors():
+    class FailingInterpreter(NaturalLanguageInterpreter):
+        async def parse_batch(self, texts, message_ids=None, tracker=None):
+            raise ValueError("failed")
+
+    interpreter = BatchingInterpreter(FailingInterpreter(), max_wait_time_in_ms=1)
+
+    with pytest.raises(ValueError):
+        await interpreter.parse("hello")
+
+
+async def test_batching_interpreter_parses_messages_one_by_one_if_batch_fails():
+    class PickyInterpreter(RegexInterpreter):
+        async def parse(self, text, message_id=None, tracker=None):
+            if text == "bad":
+                raise ValueError("bad message")
+            return await super().parse(text, message_id, tracker)
+
+    interpreter = BatchingInterpreter(
+        PickyInterpreter(), max_batch_size=3, max_wait_time_in_ms=1
+    )
+
+    texts = [f"{INTENT_MESSAGE_PREFIX}greet", "bad", f"{INTENT_MESSAGE_PREFIX}goodbye"]
+    parses = [interpreter.parse(text) for text in texts]
+    results = await asyncio.wait_for(
+        asyncio.gather(*parses, return_exceptions=True), timeout=5
+    )
+
+    assert results[0]["intent"][INTENT_NAME_KEY] == "greet"
+    assert isinstance(results[1], ValueError)
+    assert results[2]["intent"][INTENT_NAME_KEY] == "goodbye"
+
+
+async def test_batching_interpreter_resolves_messages_if_results_are_missing():
+    class IncompleteInterpreter(RegexInterpreter):
+        async def parse_batch(self, texts, message_ids=None, tracker=None):
+            results = await super().parse_batch(texts, message_ids, tracker)
+            return results[:1]
+
+    interpreter = BatchingInterpreter(
+        IncompleteInterpreter(), max_batch_size=2, max_wait_time_in_ms=1
+    )
+
+    texts = [f"{INTENT_MESSAGE_PREFIX}greet", f"{INTENT_MESSAGE_PREFIX}goodbye"]
+    parses = [interpreter.parse(text) for text in texts]
+    results = await asyncio.wait_for(asyncio.gather(*parses), timeout=5)
+
+    assert [result["intent"][INTENT_NAME_KEY] for result in results] == [
+        "greet",
+        "goodbye",
+    ]
+
+
+async def test_default_parse_batch_parses_messages_concurrently():
+    class ConcurrencyTrackingInterpreter(NaturalLanguageInterpreter):
+        def __init__(self) -> None:
+            self.running = 0
+            self.max_running = 0
+
+        async def parse(self, text, message_id=None, tracker=None):
+            self.running += 1
+            self.max_running = max(self.running, self.max_running)
+            await asyncio.sleep(0)
+            self.running -= 1
+            return {"text": text}
+
+    interpreter = ConcurrencyTrackingInterpreter()
+
+    results = await interpreter.parse_batch(["a", "b", "c"])
+
+    assert [result["text"] for result in results] == ["a", "b", "c"]
+    assert interpreter.max_running == 3
+
+
+def test_create_batching_interpreter():
+    regex_interpreter = RegexInterpreter()
+
+    assert BatchingInterpreter.create(regex_interpreter, None) is regex_interpreter
+
+    interpreter = BatchingInterpreter.create(
+        regex_interpreter, EndpointConfig(max_batch_size=8, max_wait_time_in_ms=5)
+    )
+    assert isinstance(interpreter, BatchingInterpreter)
+    assert interpreter.interpreter is regex_interpreter
+    assert interpreter.max_batch_size == 8
+    assert interpreter.max_wait_time_in_ms == 5
+
+    # re-wrapping keeps the statistics and doesn't nest interpreters
+    rewrapped = BatchingInterpreter.create(interpreter, EndpointConfig())
+    assert rewrapped.interpreter is regex_interpreter
+    assert rewrapped.statistics is interpreter.statistics
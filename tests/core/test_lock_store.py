@@ -5,7 +5,7 @@ import numpy as np
 import pytest
 import time
 from _pytest.tmpdir import TempdirFactory
-from typing import Text
+from typing import Optional, Text
 from unittest.mock import patch
 
 from rasa.core.agent import Agent
@@ -21,13 +21,12 @@ class FakeRedisLockStore(RedisLockStore):
     def __init__(self):
         import fakeredis
 
-        self.red = fakeredis.FakeStrictRedis()
+        with patch("redis.StrictRedis", fakeredis.FakeStrictRedis):
+            super().__init__()
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
 
-        super(RedisLockStore, self).__init__()
-
 
 def test_issue_ticket():
     lock = TicketLock("random id 0")
@@ -133,6 +132,78 @@ def test_lock_expiration(lock_store: LockStore):
     assert lock.issue_ticket(10) == 1
 
 
+@pytest.mark.parametrize(
+    "lock_store", [InMemoryLockStore(), FakeRedisLockStore()], ids=["memory", "redis"]
+)
+async def test_waiting_task_is_woken_up_on_release(lock_store: LockStore):
+    conversation_id = "my id 3"
+    holdup = 0.05
+
+    async def hold_lock() -> None:
+        async with lock_store.lock(conversation_id):
+            await asyncio.sleep(holdup)
+
+    async def wait_for_lock() -> float:
+        # make sure the other task acquires the lock first
+        await asyncio.sleep(0)
+        async with lock_store.lock(conversation_id, wait_time_in_seconds=10):
+            return time.time()
+
+    start = time.time()
+    _, acquired_at = await asyncio.gather(hold_lock(), wait_for_lock())
+
+    # the waiting task doesn't wait for `wait_time_in_seconds`
+    assert holdup <= acquired_at - start < 1
+    assert lock_store.get_lock(conversation_id) is None
+
+
+async def test_custom_lock_store_without_super_init():
+    class CustomLockStore(LockStore):
+        # doesn't call `super().__init__()`
+        def __init__(self) -> None:
+            self.locks = {}
+
+        def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
+            return self.locks.get(conversation_id)
+
+        def delete_lock(self, conversation_id: Text) -> None:
+            self.locks.pop(conversation_id, None)
+
+        def save_lock(self, lock: TicketLock) -> None:
+            self.locks[lock.conversation_id] = lock
+
+    lock_store = CustomLockStore()
+
+    async with lock_store.lock("some id"):
+        assert lock_store.get_lock("some id")
+
+    assert lock_store.get_lock("some id") is None
+
+
+async def test_redis_lock_store_wakes_up_on_release_by_other_server():
+    conversation_id = "my id 4"
+    waiting_server = FakeRedisLockStore()
+    releasing_server = FakeRedisLockStore()
+    # both servers use the same Redis instance
+    releasing_server.red = waiting_server.red
+
+    ticket = releasing_server.issue_ticket(conversation_id)
+
+    async def release() -> None:
+        await asyncio.sleep(0.05)
+        releasing_server.cleanup(conversation_id, ticket)
+
+    async def wait_for_lock() -> float:
+        async with waiting_server.lock(conversation_id, wait_time_in_seconds=10):
+            return time.time()
+
+    start = time.time()
+    _, acquired_at = await asyncio.gather(release(), wait_for_lock())
+
+    # released lock was announced via pub/sub
+    assert acquired_at - start < 1
+
+
 async def test_multiple_conversation_ids(default_agent: Agent):
     text = INTENT_MESSAGE_PREFIX + 'greet{"name":"Rasa"}'
 
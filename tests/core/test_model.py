@@ -33,6 +33,7 @@ from rasa.model import (
     FINGERPRINT_TRAINED_AT_KEY,
     FINGERPRINT_CONFIG_CORE_KEY,
     FINGERPRINT_CONFIG_NLU_KEY,
+    FINGERPRINT_CACHE_FILE_PATH,
     SECTION_CORE,
     SECTION_NLU,
     create_package_rasa,
@@ -234,6 +235,54 @@ async def test_create_fingerprint_from_invalid_paths(project, project_files):
     assert actual == expected
 
 
+async def test_create_fingerprint_from_cache(project: Text, tmp_path: Path):
+    expected = await model_fingerprint(_project_files(project))
+    del expected[FINGERPRINT_TRAINED_AT_KEY]
+
+    for _ in range(2):
+        actual = await model_fingerprint(
+            _project_files(project), cache_directory=str(tmp_path)
+        )
+        del actual[FINGERPRINT_TRAINED_AT_KEY]
+        assert actual == expected
+
+    assert (tmp_path / FINGERPRINT_CACHE_FILE_PATH).is_file()
+
+    # unchanged training data is not loaded again
+    project_files = _project_files(project)
+    project_files.get_stories = Mock(side_effect=AssertionError)
+    project_files.get_nlu_data = Mock(side_effect=AssertionError)
+
+    actual = await model_fingerprint(project_files, cache_directory=str(tmp_path))
+    del actual[FINGERPRINT_TRAINED_AT_KEY]
+    assert actual == expected
+
+
+async def test_fingerprint_cache_detects_changed_files(project: Text, tmp_path: Path):
+    old_fingerprint = await model_fingerprint(
+        _project_files(project), cache_directory=str(tmp_path)
+    )
+
+    nlu_file = _project_files(project).get_nlu_files()[0]
+    with open(nlu_file, "a") as f:
+        f.write("\n- intent: new_intent\n  examples: |\n    - new example\n")
+
+    new_fingerprint = await model_fingerprint(
+        _project_files(project), cache_directory=str(tmp_path)
+    )
+    uncached_fingerprint = await model_fingerprint(_project_files(project))
+
+    assert (
+        new_fingerprint[FINGERPRINT_NLU_DATA_KEY]
+        == uncached_fingerprint[FINGERPRINT_NLU_DATA_KEY]
+        != old_fingerprint[FINGERPRINT_NLU_DATA_KEY]
+    )
+    assert (
+        new_fingerprint[FINGERPRINT_STORIES_KEY]
+        == old_fingerprint[FINGERPRINT_STORIES_KEY]
+    )
+
+
 @pytest.mark.parametrize("use_fingerprint", [True, False])
 async def test_rasa_packaging(trained_rasa_model, project, use_fingerprint):
     unpacked_model_path = get_model(trained_rasa_model)
@@ -1,3 +1,5 @@
+import json
+from pathlib import Path
 from typing import Type
 from unittest.mock import Mock, patch
 
@@ -17,7 +19,14 @@ from rasa.core.actions.action import (
 from rasa.core.constants import USER_INTENT_RESTART, USER_INTENT_BACK
 from rasa.core.channels.channel import UserMessage
 from rasa.core.domain import Domain
-from rasa.core.events import ActionExecuted, ConversationPaused
+from rasa.core.events import (
+    ActionExecuted,
+    BotUttered,
+    ConversationPaused,
+    FollowupAction,
+    SlotSet,
+    UserUttered,
+)
 from rasa.core.featurizers import (
     BinarySingleStateFeaturizer,
     LabelTokenizerSingleStateFeaturizer,
@@ -551,6 +560,37 @@ class TestMemoizationPolicy(PolicyTestCollection):
         recalled = trained_policy.recall(states, tracker, default_domain)
         assert recalled is not None
 
+    async def test_recall_with_legacy_feature_keys(
+        self, trained_policy, default_domain, tmp_path: Path
+    ):
+        policy = self.create_policy(trained_policy.featurizer, trained_policy.priority)
+        trackers = await train_trackers(default_domain, augmentation_factor=0)
+        (all_states, all_actions) = policy.featurizer.training_states_and_actions(
+            trackers, default_domain
+        )
+
+        # persist a lookup the way models of older versions did
+        policy.feature_key_version = 1
+        policy.lookup = policy._create_lookup_from_states(all_states, all_actions)
+        policy.persist(str(tmp_path))
+        memorized_file = tmp_path / "memorized_turns.json"
+        data = json.loads(memorized_file.read_text())
+        del data["feature_key_version"]
+        memorized_file.write_text(json.dumps(data))
+
+        loaded = policy.__class__.load(str(tmp_path))
+        assert loaded.feature_key_version == 1
+        assert loaded.lookup == policy.lookup
+
+        for tracker, states, actions in zip(trackers, all_states, all_actions):
+            recalled = loaded.recall(states, tracker, default_domain)
+            assert recalled == policy.recall(states, tracker, default_domain)
+
+        # training again creates the lookup with the latest feature keys
+        loaded.train(trackers, default_domain, RegexInterpreter())
+        assert loaded.feature_key_version == MemoizationPolicy.FEATURE_KEY_VERSION
+        assert all(len(key) == 32 for key in loaded.lookup.keys())
+
 
 class TestAugmentedMemoizationPolicy(TestMemoizationPolicy):
     def create_policy(self, featurizer, priority):
@@ -560,6 +600,43 @@ class TestAugmentedMemoizationPolicy(TestMemoizationPolicy):
         p = AugmentedMemoizationPolicy(priority=priority, max_history=max_history)
         return p
 
+    @pytest.mark.parametrize("max_history", [1, 2, 5])
+    def test_states_of_the_past(self, default_domain: Domain, max_history: int):
+        policy = AugmentedMemoizationPolicy(max_history=max_history)
+        events = [ActionExecuted(ACTION_LISTEN_NAME)]
+        for i in range(10):
+            events += [
+                UserUttered("hi", {"name": "greet"}),
+                SlotSet("name", f"name {i % 3}"),
+                ActionExecuted("utter_greet"),
+                BotUttered("hey there"),
+            ]
+            if i % 4 == 0:
+                events.append(FollowupAction("utter_channel"))
+            events.append(ActionExecuted(ACTION_LISTEN_NAME))
+        tracker = DialogueStateTracker.from_events(
+            "sender", events, default_domain.slots
+        )
+
+        # create the trackers of the past one by one
+        expected_states = []
+        mcfly_tracker = policy._back_to_the_future_again(tracker)
+        while mcfly_tracker is not None:
+            states = policy.featurizer.prediction_states(
+                [mcfly_tracker], default_domain
+            )[0]
+            if not expected_states or expected_states[-1] != states:
+                expected_states.append(states)
+            mcfly_tracker = policy._back_to_the_future_again(mcfly_tracker)
+
+        # states which didn't change might be skipped
+        actual_states = []
+        for states in policy._states_of_the_past(tracker, default_domain):
+            if not actual_states or actual_states[-1] != states:
+                actual_states.append(states)
+
+        assert actual_states == expected_states
+
 
 class TestFormPolicy(TestMemoizationPolicy):
     def create_policy(self, featurizer, priority):
@@ -1,4 +1,13 @@
+import logging
+from pathlib import Path
+
+from _pytest.logging import LogCaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
 from rasa.core import run
+from rasa.core.agent import SharedModelDirectory
+from rasa.core.utils import AvailableEndpoints
+from rasa.utils.endpoints import EndpointConfig
 
 CREDENTIALS_FILE = "examples/moodbot/credentials.yml"
 
@@ -40,3 +49,18 @@ def test_create_single_input_channels_by_class_wo_credentials():
 
     assert len(channels) == 1
     assert channels[0].name() == "rest"
+
+
+def test_share_model_between_workers_with_invalid_model_url(
+    tmp_path: Path, monkeypatch: MonkeyPatch, caplog: LogCaptureFixture
+):
+    monkeypatch.setattr(
+        run, "SharedModelDirectory", lambda: SharedModelDirectory(str(tmp_path))
+    )
+    endpoints = AvailableEndpoints(model=EndpointConfig("not-a-url"))
+
+    with caplog.at_level(logging.ERROR):
+        shared_models = run._share_model_between_workers(None, endpoints)
+
+    assert shared_models.latest() is None
+    assert "Could not load model" in caplog.text
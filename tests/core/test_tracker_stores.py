@@ -1,5 +1,9 @@
+import asyncio
+import json
 import logging
 import tempfile
+import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -16,13 +20,14 @@ from sqlalchemy.dialects.sqlite.base import SQLiteDialect
 from sqlalchemy.dialects.oracle.base import OracleDialect
 from sqlalchemy.engine.url import URL
 from typing import Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import rasa.core.tracker_store
 from rasa.core.actions.action import ACTION_LISTEN_NAME, ACTION_SESSION_START_NAME
 from rasa.core.channels.channel import UserMessage
 from rasa.core.constants import POSTGRESQL_SCHEMA
 from rasa.core.domain import Domain
+from rasa.core.exceptions import InconsistentTrackerSnapshot
 from rasa.core.events import (
     SlotSet,
     ActionExecuted,
@@ -31,6 +36,12 @@ from rasa.core.events import (
     SessionStarted,
     BotUttered,
     Event,
+    Form,
+    ActionExecutionRejected,
+    UserUtteranceReverted,
+    ActionReverted,
+    ConversationPaused,
+    ConversationResumed,
 )
 from rasa.core.tracker_store import (
     TrackerStore,
@@ -39,8 +50,9 @@ from rasa.core.tracker_store import (
     SQLTrackerStore,
     DynamoTrackerStore,
     FailSafeTrackerStore,
+    CachedTrackerStore,
 )
-from rasa.core.trackers import DialogueStateTracker
+from rasa.core.trackers import DialogueStateTracker, EventVerbosity
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
 from tests.core.conftest import DEFAULT_ENDPOINTS_FILE, MockedMongoTrackerStore
 
@@ -456,6 +468,137 @@ def test_fail_safe_tracker_store_with_retrieve_error():
     on_error_callback.assert_called_once()
 
 
+async def test_fail_safe_tracker_store_with_async_save_error():
+    failing_tracker_store = InMemoryTrackerStore(domain)
+    failing_tracker_store.save = Mock(side_effect=Exception())
+
+    fallback_tracker_store = InMemoryTrackerStore(domain)
+    on_error_callback = Mock()
+
+    tracker_store = FailSafeTrackerStore(
+        failing_tracker_store, on_error_callback, fallback_tracker_store
+    )
+    tracker = DialogueStateTracker.from_events("some-id", [UserUttered("hi")])
+    await tracker_store.save_async(tracker)
+
+    on_error_callback.assert_called_once()
+    assert fallback_tracker_store.retrieve("some-id") == tracker
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+async def test_async_tracker_store_interface(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    default_domain: Domain,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    sender_id = uuid.uuid4().hex
+
+    tracker = await tracker_store.get_or_create_tracker_async(sender_id)
+    tracker.update(SlotSet("name", "Peter"))
+    await tracker_store.save_async(tracker)
+
+    retrieved = await tracker_store.retrieve_async(sender_id)
+
+    assert retrieved == tracker
+    assert retrieved.get_slot("name") == "Peter"
+    assert sender_id in await tracker_store.keys_async()
+
+
+async def test_async_interface_runs_sync_tracker_store_in_thread():
+    class BlockingTrackerStore(TrackerStore):
+        def __init__(self) -> None:
+            super().__init__(domain)
+            self.saved_in_threads = []
+
+        def save(self, tracker: DialogueStateTracker) -> None:
+            time.sleep(0.1)
+            self.saved_in_threads.append(threading.current_thread())
+
+    tracker_store = BlockingTrackerStore()
+    tracker = DialogueStateTracker.from_events("some-id", [UserUttered("hi")])
+
+    saving = asyncio.ensure_future(tracker_store.save_async(tracker))
+    # the event loop is free to run other coroutines while the store is blocking
+    await asyncio.sleep(0)
+    assert not saving.done()
+    await saving
+
+    assert tracker_store.saved_in_threads
+    assert tracker_store.saved_in_threads[0] is not threading.main_thread()
+
+
+async def test_async_interface_uses_overridden_get_or_create_tracker():
+    class CustomTrackerStore(InMemoryTrackerStore):
+        def get_or_create_tracker(
+            self,
+            sender_id: Text,
+            max_event_history: Optional[int] = None,
+            append_action_listen: bool = True,
+        ) -> DialogueStateTracker:
+            tracker = super().get_or_create_tracker(
+                sender_id, max_event_history, append_action_listen
+            )
+            tracker.update(UserUttered("created by custom store"))
+            return tracker
+
+    tracker_store = CustomTrackerStore(domain)
+
+    tracker = await tracker_store.get_or_create_tracker_async("some-id")
+    assert tracker.latest_message.text == "created by custom store"
+
+    # the built-in tracker stores keep using their `async` methods
+    assert not InMemoryTrackerStore(domain)._overrides_only_sync_method(
+        "get_or_create_tracker"
+    )
+
+
+async def test_events_of_threaded_calls_are_published_from_event_loop_thread():
+    publishing_threads = []
+    event_broker = Mock()
+    event_broker.publish.side_effect = lambda _: publishing_threads.append(
+        threading.current_thread()
+    )
+
+    class SyncTrackerStore(InMemoryTrackerStore):
+        # only the synchronous interface is implemented, as in custom tracker stores
+        save_async = TrackerStore.save_async
+
+    tracker_store = SyncTrackerStore(domain, event_broker)
+    tracker = DialogueStateTracker.from_events("some-id", _conversation_events())
+
+    await tracker_store.save_async(tracker)
+
+    assert len(publishing_threads) == len(tracker.events)
+    assert set(publishing_threads) == {threading.current_thread()}
+    assert tracker_store.retrieve("some-id").events == tracker.events
+
+
+@mock_dynamodb2
+def test_dynamo_tracker_store_uses_table_per_thread():
+    tracker_store = DynamoTrackerStore(domain)
+    tables = {}
+
+    def remember_table(name: Text) -> None:
+        tables[name] = tracker_store.db
+
+    thread = threading.Thread(target=remember_table, args=["other"])
+    thread.start()
+    thread.join()
+    remember_table("main")
+
+    assert tables["main"] is tracker_store.db
+    assert tables["other"] is not tables["main"]
+    assert tables["other"].name == tables["main"].name
+
+
 def test_set_fail_safe_tracker_store_domain(default_domain: Domain):
     tracker_store = InMemoryTrackerStore(domain)
     fallback_tracker_store = InMemoryTrackerStore(None)
@@ -560,6 +703,117 @@ def test_sql_additional_events_with_session_start(default_domain: Domain):
         assert isinstance(additional_events[0], UserUttered)
 
 
+def test_sql_save_without_counting_stored_events(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+    sender_id = uuid.uuid4().hex
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+
+    tracker = tracker_store.retrieve(sender_id)
+    assert tracker.persisted_event_count == 2
+
+    new_events = [BotUttered("hey"), ActionExecuted(ACTION_LISTEN_NAME)]
+    for event in new_events:
+        tracker.update(event)
+
+    with monkeypatch.context() as m:
+        # the store must not query the stored events to find the new ones
+        m.setattr(tracker_store, "_event_query", Mock(side_effect=AssertionError))
+        tracker_store.save(tracker)
+
+    assert tracker.persisted_event_count == 4
+    assert list(tracker_store.retrieve(sender_id).events) == list(tracker.events)
+
+
+def test_sql_tracker_store_round_trips_per_turn(default_domain: Domain):
+    tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+    tracker_store.event_broker = Mock()
+    sender_id = uuid.uuid4().hex
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+
+    statements = []
+    sqlalchemy.event.listen(
+        tracker_store.engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    tracker_store.event_broker.reset_mock()
+
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    new_events = [ActionExecuted("utter_greet"), BotUttered("hey")]
+    for event in new_events:
+        tracker.update(event)
+    tracker_store.save(tracker)
+
+    # one query to retrieve the events and one bulk insert of the new events
+    assert len(statements) == 2
+    assert statements[1].startswith("INSERT INTO events")
+    published = tracker_store.event_broker.publish.call_args_list
+    assert [call[0][0]["event"] for call in published] == [
+        event.type_name for event in new_events
+    ]
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+def test_stream_events_without_retrieving_the_tracker(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    default_domain: Domain,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    tracker_store.event_broker = Mock()
+    sender_id = uuid.uuid4().hex
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+
+    tracker = tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("hey"))
+    tracker_store.event_broker.reset_mock()
+    tracker_store.retrieve = Mock(side_effect=AssertionError)
+
+    tracker_store.save(tracker)
+
+    tracker_store.event_broker.publish.assert_called_once()
+    assert tracker_store.event_broker.publish.call_args[0][0]["event"] == "bot"
+
+
+def test_sql_tracker_store_creates_session_index(default_domain: Domain):
+    tracker_store = SQLTrackerStore(
+        default_domain, host="sqlite:///", create_session_index=True
+    )
+
+    indices = sqlalchemy.inspect(tracker_store.engine).get_indexes("events")
+
+    assert {
+        "name": "ix_events_sender_id_type_name_timestamp",
+        "column_names": ["sender_id", "type_name", "timestamp"],
+        "unique": 0,
+    } in indices
+    assert {
+        "name": "ix_events_sender_id_timestamp",
+        "column_names": ["sender_id", "timestamp"],
+        "unique": 0,
+    } in indices
+    # the indices don't become part of the metadata shared by all stores
+    assert not any(
+        index.name.startswith("ix_events_sender_id_")
+        for index in SQLTrackerStore.SQLEvent.__table__.indexes
+    )
+
+
 @pytest.mark.parametrize(
     "tracker_store_type,tracker_store_kwargs",
     [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
@@ -656,6 +910,138 @@ def test_tracker_store_retrieve_with_events_from_previous_sessions(
     assert len(actual.events) == len(tracker.events)
 
 
+def _conversation_turns() -> List[List[Event]]:
+    return [
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi", {"name": "greet"})],
+        [ActionExecuted("utter_greet"), BotUttered("Hi"), SlotSet("name", "Peter")],
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("book", {"name": "book"})],
+        [
+            ActionExecuted("booking_form"),
+            Form("booking_form"),
+            SlotSet("requested_slot", "location"),
+        ],
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("?", {"name": "ask"})],
+        [ActionExecutionRejected("booking_form"), ActionExecuted("utter_answer")],
+        [UserUtteranceReverted(), ConversationPaused()],
+        [ConversationResumed(), ActionExecuted(ACTION_LISTEN_NAME)],
+        [UserUttered("Berlin", {"name": "inform"}), ActionExecuted("booking_form")],
+        [SlotSet("location", "Berlin"), Form(None), SlotSet("requested_slot", None)],
+        [ActionExecuted("utter_done"), BotUttered("Done", {"buttons": []})],
+        [ActionReverted(), Restarted(), ActionExecuted(ACTION_LISTEN_NAME)],
+    ]
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+def test_tracker_store_retrieve_from_snapshot(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    default_domain: Domain,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    tracker_store.snapshot_interval = 3
+    tracker_store.check_snapshot_consistency = True
+
+    sender_id = uuid.uuid4().hex
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    for turn in _conversation_turns():
+        for event in turn:
+            tracker.update(event)
+        tracker_store.save(tracker)
+
+        # raises if the tracker recreated from the snapshot differs from a replay
+        tracker = tracker_store.retrieve(sender_id)
+        replayed = DialogueStateTracker.from_events(
+            sender_id, list(tracker.events), default_domain.slots
+        )
+
+        assert tracker.current_state(EventVerbosity.ALL) == replayed.current_state(
+            EventVerbosity.ALL
+        )
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs,snapshot_offset",
+    [
+        # the snapshot is taken once the saved events cross a multiple of 5
+        (MockedMongoTrackerStore, {}, 6),
+        (SQLTrackerStore, {"host": "sqlite:///"}, 6),
+        # the snapshot is refreshed with every save
+        (InMemoryTrackerStore, {}, 8),
+    ],
+)
+def test_tracker_store_only_applies_events_after_snapshot(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    snapshot_offset: int,
+    default_domain: Domain,
+    monkeypatch: MonkeyPatch,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    tracker_store.snapshot_interval = 5
+
+    sender_id = uuid.uuid4().hex
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    for turn in _conversation_turns()[:3]:
+        for event in turn:
+            tracker.update(event)
+        tracker_store.save(tracker)
+
+    applied_events = []
+    monkeypatch.setattr(
+        DialogueStateTracker,
+        "update",
+        lambda self, event, domain=None: applied_events.append(event),
+    )
+
+    tracker_store.retrieve(sender_id)
+
+    assert len(tracker.events) == 8
+    assert applied_events == list(tracker.events)[snapshot_offset:]
+
+
+def test_tracker_store_ignores_snapshot_of_other_events(default_domain: Domain):
+    tracker_store = InMemoryTrackerStore(default_domain, snapshot_interval=1)
+    tracker_store.check_snapshot_consistency = True
+
+    sender_id = uuid.uuid4().hex
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    tracker.update(SlotSet("name", "Peter"))
+    tracker_store.save(tracker)
+
+    serialised = json.loads(tracker_store.store[sender_id])
+    serialised["events"] = serialised["events"][1:]
+    tracker_store.store[sender_id] = json.dumps(serialised)
+
+    tracker = tracker_store.retrieve(sender_id)
+
+    assert tracker.get_slot("name") == "Peter"
+    assert len(tracker.events) == 1
+
+
+def test_tracker_store_checks_snapshot_consistency(default_domain: Domain):
+    tracker_store = InMemoryTrackerStore(default_domain, snapshot_interval=1)
+    tracker_store.check_snapshot_consistency = True
+
+    sender_id = uuid.uuid4().hex
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    tracker.update(SlotSet("name", "Peter"))
+    tracker_store.save(tracker)
+
+    serialised = json.loads(tracker_store.store[sender_id])
+    serialised["snapshot"]["slots"]["name"] = "Paul"
+    tracker_store.store[sender_id] = json.dumps(serialised)
+
+    with pytest.raises(InconsistentTrackerSnapshot):
+        tracker_store.retrieve(sender_id)
+
+
 def test_session_scope_error(
     monkeypatch: MonkeyPatch, capsys: CaptureFixture, default_domain: Domain
 ):
@@ -834,3 +1220,407 @@ def test_current_state_without_events(default_domain: Domain):
 
     # `events` key should not be in there
     assert state and "events" not in state
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+def test_retrieve_serialised_events_in_time_range(
+    default_domain: Domain, tracker_store_type: Type[TrackerStore], tracker_store_kwargs
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    tracker_store.load_events_from_previous_conversation_sessions = True
+
+    events = {
+        "first": [
+            UserUttered("hi", timestamp=1),
+            SessionStarted(timestamp=4),
+            BotUttered("hey", timestamp=6),
+        ],
+        "second": [UserUttered("hello", timestamp=2), BotUttered("hey", timestamp=5)],
+        "third": [UserUttered("bye", timestamp=3)],
+    }
+    for sender_id, conversation_events in events.items():
+        tracker_store.save(
+            DialogueStateTracker.from_events(sender_id, conversation_events)
+        )
+
+    retrieved = list(tracker_store.retrieve_serialised_events())
+    assert [(e["sender_id"], e["timestamp"]) for e in retrieved] == [
+        ("first", 1),
+        ("second", 2),
+        ("third", 3),
+        ("first", 4),
+        ("second", 5),
+        ("first", 6),
+    ]
+    assert retrieved[0] == dict(events["first"][0].as_dict(), sender_id="first")
+
+    retrieved = tracker_store.retrieve_serialised_events(
+        ["first", "second"], minimum_timestamp=2, maximum_timestamp=6
+    )
+    assert [(e["sender_id"], e["timestamp"]) for e in retrieved] == [
+        ("second", 2),
+        ("first", 4),
+        ("second", 5),
+    ]
+
+
+def test_retrieve_serialised_events_serialises_lazily(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    tracker_store = InMemoryTrackerStore(default_domain)
+    for sender_id in ["first", "second"]:
+        tracker_store.save(
+            DialogueStateTracker.from_events(
+                sender_id,
+                [UserUttered("hi", timestamp=timestamp) for timestamp in range(1, 101)],
+            )
+        )
+
+    serialised = []
+    as_dict = UserUttered.as_dict
+    monkeypatch.setattr(
+        UserUttered, "as_dict", lambda event: serialised.append(event) or as_dict(event)
+    )
+
+    retrieved = tracker_store.retrieve_serialised_events()
+    assert next(retrieved)["timestamp"] == 1
+    # only the first event of each conversation was serialised for the merge
+    assert len(serialised) == 2
+
+    assert len(list(retrieved)) == 199
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+@pytest.mark.parametrize(
+    "after_timestamp,until_timestamp,limit,expected_timestamps",
+    [
+        (None, None, None, [3, 4, 5, 6]),
+        (3, None, None, [4, 5, 6]),
+        (None, 5, None, [3, 4, 5]),
+        (3, 5, None, [4, 5]),
+        (None, None, 2, [3, 4]),
+        (4, None, 1, [5]),
+    ],
+)
+def test_retrieve_events_in_time_range(
+    default_domain: Domain,
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    after_timestamp: Optional[float],
+    until_timestamp: Optional[float],
+    limit: Optional[int],
+    expected_timestamps: List[float],
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    events = [
+        UserUttered("hi", timestamp=1),
+        ActionExecuted(ACTION_SESSION_START_NAME, timestamp=2),
+        SessionStarted(timestamp=3),
+        UserUttered("hello", timestamp=4),
+        ActionExecuted("utter_greet", timestamp=5),
+        BotUttered("hey", timestamp=6),
+    ]
+    if tracker_store_type is InMemoryTrackerStore:
+        # the in-memory store doesn't restrict its events to the latest session
+        events = events[2:]
+    tracker_store.save(DialogueStateTracker.from_events("some-id", events))
+
+    retrieved = tracker_store.retrieve_events(
+        "some-id", after_timestamp, until_timestamp, limit
+    )
+
+    assert [event.timestamp for event in retrieved] == expected_timestamps
+    assert retrieved == [
+        event for event in events if event.timestamp in expected_timestamps
+    ]
+
+
+async def test_retrieve_events_async_of_unknown_conversation(default_domain: Domain):
+    tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+
+    assert await tracker_store.retrieve_events_async("unknown") == []
+
+
+def _conversation_events() -> List[Event]:
+    return [event for turn in _conversation_turns() for event in turn]
+
+
+@pytest.fixture
+def redis_tracker_store(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+) -> RedisTrackerStore:
+    import fakeredis
+    import redis
+
+    monkeypatch.setattr(redis, "StrictRedis", fakeredis.FakeStrictRedis)
+    tracker_store = RedisTrackerStore(
+        default_domain, use_event_lists=True, record_exp=100
+    )
+    # fake Redis instances with the same host share their data
+    tracker_store.red.flushdb()
+
+    return tracker_store
+
+
+def test_redis_tracker_store_appends_only_new_events(
+    redis_tracker_store: RedisTrackerStore,
+):
+    tracker = redis_tracker_store.get_or_create_tracker("some-id")
+    for event in _conversation_events()[:4]:
+        tracker.update(event)
+    redis_tracker_store.save(tracker)
+
+    tracker = redis_tracker_store.retrieve("some-id")
+    new_events = _conversation_events()[4:]
+    for event in new_events:
+        tracker.update(event)
+
+    with patch.object(
+        redis_tracker_store.red, "pipeline", wraps=redis_tracker_store.red.pipeline
+    ) as pipeline, patch.object(
+        redis_tracker_store.red, "set", side_effect=AssertionError()
+    ), patch.object(
+        redis_tracker_store.red, "llen", side_effect=AssertionError()
+    ):
+        redis_tracker_store.save(tracker)
+
+    # all writes are sent in one round trip
+    pipeline.assert_called_once()
+
+    stored = redis_tracker_store.red.lrange(
+        redis_tracker_store._events_key("some-id"), 0, -1
+    )
+    assert [json.loads(event) for event in stored] == [
+        event.as_dict() for event in tracker.events
+    ]
+    assert redis_tracker_store.retrieve("some-id").events == tracker.events
+    assert redis_tracker_store.red.ttl(redis_tracker_store._events_key("some-id")) > 0
+
+
+def test_redis_tracker_store_stored_version(redis_tracker_store: RedisTrackerStore):
+    tracker = DialogueStateTracker.from_events("some-id", _conversation_events())
+    redis_tracker_store.save(tracker)
+
+    with patch.object(redis_tracker_store.red, "lrange", side_effect=AssertionError()):
+        stored_version = redis_tracker_store.stored_version("some-id")
+
+    assert stored_version == (len(tracker.events), tracker.events[-1].timestamp)
+
+
+def test_redis_tracker_store_migrates_old_format(
+    redis_tracker_store: RedisTrackerStore,
+):
+    tracker = DialogueStateTracker.from_events("some-id", _conversation_events())
+    # store the conversation in the old format
+    redis_tracker_store.use_event_lists = False
+    redis_tracker_store.save(tracker)
+    redis_tracker_store.use_event_lists = True
+
+    assert list(redis_tracker_store.keys()) == ["some-id"]
+
+    retrieved = redis_tracker_store.retrieve("some-id")
+
+    assert retrieved.events == tracker.events
+    assert redis_tracker_store.red.get("some-id") is None
+    assert redis_tracker_store.red.llen(
+        redis_tracker_store._events_key("some-id")
+    ) == len(tracker.events)
+    # the expiry of the old record is kept
+    assert redis_tracker_store.red.ttl(redis_tracker_store._events_key("some-id")) > 0
+    assert list(redis_tracker_store.keys()) == ["some-id"]
+
+
+def test_redis_tracker_store_migrates_all_conversations(
+    redis_tracker_store: RedisTrackerStore,
+):
+    redis_tracker_store.use_event_lists = False
+    for sender_id in ["first", "second"]:
+        redis_tracker_store.save(
+            DialogueStateTracker.from_events(sender_id, _conversation_events())
+        )
+    redis_tracker_store.use_event_lists = True
+    redis_tracker_store.save(
+        DialogueStateTracker.from_events("third", _conversation_events())
+    )
+
+    assert redis_tracker_store.migrate_to_event_lists() == 2
+
+    assert sorted(redis_tracker_store.keys()) == ["first", "second", "third"]
+    assert not list(redis_tracker_store._legacy_keys())
+
+
+def test_redis_tracker_store_keys_uses_scan(redis_tracker_store: RedisTrackerStore):
+    redis_tracker_store.save(DialogueStateTracker.from_events("some-id", []))
+    redis_tracker_store.save(
+        DialogueStateTracker.from_events("another-id", _conversation_events())
+    )
+
+    with patch.object(redis_tracker_store.red, "keys", side_effect=AssertionError()):
+        assert sorted(redis_tracker_store.keys()) == ["another-id", "some-id"]
+
+    assert not redis_tracker_store.retrieve("some-id").events
+
+
+def test_cached_tracker_store_skips_retrieving_saved_tracker(default_domain: Domain):
+    tracker_store = CachedTrackerStore(
+        InMemoryTrackerStore(default_domain), validate=False
+    )
+    tracker = tracker_store.get_or_create_tracker("some-id")
+    for event in _conversation_events():
+        tracker.update(event)
+    tracker_store.save(tracker)
+
+    with patch.object(
+        tracker_store.tracker_store, "retrieve", side_effect=AssertionError()
+    ):
+        assert tracker_store.retrieve("some-id") is tracker
+
+    # the tracker is cached again once it's saved
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker_store.save(tracker)
+    assert tracker_store.retrieve("some-id") is tracker
+
+    assert tracker_store.tracker_store.retrieve("some-id").events == tracker.events
+    assert tracker_store.statistics.as_dict() == {
+        "hits": 2,
+        "misses": 1,
+        "stale": 0,
+        "evictions": 0,
+    }
+
+
+async def test_cached_tracker_store_detects_trackers_updated_elsewhere(
+    default_domain: Domain,
+):
+    shared_tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+    first_server = CachedTrackerStore(shared_tracker_store)
+    second_server = CachedTrackerStore(shared_tracker_store)
+
+    tracker = await first_server.get_or_create_tracker_async("some-id")
+    await first_server.save_async(tracker)
+
+    tracker = await second_server.retrieve_async("some-id")
+    tracker.update(UserUttered("hi", {"name": "greet"}))
+    await second_server.save_async(tracker)
+
+    retrieved = await first_server.retrieve_async("some-id")
+
+    assert retrieved is not tracker
+    assert retrieved.events == tracker.events
+    assert first_server.statistics.stale == 1
+
+
+def test_cached_tracker_store_detects_replaced_trackers_with_same_length(
+    default_domain: Domain,
+):
+    shared_tracker_store = InMemoryTrackerStore(default_domain)
+    first_server = CachedTrackerStore(shared_tracker_store)
+    second_server = CachedTrackerStore(shared_tracker_store)
+
+    first_server.save(
+        DialogueStateTracker.from_events("some-id", [UserUttered("hi", timestamp=1)])
+    )
+    replacement = DialogueStateTracker.from_events(
+        "some-id", [UserUttered("bye", timestamp=2)]
+    )
+    second_server.save(replacement)
+
+    retrieved = first_server.retrieve("some-id")
+
+    assert retrieved.events == replacement.events
+    assert first_server.statistics.stale == 1
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [(InMemoryTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
+)
+def test_stored_version(
+    default_domain: Domain,
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    assert tracker_store.stored_version("some-id") == (0, None)
+
+    tracker = DialogueStateTracker.from_events(
+        "some-id", [UserUttered("hi", timestamp=1), ActionExecuted("a", timestamp=2)]
+    )
+    tracker_store.save(tracker)
+
+    assert tracker_store.stored_version("some-id") == (2, 2)
+
+
+def test_cached_tracker_store_does_not_use_changed_tracker(default_domain: Domain):
+    tracker_store = CachedTrackerStore(
+        InMemoryTrackerStore(default_domain), validate=False
+    )
+    tracker = tracker_store.get_or_create_tracker("some-id")
+
+    # the tracker is changed but not saved
+    tracker.update(UserUttered("hi", {"name": "greet"}))
+
+    retrieved = tracker_store.retrieve("some-id")
+
+    assert retrieved is not tracker
+    assert len(retrieved.events) == len(tracker.events) - 1
+    assert tracker_store.statistics.stale == 1
+
+
+def test_cached_tracker_store_drops_least_recently_saved_and_expired_trackers(
+    default_domain: Domain,
+):
+    tracker_store = CachedTrackerStore(
+        InMemoryTrackerStore(default_domain), max_size=2, ttl=0.05
+    )
+    for sender_id in ["first", "second", "third"]:
+        tracker_store.get_or_create_tracker(sender_id)
+
+    assert len(tracker_store) == 2
+    assert tracker_store.statistics.evictions == 1
+
+    time.sleep(0.1)
+
+    assert tracker_store.retrieve("third")
+    assert tracker_store.statistics.hits == 0
+    assert tracker_store.statistics.stale == 1
+
+
+def test_sql_tracker_store_number_of_existing_events(default_domain: Domain):
+    tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+    tracker = DialogueStateTracker.from_events(
+        "some-id", [SessionStarted(timestamp=1)] + _conversation_events()
+    )
+    tracker_store.save(tracker)
+
+    assert tracker_store.number_of_existing_events("some-id") == len(
+        tracker_store.retrieve("some-id").events
+    )
+    assert tracker_store.number_of_existing_events("unknown") == 0
+
+
+def test_create_cached_tracker_store_from_endpoint_config(default_domain: Domain):
+    endpoint_config = EndpointConfig(type="sql", cache_size=10, validate_cache=False)
+
+    tracker_store = TrackerStore.create(endpoint_config, default_domain)
+
+    assert isinstance(tracker_store, CachedTrackerStore)
+    assert isinstance(tracker_store.tracker_store, SQLTrackerStore)
+    assert tracker_store.max_size == 10
+    assert not tracker_store.validate
+    # the endpoint configuration is left untouched
+    assert endpoint_config.kwargs["cache_size"] == 10
@@ -53,6 +53,7 @@ class MockRedisTrackerStore(RedisTrackerStore):
     def __init__(self, _domain: Domain) -> None:
         self.red = fakeredis.FakeStrictRedis()
         self.record_exp = None
+        self.use_event_lists = False
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
@@ -1044,3 +1045,68 @@ def test_applied_events_with_loop_unhappy_path(
     applied = tracker.applied_events()
 
     assert applied == expected_applied_events
+
+
+def _states_from_prior_trackers(
+    tracker: DialogueStateTracker, domain: Domain
+) -> List[frozenset]:
+    return [
+        frozenset(domain.get_active_states(prior_tracker).items())
+        for prior_tracker in tracker.generate_all_prior_trackers()
+    ]
+
+
+def test_past_states_are_extended_incrementally(default_domain: Domain):
+    tracker = DialogueStateTracker("default", default_domain.slots)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/greet", {"name": "greet", "confidence": 1.0}, []))
+
+    assert list(tracker.past_states(default_domain)) == _states_from_prior_trackers(
+        tracker, default_domain
+    )
+    state_history = tracker._state_history
+
+    tracker.update(ActionExecuted("utter_greet"))
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/goodbye", {"name": "goodbye", "confidence": 1.0}, []))
+
+    # the cached states are extended instead of replaying the whole history
+    assert tracker._state_history is state_history
+    assert list(tracker.past_states(default_domain)) == _states_from_prior_trackers(
+        tracker, default_domain
+    )
+
+
+@pytest.mark.parametrize(
+    "reverting_event", [ActionReverted(), UserUtteranceReverted(), Restarted()]
+)
+def test_past_states_after_reverting_event(
+    default_domain: Domain, reverting_event: Event
+):
+    tracker = DialogueStateTracker("default", default_domain.slots)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/greet", {"name": "greet", "confidence": 1.0}, []))
+    tracker.update(ActionExecuted("utter_greet"))
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/goodbye", {"name": "goodbye", "confidence": 1.0}, []))
+    tracker.update(ActionExecuted("utter_goodbye"))
+    tracker.past_states(default_domain)
+
+    tracker.update(reverting_event)
+
+    assert tracker._state_history is None
+    assert list(tracker.past_states(default_domain)) == _states_from_prior_trackers(
+        tracker, default_domain
+    )
+
+
+def test_past_states_for_different_domains(default_domain: Domain):
+    tracker = DialogueStateTracker("default", default_domain.slots)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/greet", {"name": "greet", "confidence": 1.0}, []))
+
+    tracker.past_states(default_domain)
+    assert list(tracker.past_states(domain)) == _states_from_prior_trackers(
+        tracker, domain
+    )
+    assert tracker._state_history.is_for(domain)
@@ -6,6 +6,7 @@ from typing import Optional, Text, Union, Any
 from pathlib import Path
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 import rasa.core.lock_store
 import rasa.utils.io
@@ -192,6 +193,34 @@ def test_get_number_of_sanic_workers(
         os.environ[ENV_SANIC_WORKERS] = pre_test_value
 
 
+@pytest.mark.parametrize(
+    "workers,env_value,lock_store,expected",
+    [
+        (4, None, "redis", 4),
+        (4, 2, "redis", 4),
+        (1, 3, "redis", 1),
+        (0, 3, "redis", 1),
+        (4, None, "in_memory", 1),
+    ],
+)
+def test_get_number_of_sanic_workers_from_argument(
+    workers: int,
+    env_value: Optional[int],
+    lock_store: Text,
+    expected: int,
+    monkeypatch: MonkeyPatch,
+):
+    if env_value is not None:
+        monkeypatch.setenv(ENV_SANIC_WORKERS, str(env_value))
+    else:
+        monkeypatch.delenv(ENV_SANIC_WORKERS, raising=False)
+
+    assert (
+        utils.number_of_sanic_workers(EndpointConfig(type=lock_store), workers)
+        == expected
+    )
+
+
 @pytest.mark.parametrize(
     "lock_store,expected",
     [
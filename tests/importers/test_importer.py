@@ -154,3 +154,26 @@ async def test_core_only(project: Text):
 
     nlu_data = await actual.get_nlu_data()
     assert nlu_data.is_empty()
+
+
+def test_training_files_of_wrapped_importers(project: Text):
+    config_path = os.path.join(project, DEFAULT_CONFIG_PATH)
+    domain_path = os.path.join(project, DEFAULT_DOMAIN_PATH)
+    default_data_path = os.path.join(project, DEFAULT_DATA_PATH)
+    importer = TrainingDataImporter.load_from_config(
+        config_path, domain_path, training_data_paths=[default_data_path]
+    )
+
+    story_files = importer.get_story_files()
+    nlu_files = importer.get_nlu_files()
+    assert story_files and nlu_files
+
+    assert NluDataImporter(importer).get_story_files() == []
+    assert NluDataImporter(importer).get_nlu_files() == nlu_files
+    assert CoreDataImporter(importer).get_story_files() == story_files
+    assert CoreDataImporter(importer).get_nlu_files() == []
+
+    # files are unknown as soon as one of the importers doesn't read local files
+    combined = CombinedDataImporter([importer, TrainingDataImporter()])
+    assert combined.get_story_files() is None
+    assert combined.get_nlu_files() is None
@@ -1,6 +1,9 @@
+import re
 from typing import Any, Text, Dict, List
+from unittest.mock import Mock
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.nlu.training_data import TrainingData
 from rasa.nlu.constants import ENTITIES
@@ -206,3 +209,31 @@ def test_do_not_overwrite_any_entities():
             "extractor": "RegexEntityExtractor",
         },
     ]
+
+
+def test_process_with_many_regexes(monkeypatch: MonkeyPatch):
+    compile_regex = Mock(wraps=re.compile)
+    monkeypatch.setattr(re, "compile", compile_regex)
+
+    def number_of_compiled_patterns() -> int:
+        return sum("code" in str(call[0][0]) for call in compile_regex.call_args_list)
+
+    patterns = [
+        {"name": f"code_{i}", "pattern": f"\\bcode{i}-[0-9]{{3}}\\b"}
+        for i in range(1000)
+    ]
+    entity_extractor = RegexEntityExtractor({"case_sensitive": False}, patterns)
+    message = Message("Please look up the orders CODE42-123 and code999-456.")
+
+    assert number_of_compiled_patterns() == len(patterns)
+
+    for _ in range(100):
+        message.set(ENTITIES, [])
+        entity_extractor.process(message)
+
+    assert [entity["value"] for entity in message.get(ENTITIES)] == [
+        "CODE42-123",
+        "code999-456",
+    ]
+    # the regexes used to be compiled again for every message
+    assert number_of_compiled_patterns() == len(patterns)
@@ -73,3 +73,24 @@ def test_create_interpreter(parameters, trained_nlu_model):
     interpreter = NaturalLanguageInterpreter.create(parameters["endpoint"] or obj)
 
     assert isinstance(interpreter, parameters["type"])
+
+
+async def test_parse_batch_matches_parse(trained_nlu_model):
+    _, nlu_model_directory = get_model_subdirectories(get_model(trained_nlu_model))
+    interpreter = RasaNLUInterpreter(nlu_model_directory)
+
+    texts = ["hello", "", "I am looking for a mexican restaurant", "bye"]
+    batch_results = await interpreter.parse_batch(texts)
+
+    assert len(batch_results) == len(texts)
+    for text, batch_result in zip(texts, batch_results):
+        single_result = await interpreter.parse(text)
+
+        assert batch_result["text"] == text
+        assert batch_result["intent"]["name"] == single_result["intent"]["name"]
+        assert batch_result["intent"]["confidence"] == pytest.approx(
+            single_result["intent"]["confidence"], abs=1e-5
+        )
+        assert [e["value"] for e in batch_result["entities"]] == [
+            e["value"] for e in single_result["entities"]
+        ]
@@ -1,3 +1,4 @@
+import re
 from typing import Dict, List, Text
 
 import pytest
@@ -13,7 +14,7 @@ from rasa.nlu.training_data import TrainingData
         (
             {"name": "person", "elements": ["Max", "John"]},
             {},
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [{"name": "person", "elements": ["Max", "John"]}],
         ),
         ({}, {}, []),
         (
@@ -26,7 +27,7 @@ from rasa.nlu.training_data import TrainingData
             {"name": "zipcode", "pattern": "[0-9]{5}"},
             [
                 {"name": "zipcode", "pattern": "[0-9]{5}"},
-                {"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"},
+                {"name": "person", "elements": ["Max", "John"]},
             ],
         ),
         (
@@ -36,7 +37,13 @@ from rasa.nlu.training_data import TrainingData
                 {"name": "zipcode", "pattern": "[0-9]{5}"},
                 {
                     "name": "plates",
-                    "pattern": "(\\btacos\\b|\\bbeef\\b|\\bmapo\\ tofu\\b|\\bburrito\\b|\\blettuce\\ wrap\\b)",
+                    "elements": [
+                        "tacos",
+                        "beef",
+                        "mapo tofu",
+                        "burrito",
+                        "lettuce wrap",
+                    ],
                 },
             ],
         ),
@@ -95,7 +102,7 @@ def test_extract_patterns_use_only_entities_regexes(
         (
             "person",
             {"name": "person", "elements": ["Max", "John"]},
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [{"name": "person", "elements": ["Max", "John"]}],
         ),
         ("entity", {"name": "person", "elements": ["Max", "John"]}, []),
     ],
@@ -136,7 +143,7 @@ def test_extract_patterns_use_only_entities_lookup_tables(
             {"name": "zipcode", "pattern": "[0-9]{5}"},
             True,
             False,
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [{"name": "person", "elements": ["Max", "John"]}],
         ),
         (
             {"name": "person", "elements": ["Max", "John"]},
@@ -167,3 +174,51 @@ def test_extract_patterns_use_only_lookup_tables_or_regex_features(
     )
 
     assert actual_patterns == expected_patterns
+
+
+def _lookup_regex(elements: List[Text]) -> Text:
+    # the regex which was used to match lookup tables before
+    return "(\\b" + "\\b|\\b".join(re.escape(e) for e in elements) + "\\b)"
+
+
+@pytest.mark.parametrize(
+    "elements, text",
+    [
+        (["Berlin", "New York", "York"], "From New York to Berlin and York."),
+        (["New", "New York"], "New York is new."),
+        (["New York", "New"], "New York is new."),
+        (["tea", "club?mate", "+1"], "tea, club?mate +1 or a+1 and steam"),
+        (["mapo tofu", "tofu"], "mapo  tofu, mapo tofu and tofus"),
+        (["Straße", "ΣΟΦΙΑ"], "STRASSE straße Straße σοφια ΣΟΦΙΑ"),
+        (["snake_case", "case"], "snake_case case_ case"),
+        ([], "nothing to find"),
+    ],
+)
+@pytest.mark.parametrize("case_sensitive", [True, False])
+def test_lookup_table_matcher_matches_like_regex(
+    elements: List[Text], text: Text, case_sensitive: bool
+):
+    matcher = pattern_utils.LookupTableMatcher(elements, case_sensitive)
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    expected = (
+        [match.span() for match in re.finditer(_lookup_regex(elements), text, flags)]
+        if elements
+        else []
+    )
+
+    assert matcher.find(text) == expected
+
+
+def test_compile_patterns():
+    patterns = [
+        {"name": "zipcode", "pattern": "[0-9]{5}"},
+        {"name": "city", "elements": ["Berlin", "Hamburg"]},
+    ]
+    matchers = pattern_utils.compile_patterns(patterns, case_sensitive=False)
+    text = "10115 berlin or 20095 Hamburg"
+
+    assert isinstance(matchers[0], pattern_utils.RegexMatcher)
+    assert matchers[0].find(text) == [(0, 5), (16, 21)]
+    assert isinstance(matchers[1], pattern_utils.LookupTableMatcher)
+    assert matchers[1].find(text) == [(6, 12), (22, 29)]
@@ -7,10 +7,11 @@ import time
 import tempfile
 import uuid
 
-from typing import List, Text, Type, Generator, NoReturn, Dict
+from typing import Any, List, Text, Type, Generator, NoReturn, Dict
 from contextlib import ExitStack
 
 from _pytest import pathlib
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 
 import pytest
@@ -26,7 +27,8 @@ from rasa.core import events, utils
 from rasa.core.agent import Agent
 from rasa.core.channels import CollectingOutputChannel, RestInput, SlackInput
 from rasa.core.channels.slack import SlackBot
-from rasa.core.events import Event, UserUttered, SlotSet, BotUttered
+from rasa.core.events import Event, UserUttered, SlotSet, BotUttered, ActionExecuted
+from rasa.core.interpreter import BatchingInterpreter, RasaNLUHttpInterpreter
 from rasa.core.trackers import DialogueStateTracker
 from rasa.model import unpack_model
 from rasa.nlu.constants import INTENT_NAME_KEY
@@ -141,6 +143,17 @@ def test_status_not_ready_agent(rasa_app: SanicTestClient):
     assert response.status == 409
 
 
+def test_endpoint_statistics_of_batching_interpreter():
+    agent = Agent()
+    agent.interpreter = BatchingInterpreter(
+        RasaNLUHttpInterpreter(endpoint_config=EndpointConfig("https://nlu.example"))
+    )
+
+    statistics = rasa.server._endpoint_statistics(agent)
+
+    assert "nlu" in statistics
+
+
 @pytest.fixture
 def shared_statuses() -> DictProxy:
     return Manager().dict()
@@ -342,6 +355,39 @@ def test_parse_with_different_emulation_mode(
     assert response.status == 200
 
 
+def test_parse_batch(rasa_app: SanicTestClient):
+    texts = ["hello", "/greet", "hello ńöñàśçií"]
+    _, response = rasa_app.post("/model/parse/batch", json={"texts": texts})
+    assert response.status == 200
+
+    rjs = response.json
+    assert len(rjs) == len(texts)
+    assert all(prop in r for r in rjs for prop in ["entities", "intent", "text"])
+    assert [r["intent"][INTENT_NAME_KEY] for r in rjs] == ["greet"] * len(texts)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{"text": "hello"}, ["hello"], "hello", {"texts": ["hello", 1]}, {"texts": "hi"}],
+)
+def test_parse_batch_without_texts(rasa_app: SanicTestClient, payload: Any):
+    _, response = rasa_app.post("/model/parse/batch", json=payload)
+    assert response.status == 400
+
+
+def test_parse_batch_with_parsing_error(
+    rasa_app: SanicTestClient, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setattr(
+        rasa_app.app.agent,
+        "parse_messages_using_nlu_interpreter",
+        Mock(side_effect=ValueError()),
+    )
+
+    _, response = rasa_app.post("/model/parse/batch", json={"texts": ["hello"]})
+    assert response.status == 400
+
+
 def test_parse_without_nlu_model(rasa_app_core: SanicTestClient):
     _, response = rasa_app_core.post("/model/parse", json={"text": "hello"})
     assert response.status == 200
@@ -844,6 +890,31 @@ def test_pushing_event(rasa_app: SanicTestClient, event: Event):
     assert deserialised_event.timestamp > time_before_adding_events
 
 
+def test_retrieve_tracker_until(rasa_app: SanicTestClient):
+    conversation_id = str(uuid.uuid1())
+
+    events = [
+        UserUttered("hi", timestamp=1).as_dict(),
+        ActionExecuted("utter_greet", timestamp=2).as_dict(),
+        BotUttered("hey", timestamp=3).as_dict(),
+    ]
+    _, response = rasa_app.post(
+        f"/conversations/{conversation_id}/tracker/events",
+        json=events,
+        headers={"Content-Type": rasa.server.JSON_CONTENT_TYPE},
+    )
+    assert response.status == 200
+
+    _, tracker_response = rasa_app.get(
+        f"/conversations/{conversation_id}/tracker?until=2"
+    )
+    tracker = tracker_response.json
+
+    assert tracker["sender_id"] == conversation_id
+    assert [event["timestamp"] for event in tracker["events"]] == [1, 2]
+    assert tracker["latest_action_name"] == "utter_greet"
+
+
 def test_push_multiple_events(rasa_app: SanicTestClient):
     conversation_id = str(uuid.uuid1())
     conversation = f"/conversations/{conversation_id}"
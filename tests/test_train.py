@@ -3,7 +3,7 @@ import sys
 import tempfile
 import os
 from pathlib import Path
-from typing import Text, Dict
+from typing import Any, Text, Dict
 from unittest.mock import Mock
 
 import pytest
@@ -13,6 +13,7 @@ from _pytest.monkeypatch import MonkeyPatch
 import rasa.model
 import rasa.core
 from rasa.core.interpreter import RasaNLUInterpreter
+from rasa.importers.rasa import RasaFileImporter
 
 from rasa.train import train_core, train_nlu, train
 from tests.conftest import DEFAULT_CONFIG_PATH
@@ -238,6 +239,43 @@ def test_interpreter_of_old_model_passed_to_core_training(
     assert isinstance(kwargs["interpreter"], RasaNLUInterpreter)
 
 
+def test_train_does_not_load_training_data_if_nothing_changed(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    old_model = str(tmp_path / "old_model.tar.gz")
+    monkeypatch.setattr(
+        rasa.model, rasa.model.get_latest_model.__name__, lambda _: old_model
+    )
+
+    async def model_fingerprint(*args: Any, **kwargs: Any) -> Dict:
+        return {}
+
+    monkeypatch.setattr(rasa.model, "model_fingerprint", model_fingerprint)
+    monkeypatch.setattr(
+        rasa.model,
+        rasa.model.should_retrain.__name__,
+        lambda *_: rasa.model.FingerprintComparisonResult(
+            core=False, nlu=False, nlg=False
+        ),
+    )
+
+    get_stories = Mock()
+    get_nlu_data = Mock()
+    monkeypatch.setattr(RasaFileImporter, "get_stories", get_stories)
+    monkeypatch.setattr(RasaFileImporter, "get_nlu_data", get_nlu_data)
+
+    result = train(
+        DEFAULT_DOMAIN_PATH_WITH_SLOTS,
+        DEFAULT_CONFIG_PATH,
+        [DEFAULT_STORIES_FILE, DEFAULT_NLU_DATA],
+        str(tmp_path),
+    )
+
+    assert result == old_model
+    get_stories.assert_not_called()
+    get_nlu_data.assert_not_called()
+
+
 def test_load_interpreter_returns_none_for_none():
     from rasa.train import _load_interpreter
 
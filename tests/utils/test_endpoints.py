@@ -1,6 +1,10 @@
+import asyncio
 import logging
 
+import aiohttp
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from aioresponses import aioresponses
 
 from tests.utilities import latest_request, json_of_latest_request
@@ -120,3 +124,82 @@ async def test_request_non_json_response():
         response = await endpoint.request("post", subpath="test")
 
         assert not response
+
+
+async def test_requests_reuse_pooled_connections():
+    async def handle(_: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/test", handle)
+
+    async with TestServer(app) as server:
+        endpoint = endpoint_utils.EndpointConfig(str(server.make_url("/")))
+
+        for _ in range(3):
+            assert await endpoint.request("post", subpath="test") == {"ok": True}
+
+        await endpoint.close_session()
+
+    statistics = endpoint.statistics.as_dict()
+    assert statistics["requests"] == 3
+    assert statistics["failed_requests"] == 0
+    assert statistics["new_connections"] == 1
+    assert statistics["reused_connections"] == 2
+    assert statistics["average_request_time_in_ms"] > 0
+
+
+async def test_pooled_session_is_shared_until_closed():
+    endpoint = endpoint_utils.EndpointConfig(
+        "https://example.com/", pool_size=10, pool_size_per_host=2, keepalive_timeout=5
+    )
+
+    session = endpoint.pooled_session()
+    assert endpoint.pooled_session() is session
+    assert session.connector.limit == 10
+    assert session.connector.limit_per_host == 2
+
+    await endpoint.close_session()
+
+    assert session.closed
+    assert endpoint.pooled_session() is not session
+
+    await endpoint.close_session()
+
+
+@pytest.mark.parametrize("close_previous_loop", [True, False])
+def test_pooled_session_of_previous_event_loop_is_closed(close_previous_loop: bool):
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+
+    async def use_session() -> aiohttp.ClientSession:
+        session = endpoint.pooled_session()
+        await asyncio.sleep(0)
+        return session
+
+    previous_loop = asyncio.new_event_loop()
+    stale_session = previous_loop.run_until_complete(use_session())
+    if close_previous_loop:
+        previous_loop.close()
+
+    loop = asyncio.new_event_loop()
+    session = loop.run_until_complete(use_session())
+
+    assert session is not stale_session
+    assert stale_session.closed
+
+    loop.run_until_complete(endpoint.close_session())
+    loop.close()
+    previous_loop.close()
+
+
+async def test_endpoint_config_keeps_connection_pool_parameters():
+    kwargs = {"pool_size": 5, "keepalive_timeout": 30, "db": 0}
+    endpoint = endpoint_utils.EndpointConfig.from_dict({"url": "http://test", **kwargs})
+
+    # custom tracker stores etc. might use the same argument names
+    assert endpoint.kwargs == kwargs
+    assert endpoint.copy().kwargs == kwargs
+
+    assert endpoint.pooled_session().connector.limit == 5
+
+    await endpoint.close_session()